@@ -0,0 +1,70 @@
+"""
+Cold-start benchmark: wall time from interpreter start until the gateway answers its first request.
+
+Each run is a fresh interpreter that imports the app, builds it and serves GET /metrics through the test
+client (which builds Connexion's routes but runs no lifespan, so no upstream is contacted). Runs are
+made with a cold specification cache (removed before every run) and with a warm one.
+
+Usage:
+    python benchmarks/startup_benchmark.py [--mode sync|async] [--runs 5]
+"""
+import argparse
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+CHILD = """
+import time, sys
+started = float(sys.argv[1])
+from edge_cloud_management_api.app import get_app_instance
+imported = time.time()
+client = get_app_instance(sys.argv[2]).test_client()
+assert client.get("/metrics").status_code == 200
+print(imported - started, time.time() - started)
+"""
+
+
+def run_once(mode: str, cache_dir: str) -> tuple[float, float]:
+    env = {"PYTHONPATH": str(ROOT), "SPEC_CACHE_DIR": cache_dir, "PATH": ""}
+    output = subprocess.run(
+        [sys.executable, "-W", "ignore", "-c", CHILD, repr(time.time()), mode],
+        cwd=ROOT, env=env, capture_output=True, text=True, check=True,
+    ).stdout
+    imported, ready = map(float, output.split())
+    return imported, ready
+
+
+def report(label: str, samples: list):
+    imports = [imported for imported, _ in samples]
+    ready = [ready for _, ready in samples]
+    print(f"{label:<12} imports {statistics.median(imports) * 1000:7.1f} ms   ready {statistics.median(ready) * 1000:7.1f} ms   (median of {len(samples)})")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--mode", default="sync", choices=("sync", "async"))
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    cache_dir = tempfile.mkdtemp(prefix="oeg-spec-cache-")
+    try:
+        cold = []
+        for _ in range(args.runs):
+            shutil.rmtree(cache_dir, ignore_errors=True)
+            cold.append(run_once(args.mode, cache_dir))
+        warm = [run_once(args.mode, cache_dir) for _ in range(args.runs)]
+    finally:
+        shutil.rmtree(cache_dir, ignore_errors=True)
+
+    report("cold cache", cold)
+    report("warm cache", warm)
+
+
+if __name__ == "__main__":
+    main()
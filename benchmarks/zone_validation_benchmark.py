@@ -0,0 +1,80 @@
+"""
+Zone validation micro-benchmark: cost of validating and encoding a zone list of the given size.
+
+Compares the per-zone model validation the zone catalog used to do (`EdgeCloudZone(**zone).model_dump()`
+for every zone, then encoding the dicts) with one call of a cached `list[EdgeCloudZone]` TypeAdapter
+that validates and dumps to Python and to JSON bytes, and with the validated snapshot reused for an
+unchanged zone list.
+
+Usage:
+    python benchmarks/zone_validation_benchmark.py [--zones 10000] [--runs 20]
+"""
+import argparse
+import statistics
+import sys
+import time
+import uuid
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from edge_cloud_management_api.controllers.edge_cloud_controller import EdgeCloudZone  # noqa: E402
+from edge_cloud_management_api.managers.json_manager import dumpb  # noqa: E402
+from edge_cloud_management_api.managers.validation_manager import ValidatedSnapshot, type_adapter  # noqa: E402
+
+STATUSES = ("active", "inactive", "unknown")
+
+
+def make_zones(count: int) -> list[dict]:
+    return [
+        {
+            "edgeCloudZoneId": str(uuid.uuid4()),
+            "edgeCloudZoneName": f"zone-{i}",
+            "edgeCloudZoneStatus": STATUSES[i % 3],
+            "edgeCloudProvider": f"provider-{i % 7}",
+            "edgeCloudRegion": f"region-{i % 11}",
+            "isLocal": "true",
+        }
+        for i in range(count)
+    ]
+
+
+def per_model(zones: list[dict]):
+    dumpb([EdgeCloudZone(**zone).model_dump() for zone in zones])
+
+
+def type_adapter_batch(zones: list[dict]):
+    adapter = type_adapter(list[EdgeCloudZone])
+    validated = adapter.validate_python(zones)
+    adapter.dump_python(validated)
+    adapter.dump_json(validated)
+
+
+def measure(label: str, fn, runs: int):
+    samples = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - started)
+    print(f"{label:<26} {statistics.median(samples) * 1000:8.2f} ms   (median of {runs})")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--zones", type=int, default=10_000)
+    parser.add_argument("--runs", type=int, default=20)
+    args = parser.parse_args()
+
+    zones = make_zones(args.zones)
+    snapshot = ValidatedSnapshot(list[EdgeCloudZone])
+    snapshot.update(zones)
+    unchanged = [dict(zone) for zone in zones]
+
+    print(f"{args.zones} zones")
+    measure("per-model validation", lambda: per_model(zones), args.runs)
+    measure("TypeAdapter batch", lambda: type_adapter_batch(zones), args.runs)
+    measure("snapshot, unchanged list", lambda: snapshot.update(unchanged), args.runs)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,16 +1,120 @@
+from contextlib import asynccontextmanager
 from pathlib import Path
-from connexion import FlaskApp
+from a2wsgi import WSGIMiddleware
+from connexion import AsyncApp, FlaskApp
+from connexion.middleware import MiddlewarePosition
 from connexion.options import SwaggerUIOptions
+from connexion.resolver import Resolver
+from edge_cloud_management_api.configs.env_config import config
+from edge_cloud_management_api.controllers import metrics_controller
+from edge_cloud_management_api.controllers.aio import metrics_controller as async_metrics_controller
+from edge_cloud_management_api.managers.json_manager import GatewayJSONProvider, GatewayJsonifier
+from edge_cloud_management_api.managers.metrics_manager import RequestMetricsMiddleware
+from edge_cloud_management_api.managers.spec_manager import load_specification
+from edge_cloud_management_api.managers.trace_manager import RequestTracingMiddleware
+from edge_cloud_management_api.services.client_registry import registry, SYNC_CLIENTS, ASYNC_CLIENTS
+from edge_cloud_management_api.services.job_engine import job_engine
+from edge_cloud_management_api.services.partner_deployment import PARTNER_DEPLOYMENT  # noqa: F401 registers the job kind
+from edge_cloud_management_api.services.storage_service import create_indexes
+from edge_cloud_management_api.services.zone_reconciler import zone_reconciler
 
+CONTROLLERS_PACKAGE = "edge_cloud_management_api.controllers."
+ASYNC_CONTROLLERS_PACKAGE = "edge_cloud_management_api.controllers.aio."
 
-def get_app_instance() -> FlaskApp:
+
+class AsyncControllerResolver(Resolver):
+    """
+    Resolves the operationIds of the specification to the coroutine handlers in controllers.aio.
+    """
+
+    def resolve_function_from_operation_id(self, operation_id):
+        if operation_id.startswith(CONTROLLERS_PACKAGE):
+            operation_id = ASYNC_CONTROLLERS_PACKAGE + operation_id[len(CONTROLLERS_PACKAGE):]
+        return super().resolve_function_from_operation_id(operation_id)
+
+
+@asynccontextmanager
+async def lifespan(app):
+    """
+    Builds the shared upstream clients and starts the zone reconciler and the job workers at worker
+    startup, and stops/releases them at shutdown.
+    """
+    registry.warm_up(SYNC_CLIENTS)
+    create_indexes()
+    zone_reconciler.start()
+    job_engine.start(sweep=True)
+    yield
+    job_engine.stop()
+    zone_reconciler.stop()
+    registry.close()
+
+
+@asynccontextmanager
+async def async_lifespan(app):
+    """
+    Builds the shared asyncio upstream clients and starts the zone reconciler and the job workers at
+    worker startup, and stops/releases them at shutdown.
+    """
+    registry.warm_up(ASYNC_CLIENTS)
+    create_indexes()
+    zone_reconciler.start()
+    job_engine.start(sweep=True)
+    yield
+    job_engine.stop()
+    zone_reconciler.stop()
+    await registry.aclose()
+
+
+def size_wsgi_thread_pool(app: FlaskApp, threads: int):
+    """
+    Sizes the a2wsgi thread pool the Flask handlers of `app` run on.
+
+    Connexion 3.1 wraps the Flask app in a2wsgi's WSGIMiddleware with its default 10 threads and has no
+    setting for it, so the middleware is replaced on FlaskApp's private `_middleware_app`. Connexion is
+    pinned below 3.2 because of this; tests/unit/test_app.py fails if the attribute changes shape.
+    """
+    middleware_app = getattr(app, "_middleware_app", None)
+    current = getattr(middleware_app, "asgi_app", None)
+    if not isinstance(current, WSGIMiddleware):
+        raise RuntimeError("Connexion no longer exposes its WSGI middleware, the handler thread pool cannot be sized")
+    current.executor.shutdown(wait=False)
+    middleware_app.asgi_app = WSGIMiddleware(current.app, workers=threads)
+
+
+def get_app_instance(mode: str | None = None) -> FlaskApp | AsyncApp:
+    """
+    Builds the gateway application.
+
+    :param mode: "sync" for the Flask/WSGI handlers (default) or "async" for the asyncio handlers
+        served natively by Connexion's AsyncApp. Defaults to the APP_MODE setting.
+
+    Building the app makes no network calls: upstream clients are built and background work is started
+    by the lifespan, and controllers are imported when Connexion builds its routes on the first event.
+    """
+    mode = mode or config.APP_MODE
     file_path = Path(__file__).resolve().parent
     swagger_options = SwaggerUIOptions(swagger_ui_path="/docs")
-    app = FlaskApp(__name__, specification_dir=file_path / "specification")
+    if mode == "async":
+        app = AsyncApp(__name__, specification_dir=file_path / "specification", lifespan=async_lifespan)
+        resolver = AsyncControllerResolver()
+        app.add_url_rule("/metrics", "metrics", async_metrics_controller.get_metrics, methods=["GET"])
+    elif mode == "sync":
+        app = FlaskApp(__name__, specification_dir=file_path / "specification", lifespan=lifespan)
+        resolver = Resolver()
+        size_wsgi_thread_pool(app, config.SERVER_THREADS)
+        app.app.json = GatewayJSONProvider(app.app)
+        app.add_url_rule("/metrics", "metrics", metrics_controller.get_metrics)
+    else:
+        raise ValueError(f"Unknown APP_MODE '{mode}', expected 'sync' or 'async'")
+    # After routing, so that requests are labelled (and spans named) with their operationId
+    app.add_middleware(RequestTracingMiddleware, position=MiddlewarePosition.BEFORE_SECURITY)
+    app.add_middleware(RequestMetricsMiddleware, position=MiddlewarePosition.BEFORE_SECURITY)
     app.add_api(
-        "openapi.yaml",
+        load_specification(file_path / "specification" / "openapi.yaml"),
         swagger_ui_options=swagger_options,
         strict_validation=False,
+        resolver=resolver,
+        jsonifier=GatewayJsonifier(),
     )
     return app
 
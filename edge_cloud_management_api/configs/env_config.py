@@ -6,14 +6,68 @@ load_dotenv()
 
 
 class Configuration(BaseSettings):
+    APP_MODE: str = os.getenv("APP_MODE", "sync")
+    SERVER_HOST: str = os.getenv("SERVER_HOST", "0.0.0.0")
+    SERVER_PORT: int = int(os.getenv("SERVER_PORT", "8080"))
+    SERVER_WORKERS: int = int(os.getenv("SERVER_WORKERS", "1"))
+    SERVER_THREADS: int = int(os.getenv("SERVER_THREADS", "10"))
+    SERVER_KEEPALIVE: int = int(os.getenv("SERVER_KEEPALIVE", "5"))
+    SERVER_BACKLOG: int = int(os.getenv("SERVER_BACKLOG", "2048"))
+    SERVER_GRACEFUL_TIMEOUT: int = int(os.getenv("SERVER_GRACEFUL_TIMEOUT", "30"))
+    SERVER_WORKER_TIMEOUT: int = int(os.getenv("SERVER_WORKER_TIMEOUT", "60"))
+    SERVER_MAX_REQUESTS: int = int(os.getenv("SERVER_MAX_REQUESTS", "0"))
     MONGO_URI: str = os.getenv("MONGO_URI", "mongodb://localhost:27017")
+    MONGO_MAX_POOL_SIZE: int = int(os.getenv("MONGO_MAX_POOL_SIZE", "50"))
+    MONGO_MIN_POOL_SIZE: int = int(os.getenv("MONGO_MIN_POOL_SIZE", "0"))
+    MONGO_MAX_IDLE_TIME_MS: int = int(os.getenv("MONGO_MAX_IDLE_TIME_MS", "300000"))
+    MONGO_SERVER_SELECTION_TIMEOUT_MS: int = int(os.getenv("MONGO_SERVER_SELECTION_TIMEOUT_MS", "5000"))
+    MONGO_CONNECT_TIMEOUT_MS: int = int(os.getenv("MONGO_CONNECT_TIMEOUT_MS", "5000"))
+    MONGO_SOCKET_TIMEOUT_MS: int = int(os.getenv("MONGO_SOCKET_TIMEOUT_MS", "20000"))
     SRM_HOST: str = os.getenv("SRM_HOST", "http://localhost:8989")
     PI_EDGE_USERNAME: str = os.getenv("PI_EDGE_USERNAME", "admin")
     PI_EDGE_PASSWORD: str = os.getenv("PI_EDGE_PASSWORD", "password")
     HTTP_PROXY: str = os.getenv("HTTP_PROXY", "")
     FEDERATION_MANAGER_HOST: str = os.getenv("FEDERATION_MANAGER_HOST", "http://localhost:8989")
     TOKEN_ENDPOINT: str = os.getenv('TOKEN_ENDPOINT', "http://localhost:8081/token")
+    TOKEN_CLIENT_ID: str = os.getenv("TOKEN_CLIENT_ID", "")
+    TOKEN_CLIENT_SECRET: str = os.getenv("TOKEN_CLIENT_SECRET", "")
+    TOKEN_SCOPE: str = os.getenv("TOKEN_SCOPE", "fed-mgmt")
+    TOKEN_REFRESH_MARGIN: float = float(os.getenv("TOKEN_REFRESH_MARGIN", "30"))
+    TOKEN_REQUEST_TIMEOUT: float = float(os.getenv("TOKEN_REQUEST_TIMEOUT", "10"))
+    JWT_ISSUER: str | None = os.getenv("JWT_ISSUER")
+    JWT_PUBLIC_KEY: str | None = os.getenv("JWT_PUBLIC_KEY")
+    JWT_JWKS_URL: str = os.getenv("JWT_JWKS_URL", "")
+    JWT_CACHE_SIZE: int = int(os.getenv("JWT_CACHE_SIZE", "1024"))
     PARTNER_API_ROOT: str = os.getenv('PARTNER_API_ROOT', "http://localhost:8080")
+    JOB_WORKERS: int = int(os.getenv("JOB_WORKERS", "4"))
+    JOB_LEASE_SECONDS: float = float(os.getenv("JOB_LEASE_SECONDS", "120"))
+    FANOUT_MAX_WORKERS: int = int(os.getenv("FANOUT_MAX_WORKERS", "8"))
+    FANOUT_DEADLINE: float = float(os.getenv("FANOUT_DEADLINE", "30"))
+    PARTNER_CALL_TIMEOUT: float = float(os.getenv("PARTNER_CALL_TIMEOUT", "10"))
+    HTTP_POOL_CONNECTIONS: int = int(os.getenv("HTTP_POOL_CONNECTIONS", "10"))
+    HTTP_POOL_MAXSIZE: int = int(os.getenv("HTTP_POOL_MAXSIZE", "50"))
+    HTTP_POOL_BLOCK: bool = os.getenv("HTTP_POOL_BLOCK", "false").lower() == "true"
+    SRM_CONNECT_TIMEOUT: float = float(os.getenv("SRM_CONNECT_TIMEOUT", "3.05"))
+    SRM_READ_TIMEOUT: float = float(os.getenv("SRM_READ_TIMEOUT", "30"))
+    BREAKER_FAILURE_RATE: float = float(os.getenv("BREAKER_FAILURE_RATE", "0.5"))
+    BREAKER_MINIMUM_CALLS: int = int(os.getenv("BREAKER_MINIMUM_CALLS", "10"))
+    BREAKER_WINDOW: float = float(os.getenv("BREAKER_WINDOW", "30"))
+    BREAKER_OPEN_SECONDS: float = float(os.getenv("BREAKER_OPEN_SECONDS", "15"))
+    RETRY_BUDGET_RATIO: float = float(os.getenv("RETRY_BUDGET_RATIO", "0.1"))
+    RETRY_BUDGET_MIN: int = int(os.getenv("RETRY_BUDGET_MIN", "3"))
+    UPSTREAM_MAX_ATTEMPTS: int = int(os.getenv("UPSTREAM_MAX_ATTEMPTS", "2"))
+    RETRY_BACKOFF_BASE: float = float(os.getenv("RETRY_BACKOFF_BASE", "0.1"))
+    RETRY_BACKOFF_MAX: float = float(os.getenv("RETRY_BACKOFF_MAX", "1"))
+    MANIFEST_CACHE_SIZE: int = int(os.getenv("MANIFEST_CACHE_SIZE", "512"))
+    MANIFEST_CACHE_TTL: float = float(os.getenv("MANIFEST_CACHE_TTL", "300"))
+    TRANSLATION_CACHE_SIZE: int = int(os.getenv("TRANSLATION_CACHE_SIZE", "256"))
+    JSON_BACKEND: str = os.getenv("JSON_BACKEND", "auto")
+    PROXY_PASSTHROUGH: bool = os.getenv("PROXY_PASSTHROUGH", "true").lower() == "true"
+    SPEC_CACHE_DIR: str = str(os.getenv("SPEC_CACHE_DIR", ""))
+    TRACE_EXPORT_FILE: str = str(os.getenv("TRACE_EXPORT_FILE", ""))
+    ZONE_RECONCILE_INTERVAL: float = float(os.getenv("ZONE_RECONCILE_INTERVAL", "60"))
+    ZONE_CACHE_TTL: float = float(os.getenv("ZONE_CACHE_TTL", "30"))
+    ZONE_CACHE_STALE_TTL: float = float(os.getenv("ZONE_CACHE_STALE_TTL", "300"))
 
 
 config = Configuration()
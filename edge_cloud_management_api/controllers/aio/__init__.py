@@ -0,0 +1,6 @@
+"""
+Coroutine request handlers used when the gateway runs as a Connexion AsyncApp (APP_MODE=async).
+
+Each module mirrors the synchronous controller module of the same name, so the operationIds in
+specification/openapi.yaml resolve to either implementation.
+"""
@@ -0,0 +1,167 @@
+import asyncio
+from pydantic import ValidationError
+from starlette.responses import StreamingResponse
+from edge_cloud_management_api.configs.env_config import config
+from edge_cloud_management_api.managers.json_manager import GatewayJSONResponse
+from edge_cloud_management_api.managers.log_manager import logger
+from edge_cloud_management_api.services.pagination import InvalidCursorError, NEXT_CURSOR_HEADER, paginate, stream_body
+from edge_cloud_management_api.services.client_registry import get_async_pi_edge_client
+from edge_cloud_management_api.services.async_storage_service import get_zones
+from edge_cloud_management_api.controllers.job_controller import job_location
+from edge_cloud_management_api.services.job_engine import job_status
+from edge_cloud_management_api.services.partner_deployment import submit_partner_deployment
+from edge_cloud_management_api.services.passthrough import relay_async_response
+from edge_cloud_management_api.services.zone_deployment import local_results, plan_zones, requested_zone_ids, unknown_results, zone_result
+
+
+def _list_response(items: list, limit=None, cursor=None, stream=None, key=None):
+    """
+    Returns one page of `items` as a JSON body, or as a chunked JSON array / NDJSON stream.
+    """
+    page, next_cursor = paginate(items, limit=limit, cursor=cursor)
+    headers = {NEXT_CURSOR_HEADER: next_cursor} if next_cursor else {}
+    if stream:
+        chunks, mimetype = stream_body(page, stream, key=key)
+        return StreamingResponse(chunks, status_code=200, media_type=mimetype, headers=headers)
+    return GatewayJSONResponse({key: page} if key else page, status_code=200, headers=headers)
+
+
+async def submit_app(body: dict):
+    """
+    Controller for submitting application metadata.
+    """
+    try:
+        return await get_async_pi_edge_client().submit_app(body)
+    except ValidationError as e:
+        return {"error": "Invalid input", "details": e.errors()}, 400
+    except Exception as e:
+        return {"error": "An unexpected error occurred", "details": str(e)}, 500
+
+
+async def get_apps(x_correlator=None, limit=None, cursor=None, stream=None):
+    """Retrieve metadata information of all applications, one page at a time"""
+    try:
+        if config.PROXY_PASSTHROUGH and not (limit or cursor or stream):
+            # The whole catalogue is returned unchanged: relay SRM's bytes without parsing them
+            upstream = await get_async_pi_edge_client().stream_service_functions_catalogue()
+            return upstream if isinstance(upstream, dict) else relay_async_response(upstream)
+        registered_apps = await get_async_pi_edge_client().get_service_functions_catalogue()
+        if not isinstance(registered_apps, list):
+            return registered_apps
+        return _list_response(registered_apps, limit=limit, cursor=cursor, stream=stream)
+    except InvalidCursorError as e:
+        return {"status": 400, "code": "INVALID_ARGUMENT", "message": str(e)}, 400
+    except Exception as e:
+        return {"error": "An unexpected error occurred", "details": str(e)}, 500
+
+
+async def get_app(appId, x_correlator=None):
+    """Retrieve the information of an Application"""
+    try:
+        return await get_async_pi_edge_client().get_app(appId)
+    except Exception as e:
+        return {"error": "An unexpected error occurred", "details": str(e)}, 500
+
+
+async def delete_app(appId, x_correlator=None):
+    """Delete Application metadata from an Edge Cloud Provider"""
+    try:
+        return await get_async_pi_edge_client().delete_app(appId=appId)
+    except Exception as e:
+        return {"status": 500, "code": "INTERNAL", "message": f"Internal server error: {str(e)}"}, 500
+
+
+async def _create_multi_zone_instances(body: dict, app_id: str, zone_ids: list, plan):
+    """
+    Deploys to several zones at once: the partner jobs are queued and the batched SRM call for the
+    local zones runs concurrently. Returns per-zone results.
+    """
+    async def deploy_local():
+        if not plan.local:
+            return []
+        try:
+            response = await get_async_pi_edge_client().deploy_service_function(data={**body, 'appZones': plan.local})
+        except Exception as e:
+            logger.error(f"Exception while trying to deploy to SRM: {e}")
+            response = {"error": str(e)}
+        return local_results(plan, response)
+
+    async def submit_partner(zones):
+        job = await asyncio.to_thread(submit_partner_deployment, app_id, zones)
+        return [
+            zone_result(zone.get('edgeCloudZoneId'), 'partner', job['status'], jobId=job['_id'], location=job_location(job['_id']))
+            for zone in zones
+        ]
+
+    groups = await asyncio.gather(deploy_local(), *(submit_partner(zones) for zones in plan.partners.values()))
+    results = unknown_results(plan) + [result for group in groups for result in group]
+    results.sort(key=lambda result: zone_ids.index(result['edgeCloudZoneId']))
+    return {"appId": app_id, "zones": results}, 202
+
+
+async def create_app_instance(body: dict):
+    logger.info("Received request to create app instance")
+    try:
+        app_id = body.get("appId")
+        app_zones = body.get("appZones")
+        if not app_id or not app_zones:
+            return {"error": "Missing required fields: appId, edgeCloudZoneId, or kubernetesCLusterRef"}, 400
+
+        zone_ids = requested_zone_ids(app_zones)
+        plan = plan_zones(app_zones, await get_zones(zone_ids))
+        if len(zone_ids) > 1:
+            return await _create_multi_zone_instances(body, app_id, zone_ids, plan)
+        if plan.unknown:
+            return {"status": 404, "code": "NOT_FOUND", "message": f"Edge Cloud Zone {plan.unknown[0]} does not exist"}, 404
+        if plan.partners:
+            # The GSMA artefact / onboarding / deployment chain runs as a job; the caller polls /jobs/{jobId}
+            job = await asyncio.to_thread(submit_partner_deployment, app_id, next(iter(plan.partners.values())))
+            return job_status(job), 202, {'Location': job_location(job['_id'])}
+
+        logger.info(f"Preparing to send deployment request to SRM for appId={app_id}")
+        response = await get_async_pi_edge_client().deploy_service_function(data=body)
+        if isinstance(response, dict) and "error" in response:
+            logger.warning(f"Failed to deploy service function: {response}")
+            return {"warning": "Deployment not completed (SRM service unreachable)", "details": response}, 202
+        logger.info(f"Deployment response from SRM: {response}")
+        return response
+    except ValidationError as e:
+        logger.error(f"Validation error: {str(e)}")
+        return {"error": "Validation error", "details": str(e)}, 400
+    except Exception as e:
+        logger.error(f"Unexpected error in create_app_instance:{str(e)}")
+        return {"error": "An unexpected error occurred", "details": str(e)}, 500
+
+
+async def get_app_instance(app_id=None, x_correlator=None, app_instance_id=None, region=None, limit=None, cursor=None, stream=None):
+    """
+    Retrieve application instances from SRM.
+    """
+    try:
+        instances = None
+        if app_id is None and app_instance_id is None:
+            instances = await get_async_pi_edge_client().get_app_instances()
+            if not isinstance(instances, list):
+                return instances
+
+        if not instances:
+            return {"status": 404, "code": "NOT_FOUND", "message": "No application instances found for the given parameters."}, 404
+        return _list_response(instances, limit=limit, cursor=cursor, stream=stream, key="appInstanceInfo")
+    except InvalidCursorError as e:
+        return {"status": 400, "code": "INVALID_ARGUMENT", "message": str(e)}, 400
+    except Exception as e:
+        logger.exception("Failed to retrieve app instances")
+        return {"status": 500, "code": "INTERNAL", "message": f"Internal server error: {str(e)}"}, 500
+
+
+async def delete_app_instance(appInstanceId: str, x_correlator=None):
+    """
+    Terminate an Application Instance
+    """
+    try:
+        response = await get_async_pi_edge_client().delete_app_instance(appInstanceId)
+        if isinstance(response, dict):
+            return response, response.get("status_code", 500)
+        return {'result': response.text, 'status': response.status_code}
+    except Exception as e:
+        return {"status": 500, "code": "INTERNAL", "message": f"Internal server error: {str(e)}"}, 500
@@ -0,0 +1,29 @@
+import asyncio
+from pydantic import ValidationError
+from starlette.responses import Response
+from edge_cloud_management_api.services.client_registry import get_async_pi_edge_client
+from edge_cloud_management_api.controllers.edge_cloud_controller import EdgeCloudQueryParams, zone_catalog, zone_index, zone_snapshot
+
+
+async def get_edge_cloud_zones(x_correlator: str | None = None, region=None, status=None):
+    """Retrieve a list of the operators Edge Cloud Zones and their status"""
+    try:
+        query_params = EdgeCloudQueryParams(x_correlator=x_correlator, region=region, status=status)
+        # Cached zones are served on the event loop; a cache refill runs in a worker thread.
+        zones = zone_catalog.get_zones(block=False)
+        if zones is None:
+            zones = await asyncio.to_thread(zone_catalog.get_zones)
+        if query_params.region is not None or query_params.status is not None:
+            zones = zone_index.query(region=query_params.region, status=query_params.status)
+        body = zone_snapshot.json_for(zones)
+        if body is not None:
+            return Response(body, status_code=200, media_type="application/json")
+        return zones, 200
+    except ValidationError as e:
+        return {"status": 400, "code": "VALIDATION_ERROR", "message": e.errors()}, 400
+    except Exception as e:
+        return {"status": 500, "code": "INTERNAL_ERROR", "message": f"An error occurred: {str(e)}"}, 500
+
+
+async def edge_cloud_zone_details(zoneId: str) -> dict:
+    return await get_async_pi_edge_client().edge_cloud_zone_details(zone_id=zoneId)
@@ -0,0 +1,72 @@
+import asyncio
+from edge_cloud_management_api.configs.env_config import config
+from edge_cloud_management_api.services.client_registry import get_async_federation_client, get_token_manager
+from edge_cloud_management_api.services.federation_tokens import TOKEN_ERRORS, token_error
+from edge_cloud_management_api.services.async_storage_service import upsert_zones, insert_federation, get_fed, get_latest_fed, update_fed_token
+from edge_cloud_management_api.services.token_manager import needs_refresh
+
+
+async def _access_token():
+    """Cached tokens are served on the event loop; a token request runs in a worker thread."""
+    manager = get_token_manager()
+    return manager.get(block=False) or await asyncio.to_thread(manager.get)
+
+
+async def federation_token(fed: dict) -> str:
+    """Return the token stored with a federation, re-hydrating it from the token manager once it expires."""
+    if fed.get('token') and not needs_refresh(fed.get('tokenExpiresAt'), config.TOKEN_REFRESH_MARGIN):
+        return fed['token']
+    token = await _access_token()
+    await update_fed_token(fed['_id'], token.access_token, token.expires_at)
+    return token.access_token
+
+
+async def create_federation(body: dict):
+    """POST /partner - Create federation with partner OP."""
+    try:
+        token = await _access_token()
+    except TOKEN_ERRORS as e:
+        return token_error(e)
+    response, code = await get_async_federation_client().post_partner(body, token.access_token)
+    fed = {'_id': response.get('federationContextId'), 'token': token.access_token, 'tokenExpiresAt': token.expires_at}
+    if code == 200:
+        provider = response.get('partnerOPFederationId')
+        zones_to_insert = [
+            {
+                '_id': zone.get('zoneId'),
+                'edgeCloudProvider': provider,
+                'edgeCloudZoneId': zone.get('zoneId'),
+                'edgeCloudZoneName': zone.get('geographyDetails'),
+                'edgeCloudZoneStatus': 'unknown',
+                'isLocal': 'false',
+                'fedContextId': response.get('federationContextId'),
+            }
+            for zone in response.get('offeredAvailabilityZones')
+        ]
+        await upsert_zones(zones_to_insert)
+        await insert_federation(fed)
+    return response, code
+
+
+async def get_federation(federationContextId):
+    """GET /{federationContextId}/partner - Get federation info."""
+    fed = await get_fed(federationContextId)
+    if not fed:
+        return 'Federation not found', 404
+    return await get_async_federation_client().get_partner(federationContextId, await federation_token(fed))
+
+
+async def delete_federation(federationContextId):
+    """DELETE /{federationContextId}/partner - Delete federation."""
+    fed = await get_fed(federationContextId)
+    if not fed:
+        return 'Federation not found', 404
+    return await get_async_federation_client().delete_partner(federationContextId, await federation_token(fed))
+
+
+async def get_federation_context_ids():
+    """GET /fed-context-id - Fetch federationContextId(s)."""
+    fed = await get_latest_fed()
+    if not fed:
+        return 'Federation not found', 404
+    return await get_async_federation_client().get_federation_context_ids(await federation_token(fed))
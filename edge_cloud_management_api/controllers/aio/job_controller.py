@@ -0,0 +1,10 @@
+from edge_cloud_management_api.services.job_engine import job_status
+from edge_cloud_management_api.services.async_storage_service import get_job as find_job
+
+
+async def get_job(jobId: str, x_correlator=None):
+    """GET /jobs/{jobId} - Report the progress of an asynchronous job."""
+    job = await find_job(jobId)
+    if not job:
+        return {"status": 404, "code": "NOT_FOUND", "message": f"Job {jobId} does not exist"}, 404
+    return job_status(job), 200
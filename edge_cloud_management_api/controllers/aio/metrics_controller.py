@@ -0,0 +1,7 @@
+from starlette.responses import Response
+from edge_cloud_management_api.managers.metrics_manager import CONTENT_TYPE, metrics
+
+
+async def get_metrics(request):
+    """GET /metrics - Gateway metrics in the Prometheus text format."""
+    return Response(metrics.render(), headers={"Content-Type": CONTENT_TYPE})
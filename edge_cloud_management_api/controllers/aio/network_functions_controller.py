@@ -0,0 +1,69 @@
+from edge_cloud_management_api.configs.env_config import config
+from edge_cloud_management_api.services.client_registry import get_async_pi_edge_client
+from edge_cloud_management_api.services.passthrough import relay_async_response
+
+
+def _unexpected_error(e: Exception):
+    return {"error": "An unexpected error occurred", "details": str(e)}, 500
+
+
+async def create_qod_session(body: dict):
+    """
+    Creates a new QoD session
+    """
+    try:
+        return await get_async_pi_edge_client().create_qod_session(body)
+    except Exception as e:
+        return _unexpected_error(e)
+
+
+async def delete_qod_session(sessionId: str):
+    """
+    Deletes a QoD session
+    """
+    try:
+        return await get_async_pi_edge_client().delete_qod_session(sessionId=sessionId)
+    except Exception as e:
+        return _unexpected_error(e)
+
+
+async def get_qod_session(sessionId: str):
+    """
+    Retrieves a QoD session
+    """
+    try:
+        if config.PROXY_PASSTHROUGH:
+            return relay_async_response(await get_async_pi_edge_client().stream_qod_session(sessionId))
+        return await get_async_pi_edge_client().get_qod_session(sessionId=sessionId)
+    except Exception as e:
+        return _unexpected_error(e)
+
+
+async def create_traffic_influence_resource(body: dict):
+    try:
+        return await get_async_pi_edge_client().create_traffic_influence_resource(body)
+    except Exception as e:
+        return _unexpected_error(e)
+
+
+async def get_traffic_influence_resource(id: str):
+    try:
+        return await get_async_pi_edge_client().get_traffic_influence_resource(id)
+    except Exception as e:
+        return _unexpected_error(e)
+
+
+async def delete_traffic_influence_resource(id: str):
+    try:
+        return await get_async_pi_edge_client().delete_traffic_influence_resource(id)
+    except Exception as e:
+        return _unexpected_error(e)
+
+
+async def get_all_traffic_influence_resources():
+    try:
+        if config.PROXY_PASSTHROUGH:
+            return relay_async_response(await get_async_pi_edge_client().stream_traffic_influence_resources())
+        return await get_async_pi_edge_client().get_all_traffic_influence_resources()
+    except Exception as e:
+        return _unexpected_error(e)
@@ -1,25 +1,46 @@
-from flask import jsonify, request
+from flask import Response, jsonify, request
 from pydantic import ValidationError
+from edge_cloud_management_api.configs.env_config import config
 from edge_cloud_management_api.managers.log_manager import logger
-from edge_cloud_management_api.services.edge_cloud_services import PiEdgeAPIClientFactory
-from edge_cloud_management_api.services.federation_services import FederationManagerClientFactory
-from edge_cloud_management_api.services.storage_service import get_zone
-from edge_cloud_management_api.services.storage_service import get_fed
-
-factory = FederationManagerClientFactory()
-federation_client = factory.create_federation_client()
+from edge_cloud_management_api.services.client_registry import get_pi_edge_client
+from edge_cloud_management_api.controllers.job_controller import job_location
+from edge_cloud_management_api.services.job_engine import job_status
+from edge_cloud_management_api.services.pagination import InvalidCursorError, NEXT_CURSOR_HEADER, paginate, stream_body
+from edge_cloud_management_api.services.partner_deployment import submit_partner_deployment
+from edge_cloud_management_api.services.passthrough import relay_response
+from edge_cloud_management_api.services.storage_service import get_zones
+from edge_cloud_management_api.services.zone_deployment import local_results, plan_zones, requested_zone_ids, unknown_results, zone_result
 
 class NotFound404Exception(Exception):
     pass
 
 
+def _list_response(items: list, limit=None, cursor=None, stream=None, key=None):
+    """
+    Returns one page of `items` as a JSON body, or as a chunked JSON array / NDJSON stream.
+    The cursor of the next page, if any, is sent in the x-next-cursor header.
+    """
+    page, next_cursor = paginate(items, limit=limit, cursor=cursor)
+    if stream:
+        chunks, mimetype = stream_body(page, stream, key=key)
+        response = Response(chunks, mimetype=mimetype)
+    else:
+        response = jsonify({key: page} if key else page)
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+    return response, 200
+
+
+def _invalid_cursor_response(error: InvalidCursorError):
+    return jsonify({"status": 400, "code": "INVALID_ARGUMENT", "message": str(error)}), 400
+
+
 def submit_app(body: dict):
     """
     Controller for submitting application metadata.
     """
     try:
-        pi_edge_factory = PiEdgeAPIClientFactory()
-        api_client = pi_edge_factory.create_pi_edge_api_client()
+        api_client = get_pi_edge_client()
         response = api_client.submit_app(body)
         return response
 
@@ -33,13 +54,20 @@ def submit_app(body: dict):
         )
 
 
-def get_apps(x_correlator=None):
-    """Retrieve metadata information of all applications"""
+def get_apps(x_correlator=None, limit=None, cursor=None, stream=None):
+    """Retrieve metadata information of all applications, one page at a time"""
     try:
-        pi_edge_factory = PiEdgeAPIClientFactory()
-        api_client = pi_edge_factory.create_pi_edge_api_client()
+        api_client = get_pi_edge_client()
+        if config.PROXY_PASSTHROUGH and not (limit or cursor or stream):
+            # The whole catalogue is returned unchanged: relay SRM's bytes without parsing them
+            upstream = api_client.stream_service_functions_catalogue()
+            return upstream if isinstance(upstream, dict) else relay_response(upstream)
         registered_apps = api_client.get_service_functions_catalogue()
-        return registered_apps
+        if not isinstance(registered_apps, list):
+            return registered_apps
+        return _list_response(registered_apps, limit=limit, cursor=cursor, stream=stream)
+    except InvalidCursorError as e:
+        return _invalid_cursor_response(e)
     except Exception as e:
         return (
             jsonify({"error": "An unexpected error occurred", "details": str(e)}),
@@ -50,8 +78,7 @@ def get_apps(x_correlator=None):
 def get_app(appId, x_correlator=None):
     """Retrieve the information of an Application"""
     try:
-        pi_edge_factory = PiEdgeAPIClientFactory()
-        api_client = pi_edge_factory.create_pi_edge_api_client()
+        api_client = get_pi_edge_client()
         response = api_client.get_app(appId)
         return response
 
@@ -71,8 +98,7 @@ def get_app(appId, x_correlator=None):
 def delete_app(appId, x_correlator=None):
     """Delete Application metadata from an Edge Cloud Provider"""
     try:
-        pi_edge_factory = PiEdgeAPIClientFactory()
-        api_client = pi_edge_factory.create_pi_edge_api_client()
+        api_client = get_pi_edge_client()
         response = api_client.delete_app(appId=appId)
         return response
 
@@ -88,6 +114,28 @@ def delete_app(appId, x_correlator=None):
             500,
         )
 
+def _create_multi_zone_instances(body: dict, app_id: str, zone_ids: list, plan, pi_edge_client):
+    """
+    Deploys to several zones at once: one partner job per federation context is queued first, so the
+    partners are served while the local zones are deployed with a single SRM call. Returns per-zone results.
+    """
+    results = unknown_results(plan)
+    for zones in plan.partners.values():
+        job = submit_partner_deployment(app_id, zones)
+        results += [
+            zone_result(zone.get('edgeCloudZoneId'), 'partner', job['status'], jobId=job['_id'], location=job_location(job['_id']))
+            for zone in zones
+        ]
+    if plan.local:
+        try:
+            response = pi_edge_client.deploy_service_function(data={**body, 'appZones': plan.local})
+        except Exception as e:
+            logger.error(f"Exception while trying to deploy to SRM: {e}")
+            response = {"error": str(e)}
+        results += local_results(plan, response)
+    results.sort(key=lambda result: zone_ids.index(result['edgeCloudZoneId']))
+    return jsonify({"appId": app_id, "zones": results}), 202
+
 def create_app_instance():
     logger.info("Received request to create app instance")
     try:
@@ -96,77 +144,23 @@ def create_app_instance():
        
        app_id = body.get("appId")
        app_zones = body.get("appZones")
-       pi_edge_client_factory = PiEdgeAPIClientFactory()
-       pi_edge_client = pi_edge_client_factory.create_pi_edge_api_client()
+       pi_edge_client = get_pi_edge_client()
        
        if not app_id or not app_zones :
            return jsonify({"error": "Missing required fields: appId, edgeCloudZoneId, or kubernetesCLusterRef"}), 400
        
-       zone = get_zone(app_zones[0].get('EdgeCloudZone').get('edgeCloudZoneId'))
-       if zone.get('isLocal')=='false':
-           # Step 1: retrieve app metadata
-           appData = pi_edge_client.get_app(appId=app_id).get('appManifest')
-           #Step 2: compose GSMA artefact payload
-           artefact = {}
-           artefact['artefactId'] = app_id
-           artefact['appProviderId'] = appData.get('appProvider')
-           artefact['artefactName'] = appData.get('name')
-           artefact['artefactVersionInfo'] = appData.get('version')
-           artefact['artefactDescription'] = ''
-           repoInfo = appData.get('appRepo')
-           artefact['repoType'] = repoInfo.get('type')
-           artefact['artefactRepoLocation'] = {'repoURL': repoInfo.get('imagePath'), 'userName': repoInfo.get('userName'), 'password': repoInfo.get('credentials'), 'token': ''}
-           exposedInterfaces = []
-           networkInterfaces = appData.get('componentSpec')[0].get('networkInterfaces')
-           for ni in networkInterfaces:
-               interface = {'interfaceId': '', 'commProtocol': ni.get('protocol'), 'commPort': ni.get('port'), 'visibilityType': ni.get('visibilityType'), 'network': '', 'InterfaceName': ''}
-               exposedInterfaces.append(interface)
-           artefact['componentSpec'] = [
-               {
-                   'componentName': appData.get('name'), 
-                   'numOfInstances': 0, 
-                   'restartPolicy': 'RESTART_POLICY_ALWAYS', 
-                   'exposedInterfaces': exposedInterfaces, 
-                   'compEnvParams': [],
-                   'persistentVolumes': []
-                }
-            ]
-           # Step 3: Send artefact to local fed manager
-           fed_token = get_fed(zone.get('fedContextId')).get('token')
-           create_artefact_response = federation_client.create_artefact(artefact=artefact, federation_context_id=zone.get('fedContextId'), token=fed_token)
-           # Step 4: Onboard app
-           if create_artefact_response.status_code == 200 or create_artefact_response.status_code ==409:
-                # Step 5: Create GSM onboard app payload
-                onboard_app = {}
-                onboard_app['appId'] = app_id
-                onboard_app['appProviderId'] = appData.get('appProvider')
-                onboard_app['appDeploymentZones'] = []
-                appMetaData = {}
-                appMetaData['appName'] = appData.get('name')
-                appMetaData['version'] = appData.get('version')
-                onboard_app['appMetaData'] = appMetaData
-                onboard_app['appComponentSpecs'] = [{'serviceNameNB': appData.get('name'),
-                                                     'serviceNameEW': appData.get('name'),
-                                                     'componentName': appData.get('name'),
-                                                     'artefactId': app_id
-                                                     }
-                                                   ]
-                # Step 6: Onboard app at partner
-                onboard_app_response = federation_client.onboard_application(federation_context_id=zone.get('fedContextId'), body=onboard_app, token=fed_token)
-                if onboard_app_response.status_code==200:
-                    # Step 7: Construct GSMA deployment payload
-                    deploy_app = {}
-                    deploy_app['appId'] = app_id
-                    deploy_app['appVersion'] = appData.get('version')
-                    deploy_app['appProviderId'] = appData.get('appProvider')
-                    deploy_app['zoneInfo'] = {'zoneId': zone.get('edgeCloudZoneId')}
-                    # Step 8: Deploy app at partner
-                    deploy_app_response = federation_client.deploy_app_partner(federation_context_id=zone.get('fedContextId'), body=deploy_app, token = fed_token)
-                    return deploy_app_response
-                else:
-                    return onboard_app_response
-           else:
-               return create_artefact_response 
+       zone_ids = requested_zone_ids(app_zones)
+       plan = plan_zones(app_zones, get_zones(zone_ids))
+       if len(zone_ids) > 1:
+           return _create_multi_zone_instances(body, app_id, zone_ids, plan, pi_edge_client)
+       if plan.unknown:
+           return jsonify({"status": 404, "code": "NOT_FOUND", "message": f"Edge Cloud Zone {plan.unknown[0]} does not exist"}), 404
+       if plan.partners:
+           # The GSMA artefact / onboarding / deployment chain runs as a job; the caller polls /jobs/{jobId}
+           job = submit_partner_deployment(app_id, next(iter(plan.partners.values())))
+           response = jsonify(job_status(job))
+           response.headers['Location'] = job_location(job['_id'])
+           return response, 202
 
        
        logger.info(f"Preparing to send deployment request to SRM for appId={app_id}")
@@ -204,18 +198,20 @@ def create_app_instance():
         logger.error(f"Unexpected error in create_app_instance:{str(e)}")
         return jsonify({"error": "An unexpected error occurred", "details": str(e)}), 500   
 
-def get_app_instance(app_id=None, x_correlator=None, app_instance_id=None, region=None):
+def get_app_instance(app_id=None, x_correlator=None, app_instance_id=None, region=None, limit=None, cursor=None, stream=None):
     """
     Retrieve application instances from the database.
-    Supports filtering by app_id, app_instance_id, and region.
+    Supports filtering by app_id, app_instance_id, and region, and cursor pagination.
     """
     try:
         instances = None
-        pi_edge_client_factory = PiEdgeAPIClientFactory()
-        pi_edge_client = pi_edge_client_factory.create_pi_edge_api_client()
+        pi_edge_client = get_pi_edge_client()
 
         if app_id is None and app_instance_id is None:
             instances = pi_edge_client.get_app_instances()
+            if not isinstance(instances, list):
+                # SRM error, returned as the client reported it
+                return instances
 
         if not instances:
             return jsonify({
@@ -224,7 +220,10 @@ def get_app_instance(app_id=None, x_correlator=None, app_instance_id=None, regio
                 "message": "No application instances found for the given parameters."
             }), 404
 
-        return jsonify({"appInstanceInfo": instances}), 200
+        return _list_response(instances, limit=limit, cursor=cursor, stream=stream, key="appInstanceInfo")
+
+    except InvalidCursorError as e:
+        return _invalid_cursor_response(e)
 
     except Exception as e:
         logger.exception("Failed to retrieve app instances")
@@ -243,8 +242,7 @@ def delete_app_instance(appInstanceId: str, x_correlator=None):
     - Returns 204 if deleted, 404 if not found.
     """
     try:
-        pi_edge_client_factory = PiEdgeAPIClientFactory()
-        pi_edge_client = pi_edge_client_factory.create_pi_edge_api_client()
+        pi_edge_client = get_pi_edge_client()
         response = pi_edge_client.delete_app_instance(appInstanceId)
         return jsonify({'result': response.text, 'status': response.status_code})
 
@@ -1,27 +1,15 @@
-from flask import jsonify
+from flask import current_app, jsonify
 from pydantic import BaseModel, Field, ValidationError
 from typing import List
 from edge_cloud_management_api.configs.env_config import config
 from edge_cloud_management_api.managers.log_manager import logger
-from edge_cloud_management_api.services.edge_cloud_services import PiEdgeAPIClientFactory
-from edge_cloud_management_api.services.storage_service import insert_zones
-from edge_cloud_management_api.services.federation_services import FederationManagerClientFactory
+from edge_cloud_management_api.managers.validation_manager import ValidatedSnapshot
+from edge_cloud_management_api.services.client_registry import get_pi_edge_client
+from edge_cloud_management_api.services.storage_service import get_partner_zone_docs
+from edge_cloud_management_api.services.zone_catalog import ZoneCatalog, export_metrics
+from edge_cloud_management_api.services.zone_index import ZoneIndex
 
 
-try:
-    pi_edge_factory = PiEdgeAPIClientFactory()
-    api_client = pi_edge_factory.create_pi_edge_api_client()
-    zones = api_client.edge_cloud_zones()
-    for zone in zones:
-        zone['_id'] = zone.get('edgeCloudZoneId')
-        zone['isLocal'] = 'true'
-    insert_zones(zones)
-except Exception as e:
-    logger.error(e.args)
-
-factory = FederationManagerClientFactory()
-federation_client = factory.create_federation_client()
-
 class EdgeCloudZone(BaseModel):
     edgeCloudZoneId: str = Field(..., description="Unique identifier of the Edge Cloud Zone")
     edgeCloudZoneName: str = Field(..., description="Name of the Edge Cloud Zone")
@@ -44,28 +32,46 @@ class EdgeCloudQueryParams(BaseModel):
     )
 
 
-def get_local_zones() -> list[dict]:
+def fetch_local_zones() -> list[dict]:
     """
     Get local Operator Platform available zones from PiEdge Service Resource Manager.
+    Raises when SRM cannot be reached or answers with an error, so that callers can tell an SRM outage
+    from an Operator Platform without local zones.
     """
-    try:
-        pi_edge_factory = PiEdgeAPIClientFactory()
-        api_client = pi_edge_factory.create_pi_edge_api_client()
-        result = api_client.edge_cloud_zones()
+    result = get_pi_edge_client().list_nodes()
+    if isinstance(result, dict) and "error" in result:
+        raise RuntimeError(f"SRM error: {result['error']}")
+    return result
 
-        if isinstance(result, dict) and "error" in result:
-            logger.error(f"SRM error: {result['error']}")
-            return []
-        return result
 
+def get_local_zones() -> list[dict]:
+    """
+    Get local Operator Platform available zones from PiEdge Service Resource Manager, or [] when SRM fails.
+    """
+    try:
+        return fetch_local_zones()
     except Exception as e:
         logger.exception("Unexpected error while retrieving local zones from SRM: %s", e)
         return []
 
 
-def get_federated_zones() -> List[EdgeCloudZone]:
-    """get partner/federated Operator Platform available zones from Federation Manager"""
-    return []
+def get_federated_zones() -> list[dict]:
+    """get partner/federated Operator Platform available zones stored when the federations were created"""
+    try:
+        return [
+            {
+                "edgeCloudZoneId": doc.get("edgeCloudZoneId") or doc["_id"],
+                "edgeCloudZoneName": doc.get("edgeCloudZoneName") or doc["_id"],
+                "edgeCloudZoneStatus": doc.get("edgeCloudZoneStatus") or "unknown",
+                "edgeCloudProvider": doc.get("edgeCloudProvider"),
+                "edgeCloudRegion": doc.get("edgeCloudRegion"),
+                "isLocal": "false",
+            }
+            for doc in get_partner_zone_docs()
+        ]
+    except Exception as e:
+        logger.exception("Unexpected error while retrieving federated zones: %s", e)
+        return []
 
 def get_all_cloud_zones() -> List[EdgeCloudZone]:
     """Get all available zones from local and federated Operator Platforms"""
@@ -76,7 +82,38 @@ def get_all_cloud_zones() -> List[EdgeCloudZone]:
     # Federated zones are already EdgeCloudZone instances
     # federated_zones = get_federated_zones()
     # return local_zones + federated_zones
-    return get_local_zones() + get_federated_zones()
+    # SRM failures propagate, so the zone catalog keeps its last good zones instead of caching none
+    return fetch_local_zones() + get_federated_zones()
+
+
+def load_zone_catalog() -> list[dict]:
+    """Fetch and validate all zones; used to (re)fill the zone catalog cache and its filter indexes"""
+    zones = get_all_cloud_zones()
+    # The whole list is validated in one call, and only when it changed since the last load
+    if zone_snapshot.update(zones):
+        local_zone_ids = {zone["edgeCloudZoneId"] for zone in zones if zone.get("isLocal", "true") == "true"}
+        zone_index.update(zone_snapshot.current.python, local_zone_ids=local_zone_ids)
+    return zone_snapshot.current.python
+
+
+def find_zones(region: str | None = None, status: str | None = None) -> list[dict]:
+    """Return the catalog zones matching the given filters, using the zone index when filtering"""
+    zones = zone_catalog.get_zones()
+    if region is None and status is None:
+        return zones
+    return zone_index.query(region=region, status=status)
+
+
+zone_index = ZoneIndex()
+
+
+# Zones are validated one by one in effect: a malformed (e.g. partner) zone is logged and left out
+zone_snapshot = ValidatedSnapshot(list[EdgeCloudZone], skip_invalid=True)
+
+
+zone_catalog = ZoneCatalog(loader=load_zone_catalog, ttl=config.ZONE_CACHE_TTL, stale_ttl=config.ZONE_CACHE_STALE_TTL)
+export_metrics(zone_catalog)
+
 
 def get_edge_cloud_zones(x_correlator: str | None = None, region=None, status=None):  # noqa: E501
     """Retrieve a list of the operators Edge Cloud Zones and their status
@@ -99,16 +136,11 @@ def get_edge_cloud_zones(x_correlator: str | None = None, region=None, status=No
             status=status,
         )
 
-        #def query_region_matches(zone: str) -> bool:
-          #  return query_params.region is None or zone["edgeCloudRegion"] == query_params.region
-        def query_region_matches(zone: EdgeCloudZone) -> bool:
-            return query_params.region is None or zone.edgeCloudRegion == query_params.region
-        #def query_status_matches(zone: str) -> bool:
-         #   return (query_params.status is None) or (zone["edgeCloudZoneStatus"] == query_params.status)
-        def query_status_matches(zone: EdgeCloudZone) -> bool:
-            return query_params.status is None or zone.edgeCloudZoneStatus == query_params.status
-
-        response = [EdgeCloudZone(**zone).model_dump() for zone in get_all_cloud_zones()]
+        response = find_zones(region=query_params.region, status=query_params.status)
+        body = zone_snapshot.json_for(response)
+        if body is not None:
+            # The unfiltered list is sent as the JSON encoded once when it was validated
+            return current_app.response_class(body, mimetype="application/json"), 200
         return jsonify(response), 200
 
     except ValidationError as e:
@@ -127,7 +159,6 @@ def get_edge_cloud_zones(x_correlator: str | None = None, region=None, status=No
     
 
 def edge_cloud_zone_details(zoneId: str) -> dict:
-    pi_edge_factory = PiEdgeAPIClientFactory()
-    api_client = pi_edge_factory.create_pi_edge_api_client()
+    api_client = get_pi_edge_client()
     result = api_client.edge_cloud_zone_details(zone_id=zoneId)
     return result
@@ -0,0 +1,19 @@
+import connexion
+from connexion.middleware.routing import ROUTING_CONTEXT
+from flask import jsonify
+from edge_cloud_management_api.services.job_engine import job_status
+from edge_cloud_management_api.services.storage_service import get_job as find_job
+
+
+def job_location(job_id: str) -> str:
+    """URI of the status endpoint of a job, under the base path of the current API."""
+    base_path = connexion.request.scope.get("extensions", {}).get(ROUTING_CONTEXT, {}).get("api_base_path", "")
+    return f"{base_path}/jobs/{job_id}"
+
+
+def get_job(jobId: str, x_correlator=None):
+    """GET /jobs/{jobId} - Report the progress of an asynchronous job."""
+    job = find_job(jobId)
+    if not job:
+        return jsonify({"status": 404, "code": "NOT_FOUND", "message": f"Job {jobId} does not exist"}), 404
+    return jsonify(job_status(job)), 200
@@ -0,0 +1,7 @@
+from flask import Response
+from edge_cloud_management_api.managers.metrics_manager import CONTENT_TYPE, metrics
+
+
+def get_metrics():
+    """GET /metrics - Gateway metrics in the Prometheus text format."""
+    return Response(metrics.render(), content_type=CONTENT_TYPE)
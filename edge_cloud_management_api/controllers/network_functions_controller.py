@@ -1,7 +1,9 @@
 from flask import jsonify
 from pydantic import ValidationError #Field
+from edge_cloud_management_api.configs.env_config import config
 from edge_cloud_management_api.managers.log_manager import logger
-from edge_cloud_management_api.services.edge_cloud_services import PiEdgeAPIClientFactory
+from edge_cloud_management_api.services.client_registry import get_pi_edge_client
+from edge_cloud_management_api.services.passthrough import relay_response
 
 def create_qod_session(body: dict):
     """
@@ -12,8 +14,7 @@ def create_qod_session(body: dict):
         # validated_data = AppManifest(**body)
         # validated_data_dict = validated_data.model_dump(mode="json")
         # validated_data_dict["_id"] = str(uuid.uuid4())
-        pi_edge_factory = PiEdgeAPIClientFactory()
-        api_client = pi_edge_factory.create_pi_edge_api_client()
+        api_client = get_pi_edge_client()
         response = api_client.create_qod_session(body)
         return response
 
@@ -35,8 +36,7 @@ def delete_qod_session(sessionId: str):
         # validated_data = AppManifest(**body)
         # validated_data_dict = validated_data.model_dump(mode="json")
         # validated_data_dict["_id"] = str(uuid.uuid4())
-        pi_edge_factory = PiEdgeAPIClientFactory()
-        api_client = pi_edge_factory.create_pi_edge_api_client()
+        api_client = get_pi_edge_client()
         response = api_client.delete_qod_session(sessionId=sessionId)
 
         return response
@@ -58,8 +58,9 @@ def get_qod_session(sessionId: str):
         # validated_data = AppManifest(**body)
         # validated_data_dict = validated_data.model_dump(mode="json")
         # validated_data_dict["_id"] = str(uuid.uuid4())
-        pi_edge_factory = PiEdgeAPIClientFactory()
-        api_client = pi_edge_factory.create_pi_edge_api_client()
+        api_client = get_pi_edge_client()
+        if config.PROXY_PASSTHROUGH:
+            return relay_response(api_client.stream_qod_session(sessionId))
         response = api_client.get_qod_session(sessionId=sessionId)
         # Insert into MongoDB
         # with MongoManager() as db:
@@ -81,8 +82,7 @@ def get_qod_session(sessionId: str):
     
 def create_traffic_influence_resource(body: dict):
         try:
-            pi_edge_factory = PiEdgeAPIClientFactory()
-            api_client = pi_edge_factory.create_pi_edge_api_client()
+            api_client = get_pi_edge_client()
             response = api_client.create_traffic_influence_resource(body)
             return response
         except ValidationError as e:
@@ -96,8 +96,7 @@ def create_traffic_influence_resource(body: dict):
 
 def get_traffic_influence_resource(id: str):
     try:
-            pi_edge_factory = PiEdgeAPIClientFactory()
-            api_client = pi_edge_factory.create_pi_edge_api_client()
+            api_client = get_pi_edge_client()
             response = api_client.get_traffic_influence_resource(id)
             return response
     except ValidationError as e:
@@ -112,8 +111,7 @@ def get_traffic_influence_resource(id: str):
 
 def delete_traffic_influence_resource(id: str):
     try:
-            pi_edge_factory = PiEdgeAPIClientFactory()
-            api_client = pi_edge_factory.create_pi_edge_api_client()
+            api_client = get_pi_edge_client()
             response = api_client.delete_traffic_influence_resource(id)
             return response
     except ValidationError as e:
@@ -127,8 +125,9 @@ def delete_traffic_influence_resource(id: str):
 
 def get_all_traffic_influence_resources():
     try:
-            pi_edge_factory = PiEdgeAPIClientFactory()
-            api_client = pi_edge_factory.create_pi_edge_api_client()
+            api_client = get_pi_edge_client()
+            if config.PROXY_PASSTHROUGH:
+                return relay_response(api_client.stream_traffic_influence_resources())
             response = api_client.get_all_traffic_influence_resources()
             return response
     except ValidationError as e:
@@ -1,12 +1,10 @@
-import os
-from jose import JWTError, jwt
+from jose import JWTError
 from werkzeug.exceptions import Unauthorized
+from edge_cloud_management_api.services.client_registry import get_jwt_verifier
 
 def decode_token(token:str):
-    JWT_ISSUER = os.environ.get('JWT_ISSUER')
-    PUBLIC_KEY = os.environ.get('JWT_PUBLIC_KEY')
     try:
-        return jwt.decode(token, key=PUBLIC_KEY, algorithms=["RS256"], issuer=JWT_ISSUER)
+        return get_jwt_verifier().verify(token)
     except JWTError as e:
         raise Unauthorized from e
     
@@ -1,11 +1,90 @@
-from pymongo import MongoClient
+import threading
+from pymongo import AsyncMongoClient, MongoClient
 from edge_cloud_management_api.configs.env_config import config
+from edge_cloud_management_api.managers.metrics_manager import MongoCommandMetrics, MongoPoolMetrics
+
+_client: MongoClient | None = None
+_client_lock = threading.Lock()
+_async_client: AsyncMongoClient | None = None
+
+
+def _client_options() -> dict:
+    return {
+        "maxPoolSize": config.MONGO_MAX_POOL_SIZE,
+        "minPoolSize": config.MONGO_MIN_POOL_SIZE,
+        "maxIdleTimeMS": config.MONGO_MAX_IDLE_TIME_MS,
+        "serverSelectionTimeoutMS": config.MONGO_SERVER_SELECTION_TIMEOUT_MS,
+        "connectTimeoutMS": config.MONGO_CONNECT_TIMEOUT_MS,
+        "socketTimeoutMS": config.MONGO_SOCKET_TIMEOUT_MS,
+        "event_listeners": [MongoCommandMetrics(), MongoPoolMetrics()],
+    }
+
+
+def _build_client(mongo_uri: str) -> MongoClient:
+    return MongoClient(mongo_uri, **_client_options())
+
+
+def get_mongo_client() -> MongoClient:
+    """
+    Returns the process-wide MongoDB client, creating it on first use.
+    All storage functions and MongoManager instances share its connection pool.
+    """
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = _build_client(config.MONGO_URI)
+    return _client
+
+
+def close_mongo_client():
+    """
+    Closes the process-wide MongoDB client and its pooled connections.
+    """
+    global _client
+    with _client_lock:
+        if _client is not None:
+            _client.close()
+            _client = None
+
+
+def get_async_mongo_client() -> AsyncMongoClient:
+    """
+    Returns the process-wide asyncio MongoDB client used in async mode, creating it on first use.
+    """
+    global _async_client
+    if _async_client is None:
+        _async_client = AsyncMongoClient(config.MONGO_URI, **_client_options())
+    return _async_client
+
+
+def reset_mongo_clients():
+    """
+    Forgets the MongoDB clients inherited from the parent process after a fork, without closing them:
+    their sockets belong to the parent. The worker builds its own clients on first use.
+    """
+    global _client, _client_lock, _async_client
+    _client = None
+    _async_client = None
+    _client_lock = threading.Lock()
+
+
+async def close_async_mongo_client():
+    """
+    Closes the asyncio MongoDB client and its pooled connections.
+    """
+    global _async_client
+    if _async_client is not None:
+        client, _async_client = _async_client, None
+        await client.close()
 
 
 class MongoManager:
     """
     A utility class for managing MongoDB operations.
     The class implements the context manager protocol to ensure that the connection is closed after use.
+    When created for the configured MONGO_URI it borrows the process-wide client, so closing it
+    only releases the manager and leaves the shared pool open.
 
     Methods:
         insert_document: Inserts a document into a collection.
@@ -28,7 +107,8 @@ class MongoManager:
         if not mongo_uri:
             raise ValueError("MONGO_URI is not set in the environment configuration.")
 
-        self.client = MongoClient(mongo_uri, maxPoolSize=50)
+        self._owns_client = mongo_uri != config.MONGO_URI
+        self.client = _build_client(mongo_uri) if self._owns_client else get_mongo_client()
         mongo_db_name: str = mongo_uri.split("/")[-1].split("?")[0]
         self.db = self.client[mongo_db_name]
 
@@ -78,6 +158,7 @@ class MongoManager:
 
     def close_connection(self):
         """
-        Closes the MongoDB connection.
+        Closes the MongoDB connection, unless it is the shared process-wide client.
         """
-        self.client.close()
+        if self._owns_client:
+            self.client.close()
@@ -0,0 +1,111 @@
+import threading
+import httpx
+import requests
+from requests.adapters import HTTPAdapter
+from edge_cloud_management_api.configs.env_config import config
+from edge_cloud_management_api.managers.metrics_manager import metrics
+
+_session: requests.Session | None = None
+_session_lock = threading.Lock()
+_async_clients: dict[bool, httpx.AsyncClient] = {}
+
+
+def _build_session() -> requests.Session:
+    """
+    Builds a keep-alive session with a bounded connection pool per upstream host.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=config.HTTP_POOL_CONNECTIONS,
+        pool_maxsize=config.HTTP_POOL_MAXSIZE,
+        pool_block=config.HTTP_POOL_BLOCK,
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    if config.HTTP_PROXY:
+        session.proxies.update({"http": config.HTTP_PROXY, "https": config.HTTP_PROXY})
+    return session
+
+
+def get_http_session() -> requests.Session:
+    """
+    Returns the process-wide HTTP session, creating it on first use.
+    """
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                _session = _build_session()
+    return _session
+
+
+def close_http_session():
+    """
+    Closes the process-wide HTTP session and releases its pooled connections.
+    """
+    global _session
+    with _session_lock:
+        if _session is not None:
+            _session.close()
+            _session = None
+
+
+def reset_http_clients():
+    """
+    Forgets the HTTP clients inherited from the parent process after a fork, without closing them:
+    their pooled connections belong to the parent. The worker builds its own clients on first use.
+    """
+    global _session, _session_lock
+    _session = None
+    _session_lock = threading.Lock()
+    _async_clients.clear()
+
+
+def get_async_http_client(verify: bool = True) -> httpx.AsyncClient:
+    """
+    Returns the process-wide asyncio HTTP client used in async mode, creating it on first use.
+    Clients are kept per TLS verification setting since httpx fixes it per client.
+    """
+    client = _async_clients.get(verify)
+    if client is None:
+        client = httpx.AsyncClient(
+            verify=verify,
+            proxy=config.HTTP_PROXY or None,
+            limits=httpx.Limits(
+                max_connections=config.HTTP_POOL_CONNECTIONS * config.HTTP_POOL_MAXSIZE,
+                max_keepalive_connections=config.HTTP_POOL_MAXSIZE,
+            ),
+        )
+        _async_clients[verify] = client
+    return client
+
+
+async def aclose_async_http_clients():
+    """
+    Closes the asyncio HTTP clients and releases their pooled connections.
+    """
+    while _async_clients:
+        _verify, client = _async_clients.popitem()
+        await client.aclose()
+
+
+HTTP_POOL_IN_USE = metrics.gauge("oeg_http_pool_connections_in_use", "Connections of the shared HTTP session in use per upstream host", ("host",))
+HTTP_POOL_MAX = metrics.gauge("oeg_http_pool_max_connections", "Connection pool size of the shared HTTP session per upstream host", ("host",))
+
+
+def _collect_pool_usage():
+    session = _session
+    if session is None:
+        return
+    for adapter in set(session.adapters.values()):
+        pools = adapter.poolmanager.pools
+        for key in list(pools.keys()):
+            pool = pools.get(key)
+            if pool is None or pool.pool is None:
+                continue
+            host = f"{pool.host}:{pool.port}"
+            HTTP_POOL_MAX.set(pool.pool.maxsize, host=host)
+            HTTP_POOL_IN_USE.set(pool.pool.maxsize - pool.pool.qsize(), host=host)
+
+
+metrics.on_collect(_collect_pool_usage)
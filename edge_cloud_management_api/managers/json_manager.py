@@ -0,0 +1,100 @@
+import datetime
+import json
+import uuid
+from decimal import Decimal
+from connexion.frameworks.flask import FlaskJSONProvider
+from connexion.jsonifier import Jsonifier
+from starlette.responses import JSONResponse
+from edge_cloud_management_api.configs.env_config import config
+
+try:
+    import orjson
+except ImportError:  # optional dependency, see the JSON_BACKEND setting
+    orjson = None
+
+JSON_BACKENDS = ("auto", "orjson", "json")
+
+
+def _default(o):
+    """
+    Encodes the types Connexion's encoder supports on top of plain JSON.
+    """
+    if isinstance(o, datetime.datetime):
+        return o.isoformat("T") if o.tzinfo else o.isoformat("T") + "Z"
+    if isinstance(o, datetime.date):
+        return o.isoformat()
+    if isinstance(o, Decimal):
+        return float(o)
+    if isinstance(o, uuid.UUID):
+        return str(o)
+    raise TypeError(f"Object of type {type(o).__name__} is not JSON serializable")
+
+
+def _orjson_dumpb(obj) -> bytes:
+    return orjson.dumps(obj, default=_default, option=orjson.OPT_NON_STR_KEYS)
+
+
+def _stdlib_dumpb(obj) -> bytes:
+    return json.dumps(obj, default=_default, ensure_ascii=False, separators=(",", ":")).encode()
+
+
+def _select_backend(name: str) -> str:
+    if name not in JSON_BACKENDS:
+        raise ValueError(f"Unknown JSON_BACKEND '{name}', expected one of {', '.join(JSON_BACKENDS)}")
+    if name == "orjson" and orjson is None:
+        raise ValueError("JSON_BACKEND is 'orjson' but orjson is not installed")
+    return "orjson" if name != "json" and orjson is not None else "json"
+
+
+backend = _select_backend(config.JSON_BACKEND)
+dumpb = _orjson_dumpb if backend == "orjson" else _stdlib_dumpb
+loads = orjson.loads if backend == "orjson" else json.loads
+
+
+def dumps(obj) -> str:
+    """
+    Encodes `obj` as compact JSON text with the configured backend.
+    """
+    return dumpb(obj).decode()
+
+
+class GatewayJSONProvider(FlaskJSONProvider):
+    """
+    Flask JSON provider (used by jsonify) encoding with the configured backend, compact and in
+    insertion order, instead of Flask's sorted stdlib encoding.
+    """
+
+    def dumps(self, obj, **kwargs) -> str:
+        return dumps(obj)
+
+    def loads(self, s, **kwargs):
+        return loads(s)
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(dumpb(obj) + b"\n", mimetype=self.mimetype)
+
+
+class GatewayJsonifier(Jsonifier):
+    """
+    Connexion jsonifier (used for the dicts and lists returned by handlers) encoding with the configured
+    backend; Connexion's default for Flask apps indents every response.
+    """
+
+    def dumps(self, data, **kwargs) -> str:
+        return dumps(data) + "\n"
+
+    def loads(self, data):
+        try:
+            return loads(data)
+        except Exception:
+            return data.decode() if isinstance(data, bytes) else data
+
+
+class GatewayJSONResponse(JSONResponse):
+    """
+    Starlette JSON response encoding with the configured backend, for the asyncio handlers.
+    """
+
+    def render(self, content) -> bytes:
+        return dumpb(content)
@@ -7,3 +7,6 @@ logger.setLevel(logging.INFO)
 formatter = logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
 handler = logging.StreamHandler(sys.stdout)
 handler.setFormatter(formatter)
+# Guarded so that re-importing the module (e.g. under a reloader) does not duplicate every line
+if not logger.handlers:
+    logger.addHandler(handler)
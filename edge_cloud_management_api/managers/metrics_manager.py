@@ -0,0 +1,301 @@
+import threading
+import time
+from connexion.middleware.routing import ROUTING_CONTEXT
+from pymongo import monitoring
+
+CONTROLLERS_PREFIX = "edge_cloud_management_api.controllers."
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+INF_BUCKET = 'le="+Inf"'
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: tuple, values: tuple, extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+class _Metric:
+    kind = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: tuple = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values: dict[tuple, object] = {}
+        self._lock = threading.Lock()
+
+    def _key(self, labels: dict) -> tuple:
+        return tuple(str(labels.get(name, "")) for name in self.labelnames)
+
+    def clear(self):
+        with self._lock:
+            self._values.clear()
+
+    def render(self) -> list:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+        with self._lock:
+            items = sorted(self._values.items())
+        for key, value in items:
+            lines.extend(self._render_sample(key, value))
+        return lines
+
+    def _render_sample(self, key: tuple, value) -> list:
+        return [f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}"]
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def inc(self, amount: float = 1, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def set(self, value: float, **labels):
+        """Sets a counter mirrored from a component's own running total (used by collectors)."""
+        with self._lock:
+            self._values[self._key(labels)] = value
+
+
+class Gauge(_Metric):
+    kind = "gauge"
+
+    def set(self, value: float, **labels):
+        with self._lock:
+            self._values[self._key(labels)] = value
+
+    def inc(self, amount: float = 1, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def dec(self, amount: float = 1, **labels):
+        self.inc(-amount, **labels)
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: tuple = (), buckets: tuple = DEFAULT_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value: float, **labels):
+        key = self._key(labels)
+        with self._lock:
+            state = self._values.get(key)
+            if state is None:
+                state = self._values[key] = [[0] * len(self.buckets), 0.0, 0]
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    state[0][i] += 1
+                    break
+            state[1] += value
+            state[2] += 1
+
+    def _render_sample(self, key: tuple, state) -> list:
+        bucket_counts, total, count = state
+        lines, cumulative = [], 0
+        for bound, bucket_count in zip(self.buckets, bucket_counts):
+            cumulative += bucket_count
+            labels = _format_labels(self.labelnames, key, f'le="{_format_value(bound)}"')
+            lines.append(f"{self.name}_bucket{labels} {cumulative}")
+        lines.append(f"{self.name}_bucket{_format_labels(self.labelnames, key, INF_BUCKET)} {count}")
+        lines.append(f"{self.name}_sum{_format_labels(self.labelnames, key)} {_format_value(total)}")
+        lines.append(f"{self.name}_count{_format_labels(self.labelnames, key)} {count}")
+        return lines
+
+
+class MetricsRegistry:
+    """
+    Process-wide registry of the gateway metrics, rendered in the Prometheus text exposition format.
+
+    Request and upstream metrics are recorded as they happen. State owned by other components (circuit
+    breakers, caches, connection pools) is copied into gauges by collectors registered with on_collect(),
+    which run on every scrape.
+
+    Example:
+        UPSTREAM_REQUESTS.inc(upstream="srm", operation="get_app", code="200")
+        body = metrics.render()
+    """
+
+    def __init__(self):
+        self._metrics: dict[str, _Metric] = {}
+        self._collectors = []
+        self._lock = threading.Lock()
+
+    def _add(self, metric: _Metric) -> _Metric:
+        with self._lock:
+            return self._metrics.setdefault(metric.name, metric)
+
+    def counter(self, name: str, documentation: str, labelnames: tuple = ()) -> Counter:
+        return self._add(Counter(name, documentation, labelnames))
+
+    def gauge(self, name: str, documentation: str, labelnames: tuple = ()) -> Gauge:
+        return self._add(Gauge(name, documentation, labelnames))
+
+    def histogram(self, name: str, documentation: str, labelnames: tuple = (), buckets: tuple = DEFAULT_BUCKETS) -> Histogram:
+        return self._add(Histogram(name, documentation, labelnames, buckets))
+
+    def on_collect(self, collector):
+        """
+        Registers a callable run before every render to refresh the gauges it owns.
+        """
+        self._collectors.append(collector)
+
+    def render(self) -> str:
+        for collector in list(self._collectors):
+            try:
+                collector()
+            except Exception:
+                # A failing collector must not break the scrape of every other metric
+                pass
+        lines = []
+        for metric in list(self._metrics.values()):
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+metrics = MetricsRegistry()
+
+HTTP_REQUESTS = metrics.counter("oeg_http_requests_total", "API requests by operation and status code", ("operation", "code"))
+HTTP_REQUEST_DURATION = metrics.histogram("oeg_http_request_duration_seconds", "API request latency by operation", ("operation",))
+HTTP_REQUESTS_IN_FLIGHT = metrics.gauge("oeg_http_requests_in_flight", "API requests being served by operation", ("operation",))
+
+UPSTREAM_REQUESTS = metrics.counter(
+    "oeg_upstream_requests_total", "Upstream calls by upstream, operation and status code (or error / circuit_open)", ("upstream", "operation", "code"))
+UPSTREAM_REQUEST_DURATION = metrics.histogram(
+    "oeg_upstream_request_duration_seconds", "Upstream call latency by upstream and operation", ("upstream", "operation"))
+UPSTREAM_IN_FLIGHT = metrics.gauge("oeg_upstream_requests_in_flight", "Upstream calls waiting for a response", ("upstream",))
+
+MONGO_COMMANDS = metrics.counter("oeg_mongo_commands_total", "MongoDB commands by command, collection and outcome", ("command", "collection", "outcome"))
+MONGO_COMMAND_DURATION = metrics.histogram("oeg_mongo_command_duration_seconds", "MongoDB command latency", ("command", "collection"))
+MONGO_POOL_CHECKED_OUT = metrics.gauge("oeg_mongo_pool_connections_checked_out", "MongoDB pool connections in use", ("address",))
+
+
+def observe_upstream(upstream: str, operation: str, code, started: float | None = None):
+    """
+    Records one upstream attempt that ended with `code`; its latency is observed when it was sent at
+    `started` (time.perf_counter()).
+    """
+    UPSTREAM_REQUESTS.inc(upstream=upstream, operation=operation, code=code)
+    if started is not None:
+        UPSTREAM_REQUEST_DURATION.observe(time.perf_counter() - started, upstream=upstream, operation=operation)
+
+
+class MongoCommandMetrics(monitoring.CommandListener):
+    """
+    Times every MongoDB command sent by the gateway's clients (storage_service and async_storage_service).
+    """
+
+    def __init__(self):
+        self._collections: dict = {}
+
+    def started(self, event):
+        collection = event.command.get(event.command_name) if hasattr(event.command, "get") else None
+        self._collections[(event.connection_id, event.request_id)] = collection if isinstance(collection, str) else ""
+
+    def _finish(self, event, outcome: str):
+        collection = self._collections.pop((event.connection_id, event.request_id), "")
+        MONGO_COMMANDS.inc(command=event.command_name, collection=collection, outcome=outcome)
+        MONGO_COMMAND_DURATION.observe(event.duration_micros / 1e6, command=event.command_name, collection=collection)
+
+    def succeeded(self, event):
+        self._finish(event, "ok")
+
+    def failed(self, event):
+        self._finish(event, "error")
+
+
+class MongoPoolMetrics(monitoring.ConnectionPoolListener):
+    """
+    Tracks the MongoDB pool connections checked out per server.
+    """
+
+    def connection_checked_out(self, event):
+        MONGO_POOL_CHECKED_OUT.inc(address=f"{event.address[0]}:{event.address[1]}")
+
+    def connection_checked_in(self, event):
+        MONGO_POOL_CHECKED_OUT.dec(address=f"{event.address[0]}:{event.address[1]}")
+
+    def pool_created(self, event):
+        pass
+
+    def pool_ready(self, event):
+        pass
+
+    def pool_cleared(self, event):
+        pass
+
+    def pool_closed(self, event):
+        pass
+
+    def connection_created(self, event):
+        pass
+
+    def connection_ready(self, event):
+        pass
+
+    def connection_closed(self, event):
+        pass
+
+    def connection_check_out_started(self, event):
+        pass
+
+    def connection_check_out_failed(self, event):
+        pass
+
+
+def _operation_label(scope) -> str:
+    operation_id = scope.get("extensions", {}).get(ROUTING_CONTEXT, {}).get("operation_id")
+    if not operation_id:
+        return "unmatched"
+    return operation_id.removeprefix(CONTROLLERS_PREFIX)
+
+
+class RequestMetricsMiddleware:
+    """
+    ASGI middleware recording request count, latency and in-flight requests per Connexion operationId.
+    It must run after Connexion's routing middleware, which resolves the operation.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        operation = _operation_label(scope)
+        status = {"code": 500}
+
+        async def send_with_status(message):
+            if message["type"] == "http.response.start":
+                status["code"] = message["status"]
+            await send(message)
+
+        HTTP_REQUESTS_IN_FLIGHT.inc(operation=operation)
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        except Exception as e:
+            # HTTP exceptions are turned into responses by Connexion's outer exception middleware
+            status["code"] = getattr(e, "status_code", 500)
+            raise
+        finally:
+            HTTP_REQUESTS_IN_FLIGHT.dec(operation=operation)
+            HTTP_REQUESTS.inc(operation=operation, code=status["code"])
+            HTTP_REQUEST_DURATION.observe(time.perf_counter() - started, operation=operation)
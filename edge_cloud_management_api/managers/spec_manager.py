@@ -0,0 +1,65 @@
+import hashlib
+import os
+import pickle
+import tempfile
+from pathlib import Path
+import yaml
+from edge_cloud_management_api.configs.env_config import config
+from edge_cloud_management_api.managers.log_manager import logger
+
+# libyaml parses the specification several times faster than the pure-Python loader Connexion uses
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def _cache_path(spec_path: Path, digest: str) -> Path:
+    cache_dir = Path(config.SPEC_CACHE_DIR) if config.SPEC_CACHE_DIR else spec_path.parent / "__pycache__"
+    return cache_dir / f"{spec_path.stem}.{digest[:16]}.pickle"
+
+
+def _write_cache(path: Path, spec: dict):
+    """
+    Writes the cache file atomically, so that concurrently starting workers never read a partial file.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump(spec, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+def load_specification(spec_path: Path) -> dict:
+    """
+    Returns the parsed OpenAPI specification, from a pickle cached next to it when the file is unchanged.
+
+    Parsing the YAML dominates application startup; the cache is keyed by the SHA-256 of the file, so
+    an edited specification is parsed again. Like bytecode caches, the cache is best effort: a missing,
+    unreadable or unwritable cache only costs a parse.
+
+    Example:
+        app.add_api(load_specification(Path("specification/openapi.yaml")), resolver=resolver)
+    """
+    contents = spec_path.read_bytes()
+    cache_path = _cache_path(spec_path, hashlib.sha256(contents).hexdigest())
+    try:
+        with open(cache_path, "rb") as f:
+            return pickle.load(f)
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        logger.warning(f"Ignoring unreadable specification cache {cache_path}: {e}")
+
+    spec = yaml.load(contents, Loader=_YamlLoader)
+    try:
+        _write_cache(cache_path, spec)
+    except OSError as e:
+        logger.warning(f"Could not write specification cache {cache_path}: {e}")
+    return spec
+
+
+if __name__ == "__main__":
+    # Precompiles the cache, e.g. while building the container image
+    load_specification(Path(__file__).resolve().parent.parent / "specification" / "openapi.yaml")
@@ -0,0 +1,205 @@
+import contextvars
+import json
+import re
+import secrets
+import threading
+import time
+from contextlib import contextmanager
+from connexion.middleware.routing import ROUTING_CONTEXT
+from edge_cloud_management_api.configs.env_config import config
+
+TRACEPARENT = "traceparent"
+CORRELATOR = "x-correlator"
+TRACE_HEADERS = frozenset({TRACEPARENT, CORRELATOR})
+_TRACEPARENT_RE = re.compile(r"^[0-9a-f]{2}-([0-9a-f]{32})-([0-9a-f]{16})-[0-9a-f]{2}$")
+
+
+class TraceContext:
+    """Identifies a span for propagation: its trace id, span id and the caller's x-correlator."""
+
+    __slots__ = ("trace_id", "span_id", "correlator")
+
+    def __init__(self, trace_id: str, span_id: str, correlator: str | None = None):
+        self.trace_id = trace_id
+        self.span_id = span_id
+        self.correlator = correlator
+
+    def headers(self) -> dict:
+        headers = {TRACEPARENT: f"00-{self.trace_id}-{self.span_id}-01"}
+        if self.correlator:
+            headers[CORRELATOR] = self.correlator
+        return headers
+
+
+def parse_trace_headers(headers: dict) -> TraceContext | None:
+    """
+    Returns the context carried by traceparent / x-correlator headers (lower-case keys), or None.
+    """
+    match = _TRACEPARENT_RE.match((headers.get(TRACEPARENT) or "").strip().lower())
+    correlator = headers.get(CORRELATOR)
+    if match:
+        return TraceContext(match.group(1), match.group(2), correlator)
+    if correlator:
+        return TraceContext(secrets.token_hex(16), "", correlator)
+    return None
+
+
+class Span:
+    """
+    One timed operation of a trace, exported in an OpenTelemetry (OTLP JSON) compatible shape.
+    """
+
+    def __init__(self, name: str, kind: str, parent: TraceContext | None, attributes: dict | None = None):
+        self.name = name
+        self.kind = kind
+        self.context = TraceContext(
+            parent.trace_id if parent else secrets.token_hex(16),
+            secrets.token_hex(8),
+            parent.correlator if parent else None,
+        )
+        self.parent_span_id = parent.span_id if parent else ""
+        self.attributes = dict(attributes or {})
+        self.start_ns = time.time_ns()
+        self.end_ns = None
+        self.status = "OK"
+        self.status_message = ""
+
+    def set_attribute(self, key: str, value):
+        self.attributes[key] = value
+
+    def set_error(self, message: str):
+        self.status = "ERROR"
+        self.status_message = message
+
+    def to_dict(self) -> dict:
+        return {
+            "traceId": self.context.trace_id,
+            "spanId": self.context.span_id,
+            "parentSpanId": self.parent_span_id,
+            "name": self.name,
+            "kind": f"SPAN_KIND_{self.kind.upper()}",
+            "startTimeUnixNano": self.start_ns,
+            "endTimeUnixNano": self.end_ns,
+            "durationMs": round((self.end_ns - self.start_ns) / 1e6, 3) if self.end_ns else None,
+            "attributes": self.attributes,
+            "status": {"code": f"STATUS_CODE_{self.status}", "message": self.status_message},
+        }
+
+
+class JsonlFileExporter:
+    """Appends every finished span as one JSON line to a file, for local inspection."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+
+    def export(self, span: Span):
+        line = json.dumps(span.to_dict(), default=str) + "\n"
+        with self._lock, open(self.path, "a", encoding="utf-8") as f:
+            f.write(line)
+
+
+class InMemoryExporter:
+    """Keeps finished spans in a list; used by tests."""
+
+    def __init__(self):
+        self.spans: list[Span] = []
+
+    def export(self, span: Span):
+        self.spans.append(span)
+
+
+_current: contextvars.ContextVar[Span | None] = contextvars.ContextVar("oeg_current_span", default=None)
+
+
+class Tracer:
+    """
+    Opens spans for API requests, upstream calls and job steps, and hands finished spans to an exporter.
+
+    The active span lives in a context variable, so it follows a request through asyncio tasks and
+    asyncio.to_thread; code that starts threads itself copies the context (see fan_out) or passes a
+    TraceContext explicitly (see the job engine). Without an exporter spans are still created, so that
+    traceparent and x-correlator keep propagating to SRM and the Federation Manager.
+
+    Example:
+        with tracer.span("deploy_application", attributes={"zoneId": zone_id}):
+            ...
+    """
+
+    def __init__(self, exporter=None):
+        self.exporter = exporter
+
+    @contextmanager
+    def span(self, name: str, kind: str = "internal", attributes: dict | None = None, parent: TraceContext | None = None):
+        current = _current.get()
+        span = Span(name, kind, parent or (current.context if current else None), attributes)
+        token = _current.set(span)
+        try:
+            yield span
+        except BaseException as e:
+            span.set_error(str(e) or type(e).__name__)
+            raise
+        finally:
+            _current.reset(token)
+            span.end_ns = time.time_ns()
+            if self.exporter is not None:
+                try:
+                    self.exporter.export(span)
+                except Exception:
+                    pass
+
+
+def current_context() -> TraceContext | None:
+    """Returns the context of the active span, if any."""
+    span = _current.get()
+    return span.context if span else None
+
+
+def trace_headers() -> dict:
+    """Returns the traceparent / x-correlator headers to send with an upstream call made now."""
+    context = current_context()
+    return context.headers() if context else {}
+
+
+def with_trace_headers(kwargs: dict) -> dict:
+    """Returns request kwargs whose headers also carry the active trace context."""
+    headers = trace_headers()
+    if not headers:
+        return kwargs
+    return {**kwargs, "headers": {**(kwargs.get("headers") or {}), **headers}}
+
+
+tracer = Tracer(JsonlFileExporter(config.TRACE_EXPORT_FILE) if config.TRACE_EXPORT_FILE else None)
+
+
+class RequestTracingMiddleware:
+    """
+    ASGI middleware opening a server span per API request, named after its Connexion operationId.
+    It continues the caller's traceparent, keeps its x-correlator and echoes the x-correlator back.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        headers = {key.decode("latin-1").lower(): value.decode("latin-1") for key, value in scope.get("headers", [])}
+        parent = parse_trace_headers(headers)
+        operation_id = scope.get("extensions", {}).get(ROUTING_CONTEXT, {}).get("operation_id") or scope.get("path", "")
+        attributes = {"http.method": scope.get("method"), "http.target": scope.get("path")}
+
+        with tracer.span(operation_id, kind="server", attributes=attributes, parent=parent) as span:
+            async def send_with_correlator(message):
+                if message["type"] == "http.response.start":
+                    span.set_attribute("http.status_code", message["status"])
+                    if message["status"] >= 500:
+                        span.set_error(f"HTTP {message['status']}")
+                    if span.context.correlator:
+                        message.setdefault("headers", [])
+                        message["headers"] = list(message["headers"]) + [(CORRELATOR.encode(), span.context.correlator.encode("latin-1"))]
+                await send(message)
+
+            await self.app(scope, receive, send_with_correlator)
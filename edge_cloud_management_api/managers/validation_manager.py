@@ -0,0 +1,101 @@
+import threading
+from functools import lru_cache
+from typing import Any, NamedTuple
+from pydantic import TypeAdapter, ValidationError
+from edge_cloud_management_api.managers.log_manager import logger
+
+
+@lru_cache(maxsize=None)
+def type_adapter(tp) -> TypeAdapter:
+    """
+    Returns a TypeAdapter for `tp`, built once per type.
+
+    Building an adapter compiles its validator and serializer, which costs far more than using them, so
+    adapters are shared instead of being created per request. A `list[Model]` adapter validates and
+    serializes a whole list in one pydantic-core call instead of one model at a time.
+
+    Example:
+        zones = type_adapter(list[EdgeCloudZone]).validate_python(raw_zones)
+    """
+    return TypeAdapter(tp)
+
+
+class Snapshot(NamedTuple):
+    """One validated version of the data: plain Python objects and their JSON encoding."""
+
+    python: Any
+    json: bytes
+
+
+class ValidatedSnapshot:
+    """
+    Keeps the last validated version of an upstream list, so unchanged data is not validated again.
+
+    `update` compares the raw list with the one validated last; only when it differs is the list
+    validated (through a cached TypeAdapter) and dumped both to Python objects and to JSON bytes, each
+    in a single call. The snapshot is replaced as a whole, so readers always see matching Python and JSON.
+
+    With `skip_invalid`, items that fail validation are logged and left out instead of failing the whole
+    list, so one bad record cannot take the listing down; the remaining items are still validated in one call.
+
+    Example:
+        snapshot = ValidatedSnapshot(list[EdgeCloudZone])
+        snapshot.update(raw_zones)
+        body = snapshot.current.json
+    """
+
+    def __init__(self, tp, skip_invalid: bool = False):
+        self.adapter = type_adapter(tp)
+        self.skip_invalid = skip_invalid
+        self.current: Snapshot | None = None
+        self._raw: list | None = None
+        self._lock = threading.Lock()
+        self.validations = 0
+        self.reuses = 0
+        self.skipped = 0
+
+    def _validate(self, raw: list):
+        try:
+            return self.adapter.validate_python(raw)
+        except ValidationError as e:
+            if not self.skip_invalid:
+                raise
+            errors: dict[int, list[str]] = {}
+            for error in e.errors():
+                if error["loc"] and isinstance(error["loc"][0], int):
+                    errors.setdefault(error["loc"][0], []).append(f"{'.'.join(map(str, error['loc'][1:]))}: {error['msg']}")
+            if not errors:
+                raise
+            for index, messages in errors.items():
+                logger.warning(f"Skipping invalid item {index} of {len(raw)}: {'; '.join(messages)}")
+            self.skipped += len(errors)
+            return self.adapter.validate_python([item for index, item in enumerate(raw) if index not in errors])
+
+    def update(self, raw: list) -> bool:
+        """
+        Validates `raw` unless it equals the list validated last; returns whether the snapshot changed.
+        Raises pydantic.ValidationError (keeping the previous snapshot) when `raw` is invalid and invalid
+        items are not skipped.
+        """
+        with self._lock:
+            if self.current is not None and raw == self._raw:
+                self.reuses += 1
+                return False
+            validated = self._validate(raw)
+            self.current = Snapshot(self.adapter.dump_python(validated), self.adapter.dump_json(validated))
+            # Shallow copies, so a caller mutating its list or dicts later cannot fake an unchanged upstream
+            self._raw = [dict(item) if isinstance(item, dict) else item for item in raw]
+            self.validations += 1
+            return True
+
+    def json_for(self, python) -> bytes | None:
+        """
+        Returns the JSON bytes of the snapshot if `python` is its Python version, else None.
+        """
+        current = self.current
+        return current.json if current is not None and current.python is python else None
+
+    def clear(self):
+        with self._lock:
+            self.current = None
+            self._raw = None
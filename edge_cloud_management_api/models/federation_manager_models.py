@@ -1,4 +1,4 @@
-from pydantic import BaseModel #Field
+from pydantic import BaseModel, RootModel #Field
 from typing import List, Optional
 
 
@@ -7,8 +7,8 @@ class MobileNetworkIds(BaseModel):
     mcc: str
 
 
-class FixedNetworkIds(BaseModel):
-    __root__: List[str]
+class FixedNetworkIds(RootModel[List[str]]):
+    pass
 
 
 class CallbackCredentials(BaseModel):
@@ -32,21 +32,21 @@ class ZoneDetails(BaseModel):
 
 class FederationRequestData(BaseModel):
     origOPFederationId: str
-    origOPCountryCode: Optional[str]
-    origOPMobileNetworkCodes: Optional[MobileNetworkIds]
-    origOPFixedNetworkCodes: Optional[List[str]]
+    origOPCountryCode: Optional[str] = None
+    origOPMobileNetworkCodes: Optional[MobileNetworkIds] = None
+    origOPFixedNetworkCodes: Optional[List[str]] = None
     initialDate: str
     partnerStatusLink: str
-    partnerCallbackCredentials: Optional[CallbackCredentials]
+    partnerCallbackCredentials: Optional[CallbackCredentials] = None
 
 
 class FederationResponseData(BaseModel):
     federationContextId: str
     partnerOPFederationId: str
-    partnerOPCountryCode: Optional[str]
-    partnerOPMobileNetworkCodes: Optional[MobileNetworkIds]
-    partnerOPFixedNetworkCodes: Optional[List[str]]
-    offeredAvailabilityZones: Optional[List[ZoneDetails]]
+    partnerOPCountryCode: Optional[str] = None
+    partnerOPMobileNetworkCodes: Optional[MobileNetworkIds] = None
+    partnerOPFixedNetworkCodes: Optional[List[str]] = None
+    offeredAvailabilityZones: Optional[List[ZoneDetails]] = None
     platformCaps: List[str]
-    edgeDiscoveryServiceEndPoint: Optional[ServiceEndpoint]
-    lcmServiceEndPoint: Optional[ServiceEndpoint]
+    edgeDiscoveryServiceEndPoint: Optional[ServiceEndpoint] = None
+    lcmServiceEndPoint: Optional[ServiceEndpoint] = None
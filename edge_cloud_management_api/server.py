@@ -0,0 +1,112 @@
+"""
+Production entry point: serves the gateway with several worker processes.
+
+With gunicorn installed, a gunicorn master preloads the application once and forks SERVER_WORKERS
+uvicorn workers from it; each worker re-initializes the state it must not share with its siblings
+(see reset_after_fork). Without gunicorn, uvicorn's own supervisor starts the workers, each importing
+the application itself. In both cases a worker stops accepting connections on SIGTERM and lets
+in-flight requests finish for up to SERVER_GRACEFUL_TIMEOUT seconds before its lifespan shuts the
+job workers and connection pools down.
+
+Usage:
+    python -m edge_cloud_management_api.server
+
+`python -m edge_cloud_management_api` still starts the single-process development server.
+"""
+import importlib.util
+from edge_cloud_management_api.configs.env_config import config
+from edge_cloud_management_api.managers.log_manager import logger
+
+APP_FACTORY = "edge_cloud_management_api.app:get_app_instance"
+
+
+def reset_after_fork():
+    """
+    Drops the connection pools, clients and job worker identity a worker inherited from the preloading
+    process, so that no socket or lease is shared between workers. Runs in every forked worker.
+    """
+    from edge_cloud_management_api.managers.db_manager import reset_mongo_clients
+    from edge_cloud_management_api.managers.http_manager import reset_http_clients
+    from edge_cloud_management_api.services.client_registry import registry
+    from edge_cloud_management_api.services.job_engine import job_engine
+
+    reset_mongo_clients()
+    reset_http_clients()
+    registry.reset()
+    job_engine.reset_after_fork()
+
+
+def _gunicorn_worker_class() -> str:
+    if importlib.util.find_spec("uvicorn_worker") is not None:
+        return "uvicorn_worker.UvicornWorker"
+    return "uvicorn.workers.UvicornWorker"
+
+
+def gunicorn_options() -> dict:
+    """
+    Returns the gunicorn settings derived from the SERVER_* configuration.
+    """
+    return {
+        "bind": f"{config.SERVER_HOST}:{config.SERVER_PORT}",
+        "workers": config.SERVER_WORKERS,
+        "worker_class": _gunicorn_worker_class(),
+        "preload_app": True,
+        "keepalive": config.SERVER_KEEPALIVE,
+        "backlog": config.SERVER_BACKLOG,
+        "graceful_timeout": config.SERVER_GRACEFUL_TIMEOUT,
+        "timeout": config.SERVER_WORKER_TIMEOUT,
+        "max_requests": config.SERVER_MAX_REQUESTS,
+        "max_requests_jitter": config.SERVER_MAX_REQUESTS // 10,
+        "post_fork": lambda server, worker: reset_after_fork(),
+    }
+
+
+def uvicorn_options() -> dict:
+    """
+    Returns the uvicorn settings derived from the SERVER_* configuration.
+    """
+    return {
+        "host": config.SERVER_HOST,
+        "port": config.SERVER_PORT,
+        "workers": config.SERVER_WORKERS,
+        "factory": True,
+        "backlog": config.SERVER_BACKLOG,
+        "timeout_keep_alive": config.SERVER_KEEPALIVE,
+        "timeout_graceful_shutdown": config.SERVER_GRACEFUL_TIMEOUT,
+        "limit_max_requests": config.SERVER_MAX_REQUESTS or None,
+    }
+
+
+def serve_gunicorn():
+    from gunicorn.app.base import BaseApplication
+
+    class GatewayApplication(BaseApplication):
+        def load_config(self):
+            for key, value in gunicorn_options().items():
+                self.cfg.set(key, value)
+
+        def load(self):
+            from edge_cloud_management_api.app import get_app_instance
+
+            return get_app_instance()
+
+    GatewayApplication().run()
+
+
+def serve_uvicorn():
+    import uvicorn
+
+    uvicorn.run(APP_FACTORY, **uvicorn_options())
+
+
+def main():
+    if importlib.util.find_spec("gunicorn") is not None:
+        logger.info(f"Serving with gunicorn: {config.SERVER_WORKERS} preloaded worker(s)")
+        serve_gunicorn()
+    else:
+        logger.info(f"gunicorn is not installed, serving with uvicorn: {config.SERVER_WORKERS} worker(s)")
+        serve_uvicorn()
+
+
+if __name__ == "__main__":
+    main()
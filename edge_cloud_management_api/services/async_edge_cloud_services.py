@@ -0,0 +1,233 @@
+import httpx
+from edge_cloud_management_api.configs.env_config import config
+from edge_cloud_management_api.managers.http_manager import get_async_http_client
+from edge_cloud_management_api.managers.trace_manager import with_trace_headers
+from edge_cloud_management_api.services.circuit_breaker import get_upstream
+from edge_cloud_management_api.services.edge_cloud_services import PiEdgeAPIClient
+from edge_cloud_management_api.services.manifest_cache import manifest_cache
+from edge_cloud_management_api.services.single_flight import AsyncSingleFlight
+
+TIMEOUT_ERROR = "The request to the external API timed out. Please try again later."
+CONNECTION_ERROR = "Failed to connect to the external API service. Service might be unavailable."
+
+
+class AsyncPiEdgeAPIClient:
+    """
+    Asyncio counterpart of PiEdgeAPIClient, used when the gateway runs in async mode.
+    Methods return the same payloads and error dictionaries as the synchronous client.
+    """
+
+    def __init__(self, base_url, username, password, client=None, upstream=None):
+        self.base_url = base_url
+        self.username = username
+        self.password = password
+        self.token = None
+        self.client = client or get_async_http_client(verify=False)
+        self.upstream = upstream or get_upstream("srm")
+        self.flights = AsyncSingleFlight()
+
+    def _timeout(self, operation: str) -> httpx.Timeout:
+        read_timeout = PiEdgeAPIClient.READ_TIMEOUTS.get(operation, config.SRM_READ_TIMEOUT)
+        return httpx.Timeout(read_timeout, connect=config.SRM_CONNECT_TIMEOUT)
+
+    def _get_headers(self):
+        return {"Content-Type": "application/json"}
+
+    async def _request(self, method: str, url: str, operation: str, **kwargs) -> httpx.Response:
+        kwargs.setdefault("timeout", self._timeout(operation))
+        kwargs.setdefault("headers", self._get_headers())
+
+        def send():
+            return self.upstream.acall(lambda: self.client.request(method, url, **with_trace_headers(kwargs)), method, operation=operation)
+
+        if method != "GET":
+            return await send()
+        # Concurrent identical GETs share one upstream call
+        return await self.flights.do((url, tuple(sorted(kwargs["headers"].items()))), send)
+
+    async def _call(self, method: str, url: str, operation: str, as_text: bool = False, **kwargs):
+        """
+        Sends a request and maps transport and HTTP errors to the error dictionaries used by PiEdgeAPIClient.
+        """
+        try:
+            response = await self._request(method, url, operation, **kwargs)
+            response.raise_for_status()
+            return response.text if as_text else response.json()
+        except httpx.TimeoutException:
+            return {"error": TIMEOUT_ERROR}
+        except httpx.TransportError:
+            return {"error": CONNECTION_ERROR}
+        except httpx.HTTPStatusError as http_err:
+            return {
+                "error": f"HTTP error occurred: {http_err}.",
+                "status_code": http_err.response.status_code,
+            }
+
+    async def _passthrough(self, method: str, url: str, operation: str, **kwargs):
+        """
+        Sends a request that raises on failure and returns the JSON body on 200 or the raw content otherwise.
+        """
+        response = await self._request(method, url, operation, **kwargs)
+        response.raise_for_status()
+        if response.status_code == 200:
+            return response.json()
+        return response.content
+
+    async def _stream(self, url: str, operation: str) -> httpx.Response:
+        """
+        Sends a GET whose body is left unread, so that it can be relayed to the caller without being parsed
+        (see services.passthrough). Streamed calls bypass single-flight. Raises for non-2xx responses.
+        """
+        kwargs = {"headers": self._get_headers(), "timeout": self._timeout(operation)}
+        response = await self.upstream.acall(
+            lambda: self.client.send(self.client.build_request("GET", url, **with_trace_headers(kwargs)), stream=True),
+            "GET",
+            operation=operation,
+        )
+        if response.is_error:
+            await response.aclose()
+            response.raise_for_status()
+        return response
+
+    async def get_service_functions_catalogue(self):
+        result = await self._call("GET", f"{self.base_url}/serviceFunction", "get_service_functions_catalogue")
+        if isinstance(result, list) or (isinstance(result, dict) and "error" in result):
+            return result
+        return {"error": "Unexpected response from Service Resource manager"}
+
+    async def stream_service_functions_catalogue(self):
+        """
+        Like get_service_functions_catalogue(), but returns the SRM response with its body unread.
+        """
+        try:
+            return await self._stream(f"{self.base_url}/serviceFunction", "get_service_functions_catalogue")
+        except httpx.TimeoutException:
+            return {"error": TIMEOUT_ERROR}
+        except httpx.TransportError:
+            return {"error": CONNECTION_ERROR}
+        except httpx.HTTPStatusError as http_err:
+            return {
+                "error": f"HTTP error occurred: {http_err}.",
+                "status_code": http_err.response.status_code,
+            }
+
+    async def submit_app(self, body):
+        result = await self._call("POST", f"{self.base_url}/serviceFunction", "submit_app", json=body)
+        if not (isinstance(result, dict) and "error" in result):
+            for app_id in {body.get("appId"), result.get("appId") if isinstance(result, dict) else None} - {None}:
+                manifest_cache.invalidate(app_id)
+        return result
+
+    async def get_app(self, appId):
+        cached, fresh = manifest_cache.lookup(appId)
+        if fresh:
+            return cached.app
+        headers = {**self._get_headers(), **manifest_cache.conditional_headers(cached)}
+        try:
+            response = await self._request("GET", f"{self.base_url}/serviceFunction/{appId}", "get_app", headers=headers)
+            if response.status_code == 304 and cached is not None:
+                return manifest_cache.revalidated(appId, cached)
+            response.raise_for_status()
+            app = response.json()
+            if isinstance(app, dict):
+                return manifest_cache.store(appId, app, response.headers.get("ETag"), response.headers.get("Last-Modified"))
+            return app
+        except httpx.TimeoutException:
+            return {"error": TIMEOUT_ERROR}
+        except httpx.TransportError:
+            return {"error": CONNECTION_ERROR}
+        except httpx.HTTPStatusError as http_err:
+            return {
+                "error": f"HTTP error occurred: {http_err}.",
+                "status_code": http_err.response.status_code,
+            }
+
+    async def delete_app(self, appId: str):
+        manifest_cache.invalidate(appId)
+        return await self._call("DELETE", f"{self.base_url}/serviceFunction/{appId}", "delete_app", as_text=True)
+
+    async def deploy_service_function(self, data: dict):
+        return await self._call("POST", f"{self.base_url}/deployedServiceFunction", "deploy_service_function", json=data)
+
+    async def get_app_instances(self):
+        return await self._call("GET", f"{self.base_url}/deployedServiceFunction", "get_app_instances")
+
+    async def delete_app_instance(self, app_instance_id: str):
+        try:
+            response = await self._request("DELETE", f"{self.base_url}/deployedServiceFunction/{app_instance_id}", "delete_app_instance")
+            response.raise_for_status()
+            return response
+        except httpx.TimeoutException:
+            return {"error": TIMEOUT_ERROR}
+        except httpx.TransportError:
+            return {"error": CONNECTION_ERROR}
+        except httpx.HTTPStatusError as http_err:
+            return {
+                "error": f"HTTP error occurred: {http_err}.",
+                "status_code": http_err.response.status_code,
+            }
+
+    async def edge_cloud_zones(self):
+        response = await self._request("GET", f"{self.base_url}/node", "edge_cloud_zones")
+        response.raise_for_status()
+        nodes = response.json()
+        if not nodes:
+            raise ValueError("No edge nodes found")
+        return nodes
+
+    async def edge_cloud_zone_details(self, zone_id):
+        response = await self._request("GET", f"{self.base_url}/node/{zone_id}", "edge_cloud_zone_details")
+        response.raise_for_status()
+        nodes = response.json()
+        if not nodes:
+            raise ValueError("No edge nodes found")
+        return nodes
+
+    async def create_qod_session(self, body: dict):
+        return await self._passthrough("POST", f"{self.base_url}/sessions", "create_qod_session", json=body)
+
+    async def get_qod_session(self, sessionId: str):
+        return await self._passthrough("GET", f"{self.base_url}/sessions/{sessionId}", "get_qod_session")
+
+    async def stream_qod_session(self, sessionId: str) -> httpx.Response:
+        return await self._stream(f"{self.base_url}/sessions/{sessionId}", "get_qod_session")
+
+    async def delete_qod_session(self, sessionId: str):
+        response = await self._request("DELETE", f"{self.base_url}/sessions/{sessionId}", "delete_qod_session")
+        response.raise_for_status()
+        if response.status_code == 200:
+            return response.text
+        return response.content
+
+    async def create_traffic_influence_resource(self, body_dict):
+        return await self._passthrough("POST", f"{self.base_url}/traffic-influences", "create_traffic_influence_resource", json=body_dict)
+
+    async def delete_traffic_influence_resource(self, id: str):
+        return await self._passthrough("DELETE", f"{self.base_url}/traffic-influences/{id}", "delete_traffic_influence_resource")
+
+    async def get_traffic_influence_resource(self, id: str):
+        return await self._passthrough("GET", f"{self.base_url}/traffic-influences/{id}", "get_traffic_influence_resource")
+
+    async def get_all_traffic_influence_resources(self):
+        return await self._passthrough("GET", f"{self.base_url}/traffic-influences/", "get_all_traffic_influence_resources")
+
+    async def stream_traffic_influence_resources(self) -> httpx.Response:
+        return await self._stream(f"{self.base_url}/traffic-influences/", "get_all_traffic_influence_resources")
+
+
+class AsyncPiEdgeAPIClientFactory:
+    """
+    Factory class to create instances of AsyncPiEdgeAPIClient.
+    """
+
+    def __init__(self):
+        self.default_base_url = config.SRM_HOST
+        self.default_username = config.PI_EDGE_USERNAME
+        self.default_password = config.PI_EDGE_PASSWORD
+
+    def create_pi_edge_api_client(self, base_url=None, username=None, password=None):
+        return AsyncPiEdgeAPIClient(
+            base_url=base_url or self.default_base_url,
+            username=username or self.default_username,
+            password=password or self.default_password,
+        )
@@ -0,0 +1,178 @@
+import httpx
+from edge_cloud_management_api.configs.env_config import config
+from edge_cloud_management_api.services.circuit_breaker import get_upstream
+from edge_cloud_management_api.managers.http_manager import get_async_http_client
+from edge_cloud_management_api.managers.log_manager import logger
+from edge_cloud_management_api.managers.trace_manager import trace_headers
+from edge_cloud_management_api.services.async_storage_service import delete_fed, delete_partner_zones
+
+
+class AsyncFederationManagerClient:
+    """
+    Asyncio counterpart of FederationManagerClient, used when the gateway runs in async mode.
+    Methods return the same payloads, status codes and error dictionaries as the synchronous client.
+    """
+
+    def __init__(self, base_url=None, client=None, upstream=None):
+        self.base_url = base_url or config.FEDERATION_MANAGER_HOST
+        self.partner_root = config.PARTNER_API_ROOT
+        self.client = client or get_async_http_client()
+        self.upstream = upstream or get_upstream("federation_manager")
+
+    def _get_headers(self, token):
+        headers = {}
+        if token is not None:
+            headers['Authorization'] = 'Bearer ' + token
+        headers['X-Partner-API-Root'] = self.partner_root
+        headers['X-Internal'] = 'true'
+        headers['Content-Type'] = 'application/json'
+        headers['Accept'] = 'application/json'
+        return headers
+
+    async def _request(self, method: str, url: str, label: str, token: str, timeout: float = 10, **kwargs):
+        """
+        Sends a request to the Federation Manager through its circuit breaker.
+        """
+        return await self.upstream.acall(
+            lambda: self.client.request(method, url, headers={**self._get_headers(token), **trace_headers()}, timeout=timeout, **kwargs), method, operation=label)
+
+    @staticmethod
+    def _body(payload):
+        # Pre-encoded JSON bodies (see gsma_translation) are sent as they are
+        return {'content': payload} if isinstance(payload, bytes) else {'json': payload}
+
+    async def _establishment_call(self, method: str, url: str, label: str, token: str, timeout: float = 10, **kwargs):
+        """
+        Federation establishment calls return a (payload, status code) tuple.
+        """
+        try:
+            response = await self._request(method, url, label, token, timeout=timeout, **kwargs)
+            response.raise_for_status()
+            return response.json(), 200
+        except httpx.TimeoutException:
+            logger.error(f"{label} timed out")
+            return {"error": "Request timed out"}, 408
+        except httpx.TransportError:
+            logger.error(f"{label} connection error")
+            return {"error": "Connection error"}, 504
+        except httpx.HTTPStatusError as http_err:
+            logger.error(f"{label} HTTP error: {http_err}")
+            return {'Error': http_err.response.json().get('detail')}, http_err.response.status_code
+        except Exception as e:
+            logger.error(f"{label} unexpected error: {e}")
+            return {"error": str(e)}, 500
+
+    async def _call(self, method: str, url: str, label: str, token: str, raise_for_status: bool = True, **kwargs):
+        """
+        Onboarding and zone synchronization calls return the JSON payload or an error dictionary.
+        """
+        try:
+            response = await self._request(method, url, label, token, **kwargs)
+            if raise_for_status:
+                response.raise_for_status()
+            return response.json()
+        except httpx.TimeoutException:
+            logger.error(f"{label} timed out")
+            return {"error": "Request timed out", "status_code": 408}
+        except httpx.TransportError:
+            logger.error(f"{label} connection error")
+            return {"error": "Connection error", "status_code": 503}
+        except httpx.HTTPStatusError as http_err:
+            logger.error(f"{label} HTTP error: {http_err}")
+            return {"error": str(http_err), "status_code": http_err.response.status_code}
+        except Exception as e:
+            logger.error(f"{label} unexpected error: {e}")
+            return {"error": str(e), "status_code": 500}
+
+    async def _raw_call(self, method: str, url: str, label: str, token: str, **kwargs):
+        """
+        Artefact and deployment calls hand the raw response back to the caller.
+        """
+        try:
+            return await self._request(method, url, label, token, **kwargs)
+        except Exception as e:
+            logger.error(f"{label} unexpected error: {e}")
+            return {"error": str(e), "status_code": 500}
+
+    '''---FEDERATION ESTABLISHMENT---'''
+
+    async def post_partner(self, data: dict, token: str):
+        return await self._establishment_call("POST", f"{self.base_url}/partner", "POST /partner", token, timeout=20, json=data)
+
+    async def get_partner(self, federation_context_id: str, token: str):
+        return await self._establishment_call("GET", f"{self.base_url}/{federation_context_id}/partner", "GET /{id}/partner", token)
+
+    async def delete_partner(self, federation_context_id: str, token: str):
+        url = f"{self.base_url}/{federation_context_id}/partner"
+        try:
+            response = await self.client.delete(url, headers=self._get_headers(token), timeout=10)
+            if response.content:
+                await delete_fed(federation_context_id)
+                await delete_partner_zones()
+                return response.json(), 200
+            return {"status": response.status_code}
+        except httpx.TimeoutException:
+            logger.error("DELETE /{id}/partner timed out")
+            return {"error": "Request timed out"}, 408
+        except httpx.TransportError:
+            logger.error("DELETE /{id}/partner connection error")
+            return {"error": "Connection error"}, 504
+        except Exception as e:
+            logger.error(f"DELETE /{{id}}/partner unexpected error: {e}")
+            return {"error": str(e)}, 500
+
+    async def get_federation_context_ids(self, token: str):
+        return await self._establishment_call("GET", f"{self.base_url}/fed-context-id", "GET /fed-context-id", token)
+
+    '''---PARTNER APP ONBOARDING---'''
+
+    async def onboard_application(self, federation_context_id: str, body: dict | bytes, token: str):
+        url = f"{self.base_url}/{federation_context_id}/application/onboarding"
+        return await self._call("POST", url, "POST /application/onboarding", token, **self._body(body))
+
+    async def get_onboarded_app(self, federation_context_id: str, app_id: str, token: str):
+        url = f"{self.base_url}/{federation_context_id}/application/onboarding/app/{app_id}"
+        return await self._call("GET", url, "GET onboarded app", token)
+
+    async def delete_onboarded_app(self, federation_context_id: str, app_id: str, token: str):
+        url = f"{self.base_url}/{federation_context_id}/application/onboarding/app/{app_id}"
+        result = await self._raw_call("DELETE", url, "DELETE onboarding app", token)
+        if isinstance(result, dict):
+            return result
+        if result.is_error:
+            return {"error": f"HTTP error occurred: {result.status_code}", "status_code": result.status_code}
+        return {"message": "Deleted successfully", "status_code": result.status_code}
+
+    '''---PARTNER APP DEPLOYMENT---'''
+
+    async def deploy_app_partner(self, federation_context_id: str, body: dict | bytes, token: str):
+        url = f"{self.base_url}/{federation_context_id}/application/lcm"
+        return await self._raw_call("POST", url, "Deploy app at partner", token, **self._body(body))
+
+    '''---AVAILABILITY ZONE INFO SYNCHRONIZATION---'''
+
+    async def request_zone_sync(self, federation_context_id: str, body: dict, token: str):
+        url = f"{self.base_url}/{federation_context_id}/zones"
+        return await self._call("POST", url, "Zone synchronization", token, raise_for_status=False, json=body)
+
+    async def get_zone_resource_info(self, federation_context_id: str, zone_id: str, token: str):
+        url = f"{self.base_url}/{federation_context_id}/zones/{zone_id}"
+        return await self._call("GET", url, "Zone resource info", token, raise_for_status=False)
+
+    async def remove_zone_sync(self, federation_context_id: str, zone_id: str, token: str):
+        url = f"{self.base_url}/{federation_context_id}/zones/{zone_id}"
+        return await self._call("DELETE", url, "Remove Zone sync", token, raise_for_status=False)
+
+    '''---ARTEFACT API---'''
+
+    async def create_artefact(self, artefact: dict | bytes, federation_context_id, token: str):
+        url = f"{self.base_url}/{federation_context_id}/artefact"
+        return await self._raw_call("POST", url, "Create artefact", token, **self._body(artefact))
+
+
+class AsyncFederationManagerClientFactory:
+    def __init__(self):
+        self.default_base_url = config.FEDERATION_MANAGER_HOST
+
+    def create_federation_client(self, base_url=None):
+        return AsyncFederationManagerClient(base_url=base_url or self.default_base_url)
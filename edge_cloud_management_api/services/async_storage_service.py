@@ -0,0 +1,60 @@
+"""Asyncio counterparts of storage_service, used when the gateway runs in async mode."""
+from datetime import datetime, timezone
+from pymongo import DESCENDING, ReplaceOne
+from edge_cloud_management_api.managers.db_manager import get_async_mongo_client
+from edge_cloud_management_api.services.storage_service import mydb_mongo
+
+def _collection(collection: str):
+        return get_async_mongo_client()[mydb_mongo][collection]
+
+async def insert_zones(zone_list: list):
+        col = _collection("zones")
+        await col.insert_many(zone_list)
+
+async def upsert_zones(zone_list: list):
+        if not zone_list:
+                return
+        col = _collection("zones")
+        await col.bulk_write([ReplaceOne({'_id': zone['_id']}, zone, upsert=True) for zone in zone_list], ordered=False)
+
+async def get_zone(zone_id: str):
+        col = _collection("zones")
+        return await col.find_one({'_id': zone_id})
+
+async def get_zones(zone_ids: list) -> list:
+        if not zone_ids:
+                return []
+        col = _collection("zones")
+        return await col.find({'_id': {'$in': list(zone_ids)}}).to_list()
+
+async def delete_partner_zones():
+        col = _collection("zones")
+        await col.delete_many({'isLocal': 'false'})
+
+async def insert_federation(fed: dict):
+        col = _collection('federations')
+        await col.insert_one({**fed, 'createdAt': fed.get('createdAt') or datetime.now(timezone.utc)})
+
+async def get_fed(fed_context_id: str):
+        col = _collection('federations')
+        return await col.find_one({'_id': fed_context_id})
+
+async def update_fed_token(fed_context_id: str, token: str, token_expires_at: float):
+        col = _collection('federations')
+        await col.update_one({'_id': fed_context_id}, {'$set': {'token': token, 'tokenExpiresAt': token_expires_at}})
+
+async def get_latest_fed():
+        col = _collection('federations')
+        return await col.find_one(sort=[('createdAt', DESCENDING)])
+
+async def get_all_feds():
+        col = _collection('federations')
+        return await col.find().to_list()
+
+async def delete_fed(fed_context_id: str):
+        col = _collection('federations')
+        await col.delete_one({'_id': fed_context_id})
+
+async def get_job(job_id: str):
+        col = _collection('jobs')
+        return await col.find_one({'_id': job_id})
@@ -0,0 +1,329 @@
+import asyncio
+import random
+import threading
+import time
+from collections import deque
+import httpx
+import requests
+from edge_cloud_management_api.configs.env_config import config
+from edge_cloud_management_api.managers.log_manager import logger
+from edge_cloud_management_api.managers.metrics_manager import UPSTREAM_IN_FLIGHT, metrics, observe_upstream
+from edge_cloud_management_api.managers.trace_manager import tracer
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+RETRYABLE_STATUS_CODES = frozenset({502, 503, 504})
+
+
+class CircuitOpenError(requests.exceptions.ConnectionError):
+    """Raised instead of calling an upstream whose circuit is open; callers handle it as a connection error."""
+
+
+class AsyncCircuitOpenError(httpx.TransportError):
+    """Asyncio counterpart of CircuitOpenError, handled by callers as an httpx transport error."""
+
+
+class CircuitBreaker:
+    """
+    Closed / open / half-open circuit breaker over a sliding time window of call outcomes.
+
+    The circuit opens when at least `minimum_calls` calls ended in the last `window` seconds and the
+    share of failures reaches `failure_rate_threshold`. While open, calls are rejected without touching
+    the upstream. After `open_seconds` up to `half_open_calls` probe calls are let through: a success
+    closes the circuit, a failure opens it again.
+    """
+
+    def __init__(self, name: str, failure_rate_threshold: float, minimum_calls: int, window: float, open_seconds: float, half_open_calls: int = 1):
+        self.name = name
+        self.failure_rate_threshold = failure_rate_threshold
+        self.minimum_calls = minimum_calls
+        self.window = window
+        self.open_seconds = open_seconds
+        self.half_open_calls = half_open_calls
+        self.state = CLOSED
+        self._outcomes: deque[tuple[float, bool]] = deque()
+        self._opened_at = 0.0
+        self._probes = 0
+        self._lock = threading.Lock()
+        self.rejected = 0
+        self.opened = 0
+
+    def _set_state(self, state: str):
+        if state != self.state:
+            logger.warning(f"Circuit of upstream {self.name} is now {state}")
+            self.state = state
+        if state == OPEN:
+            self._opened_at = time.monotonic()
+            self.opened += 1
+        self._probes = 0
+        self._outcomes.clear()
+
+    def allow(self) -> bool:
+        """
+        Returns whether a call may be sent now; a True in half-open state reserves a probe slot.
+        """
+        with self._lock:
+            if self.state == OPEN:
+                if time.monotonic() - self._opened_at < self.open_seconds:
+                    self.rejected += 1
+                    return False
+                self._set_state(HALF_OPEN)
+            if self.state == HALF_OPEN:
+                if self._probes >= self.half_open_calls:
+                    self.rejected += 1
+                    return False
+                self._probes += 1
+            return True
+
+    def record(self, success: bool):
+        """
+        Records the outcome of a call let through by allow().
+        """
+        with self._lock:
+            if self.state == HALF_OPEN:
+                self._set_state(CLOSED if success else OPEN)
+                return
+            now = time.monotonic()
+            self._outcomes.append((now, success))
+            while self._outcomes and now - self._outcomes[0][0] > self.window:
+                self._outcomes.popleft()
+            if success or len(self._outcomes) < self.minimum_calls:
+                return
+            failures = sum(1 for _, ok in self._outcomes if not ok)
+            if failures / len(self._outcomes) >= self.failure_rate_threshold:
+                self._set_state(OPEN)
+
+
+class RetryBudget:
+    """
+    Caps retries to a share of the calls made in the last `window` seconds (with a small floor), so that
+    retries cannot multiply the load on an upstream that is already failing.
+    """
+
+    def __init__(self, ratio: float, min_retries: int, window: float):
+        self.ratio = ratio
+        self.min_retries = min_retries
+        self.window = window
+        self._calls: deque[float] = deque()
+        self._retries: deque[float] = deque()
+        self._lock = threading.Lock()
+        self.exhausted = 0
+
+    def _trim(self, now: float):
+        for events in (self._calls, self._retries):
+            while events and now - events[0] > self.window:
+                events.popleft()
+
+    def deposit(self):
+        with self._lock:
+            now = time.monotonic()
+            self._trim(now)
+            self._calls.append(now)
+
+    def withdraw(self) -> bool:
+        """
+        Returns whether one more retry fits in the budget, and spends it if so.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._trim(now)
+            if len(self._retries) >= max(self.min_retries, self.ratio * len(self._calls)):
+                self.exhausted += 1
+                return False
+            self._retries.append(now)
+            return True
+
+
+class Upstream:
+    """
+    Guards every call to one upstream service with a circuit breaker and a retry budget.
+
+    `send` is a zero-argument callable performing one HTTP attempt and returning the response. Transport
+    errors and 5xx responses count as failures; idempotent calls that fail that way are retried (up to
+    UPSTREAM_MAX_ATTEMPTS attempts) while the retry budget allows it and the circuit is still closed. A failed
+    half-open probe, or a failure that opened the circuit, is not retried, so the caller sees the upstream's
+    own error rather than a CircuitOpenError. Before the n-th retry (n from 0) the call waits a random time of
+    up to `backoff_base * 2 ** n` seconds, capped at `backoff_max` (full jitter), so a struggling upstream is not
+    hit again at once and the retry budget is not spent in a burst.
+
+    Example:
+        response = get_upstream("srm").call(lambda: session.request("GET", url, timeout=5), "GET", operation="get_app")
+    """
+
+    def __init__(self, name: str, breaker: CircuitBreaker, budget: RetryBudget, max_attempts: int,
+                 backoff_base: float = 0.0, backoff_max: float = 0.0):
+        self.name = name
+        self.breaker = breaker
+        self.budget = budget
+        self.max_attempts = max_attempts
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+
+    def _retryable(self, method: str, retry: bool | None) -> bool:
+        return method.upper() in IDEMPOTENT_METHODS if retry is None else retry
+
+    def _backoff(self, attempt: int) -> float:
+        """Returns the seconds to wait before the retry following attempt number `attempt`."""
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** (attempt - 1)))
+
+    def _can_retry(self, retryable: bool, attempt: int) -> bool:
+        return retryable and attempt < self.max_attempts and self.breaker.state == CLOSED and self.budget.withdraw()
+
+    def call(self, send, method: str = "GET", retry: bool | None = None, operation: str = ""):
+        """
+        Sends a call through the breaker; raises CircuitOpenError when the circuit is open.
+        Every attempt is recorded in the upstream metrics under `operation`, and the call is traced as a
+        client span that is active while `send` runs (so `send` can propagate it, see with_trace_headers).
+        """
+        with tracer.span(f"{self.name} {operation}", kind="client", attributes={"upstream": self.name, "http.method": method}) as span:
+            response = self._call(send, method, retry, operation)
+            span.set_attribute("http.status_code", response.status_code)
+            return response
+
+    def _call(self, send, method: str, retry: bool | None, operation: str):
+        retryable = self._retryable(method, retry)
+        self.budget.deposit()
+        attempt = 0
+        error = None
+        while True:
+            attempt += 1
+            if attempt > 1:
+                time.sleep(self._backoff(attempt - 1))
+            if not self.breaker.allow():
+                observe_upstream(self.name, operation, "circuit_open")
+                if error is not None:
+                    # Another call opened the circuit since this one failed: report the actual failure
+                    raise error
+                raise CircuitOpenError(f"Circuit of upstream {self.name} is open")
+            started = time.perf_counter()
+            UPSTREAM_IN_FLIGHT.inc(upstream=self.name)
+            try:
+                response = send()
+            except Exception as e:
+                observe_upstream(self.name, operation, "error", started)
+                self.breaker.record(False)
+                if self._can_retry(retryable, attempt):
+                    error = e
+                    continue
+                raise
+            finally:
+                UPSTREAM_IN_FLIGHT.dec(upstream=self.name)
+            observe_upstream(self.name, operation, response.status_code, started)
+            failed = response.status_code >= 500
+            self.breaker.record(not failed)
+            if failed and response.status_code in RETRYABLE_STATUS_CODES and self._can_retry(retryable, attempt):
+                response.close()  # releases the connection of a streamed response
+                continue
+            return response
+
+    async def acall(self, send, method: str = "GET", retry: bool | None = None, operation: str = ""):
+        """
+        Asyncio counterpart of call(); `send` returns an awaitable. Raises AsyncCircuitOpenError when open.
+        """
+        with tracer.span(f"{self.name} {operation}", kind="client", attributes={"upstream": self.name, "http.method": method}) as span:
+            response = await self._acall(send, method, retry, operation)
+            span.set_attribute("http.status_code", response.status_code)
+            return response
+
+    async def _acall(self, send, method: str, retry: bool | None, operation: str):
+        retryable = self._retryable(method, retry)
+        self.budget.deposit()
+        attempt = 0
+        error = None
+        while True:
+            attempt += 1
+            if attempt > 1:
+                await asyncio.sleep(self._backoff(attempt - 1))
+            if not self.breaker.allow():
+                observe_upstream(self.name, operation, "circuit_open")
+                if error is not None:
+                    # Another call opened the circuit since this one failed: report the actual failure
+                    raise error
+                raise AsyncCircuitOpenError(f"Circuit of upstream {self.name} is open")
+            started = time.perf_counter()
+            UPSTREAM_IN_FLIGHT.inc(upstream=self.name)
+            try:
+                response = await send()
+            except Exception as e:
+                observe_upstream(self.name, operation, "error", started)
+                self.breaker.record(False)
+                if self._can_retry(retryable, attempt):
+                    error = e
+                    continue
+                raise
+            finally:
+                UPSTREAM_IN_FLIGHT.dec(upstream=self.name)
+            observe_upstream(self.name, operation, response.status_code, started)
+            failed = response.status_code >= 500
+            self.breaker.record(not failed)
+            if failed and response.status_code in RETRYABLE_STATUS_CODES and self._can_retry(retryable, attempt):
+                await response.aclose()
+                continue
+            return response
+
+    def stats(self) -> dict:
+        return {
+            "state": self.breaker.state,
+            "opened": self.breaker.opened,
+            "rejected": self.breaker.rejected,
+            "retry_budget_exhausted": self.budget.exhausted,
+        }
+
+
+_upstreams: dict[str, Upstream] = {}
+_upstreams_lock = threading.Lock()
+
+
+def get_upstream(name: str) -> Upstream:
+    """
+    Returns the guard of an upstream ("srm", "federation_manager", "token_endpoint", ...), creating it on first use.
+    """
+    upstream = _upstreams.get(name)
+    if upstream is None:
+        with _upstreams_lock:
+            upstream = _upstreams.get(name)
+            if upstream is None:
+                upstream = Upstream(
+                    name,
+                    CircuitBreaker(
+                        name,
+                        failure_rate_threshold=config.BREAKER_FAILURE_RATE,
+                        minimum_calls=config.BREAKER_MINIMUM_CALLS,
+                        window=config.BREAKER_WINDOW,
+                        open_seconds=config.BREAKER_OPEN_SECONDS,
+                    ),
+                    RetryBudget(ratio=config.RETRY_BUDGET_RATIO, min_retries=config.RETRY_BUDGET_MIN, window=config.BREAKER_WINDOW),
+                    max_attempts=config.UPSTREAM_MAX_ATTEMPTS,
+                    backoff_base=config.RETRY_BACKOFF_BASE,
+                    backoff_max=config.RETRY_BACKOFF_MAX,
+                )
+                _upstreams[name] = upstream
+    return upstream
+
+
+def upstream_stats() -> dict:
+    """
+    Returns the breaker state and counters of every upstream, for the metrics endpoint.
+    """
+    return {name: upstream.stats() for name, upstream in list(_upstreams.items())}
+
+
+BREAKER_STATE = metrics.gauge("oeg_circuit_breaker_state", "Circuit state per upstream: 0 closed, 1 half-open, 2 open", ("upstream",))
+BREAKER_OPENED = metrics.counter("oeg_circuit_breaker_opened_total", "Times the circuit of an upstream opened", ("upstream",))
+BREAKER_REJECTED = metrics.counter("oeg_circuit_breaker_rejected_total", "Calls rejected by an open circuit", ("upstream",))
+RETRY_BUDGET_EXHAUSTED = metrics.counter("oeg_retry_budget_exhausted_total", "Retries skipped because the retry budget was spent", ("upstream",))
+STATE_VALUES = {CLOSED: 0, HALF_OPEN: 1, OPEN: 2}
+
+
+def _collect_breakers():
+    for name, stats in upstream_stats().items():
+        BREAKER_STATE.set(STATE_VALUES[stats["state"]], upstream=name)
+        BREAKER_OPENED.set(stats["opened"], upstream=name)
+        BREAKER_REJECTED.set(stats["rejected"], upstream=name)
+        RETRY_BUDGET_EXHAUSTED.set(stats["retry_budget_exhausted"], upstream=name)
+
+
+metrics.on_collect(_collect_breakers)
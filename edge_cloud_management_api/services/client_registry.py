@@ -0,0 +1,187 @@
+import inspect
+import threading
+from edge_cloud_management_api.configs.env_config import config
+from edge_cloud_management_api.managers.log_manager import logger
+from edge_cloud_management_api.managers.http_manager import get_http_session, close_http_session, get_async_http_client, aclose_async_http_clients
+from edge_cloud_management_api.managers.db_manager import get_mongo_client, close_mongo_client, get_async_mongo_client, close_async_mongo_client
+from edge_cloud_management_api.services.edge_cloud_services import PiEdgeAPIClient, PiEdgeAPIClientFactory
+from edge_cloud_management_api.services.federation_services import FederationManagerClient, FederationManagerClientFactory
+from edge_cloud_management_api.services.async_edge_cloud_services import AsyncPiEdgeAPIClient, AsyncPiEdgeAPIClientFactory
+from edge_cloud_management_api.services.async_federation_services import AsyncFederationManagerClient, AsyncFederationManagerClientFactory
+from edge_cloud_management_api.services.token_manager import OAuth2TokenManager, TokenConfigurationError
+from edge_cloud_management_api.services.jwt_verifier import JWTVerifier
+
+
+class ClientRegistry:
+    """
+    Holds a single instance of every upstream client per worker process.
+
+    Clients are built lazily on first use (or eagerly by warm_up() at startup) and handed
+    to every request handler, so connection pools, auth state and caches outlive a request.
+
+    Example:
+        registry.register("pi_edge", lambda: PiEdgeAPIClientFactory().create_pi_edge_api_client())
+        api_client = registry.get("pi_edge")
+    """
+
+    def __init__(self):
+        self._builders = {}
+        self._closers = {}
+        self._instances = {}
+        self._lock = threading.RLock()
+
+    def register(self, name: str, builder, closer=None):
+        """
+        Registers a client builder and an optional closer called with the instance at shutdown.
+        """
+        with self._lock:
+            self._builders[name] = builder
+            if closer is not None:
+                self._closers[name] = closer
+
+    def get(self, name: str):
+        """
+        Returns the shared instance of a client, building it on first use.
+        """
+        instance = self._instances.get(name)
+        if instance is None:
+            with self._lock:
+                instance = self._instances.get(name)
+                if instance is None:
+                    instance = self._builders[name]()
+                    self._instances[name] = instance
+        return instance
+
+    def warm_up(self, names=None):
+        """
+        Builds the given clients, or every registered client. Intended to run once at worker startup.
+        """
+        for name in names or list(self._builders):
+            self.get(name)
+        logger.info(f"Client registry warmed up: {', '.join(self._instances)}")
+
+    def _run_closers(self):
+        """
+        Calls the closer of every built client in reverse build order and yields what each one returned.
+        """
+        with self._lock:
+            for name, instance in reversed(list(self._instances.items())):
+                closer = self._closers.get(name)
+                if closer is None:
+                    continue
+                try:
+                    yield name, closer(instance)
+                except Exception as e:
+                    logger.error(f"Failed to close client {name}: {e}")
+            self._instances.clear()
+
+    def reset(self):
+        """
+        Forgets every built client without closing it, e.g. in a worker forked from a preloaded process.
+        """
+        self._lock = threading.RLock()
+        self._instances.clear()
+
+    def close(self):
+        """
+        Releases every built client. Intended to run at worker shutdown in sync mode.
+        """
+        for name, result in self._run_closers():
+            if inspect.iscoroutine(result):
+                logger.warning(f"Client {name} needs an event loop to close; use aclose() in async mode")
+                result.close()
+
+    async def aclose(self):
+        """
+        Releases every built client, awaiting asynchronous closers. Intended to run at worker shutdown in async mode.
+        """
+        for name, result in self._run_closers():
+            if inspect.isawaitable(result):
+                try:
+                    await result
+                except Exception as e:
+                    logger.error(f"Failed to close client {name}: {e}")
+
+
+def _load_jwks() -> dict:
+    response = registry.get("http_session").get(config.JWT_JWKS_URL, timeout=config.TOKEN_REQUEST_TIMEOUT)
+    response.raise_for_status()
+    return response.json()
+
+
+def _build_token_manager() -> OAuth2TokenManager:
+    missing = [name for name in ("TOKEN_CLIENT_ID", "TOKEN_CLIENT_SECRET") if not getattr(config, name)]
+    if missing:
+        raise TokenConfigurationError(f"{' and '.join(missing)} must be set to request Federation Manager tokens")
+    return OAuth2TokenManager(
+        token_endpoint=config.TOKEN_ENDPOINT,
+        client_id=config.TOKEN_CLIENT_ID,
+        client_secret=config.TOKEN_CLIENT_SECRET,
+        session=registry.get("http_session"),
+        default_scope=config.TOKEN_SCOPE,
+        refresh_margin=config.TOKEN_REFRESH_MARGIN,
+        timeout=config.TOKEN_REQUEST_TIMEOUT,
+    )
+
+
+registry = ClientRegistry()
+registry.register("http_session", get_http_session, lambda _session: close_http_session())
+registry.register("mongo", get_mongo_client, lambda _client: close_mongo_client())
+registry.register("pi_edge", lambda: PiEdgeAPIClientFactory().create_pi_edge_api_client())
+registry.register("federation_manager", lambda: FederationManagerClientFactory().create_federation_client())
+registry.register("token_manager", lambda: _build_token_manager())
+registry.register("jwt_verifier", lambda: JWTVerifier(
+    issuer=config.JWT_ISSUER,
+    public_key=config.JWT_PUBLIC_KEY,
+    jwks_loader=_load_jwks if config.JWT_JWKS_URL else None,
+    cache_size=config.JWT_CACHE_SIZE,
+))
+registry.register("async_http_client", get_async_http_client, lambda _client: aclose_async_http_clients())
+registry.register("async_mongo", get_async_mongo_client, lambda _client: close_async_mongo_client())
+registry.register("pi_edge_async", lambda: AsyncPiEdgeAPIClientFactory().create_pi_edge_api_client())
+registry.register("federation_manager_async", lambda: AsyncFederationManagerClientFactory().create_federation_client())
+
+SYNC_CLIENTS = ("http_session", "mongo", "pi_edge", "federation_manager")
+ASYNC_CLIENTS = ("async_http_client", "async_mongo", "pi_edge_async", "federation_manager_async")
+
+
+def get_pi_edge_client() -> PiEdgeAPIClient:
+    """
+    Returns the shared SRM client of this worker.
+    """
+    return registry.get("pi_edge")
+
+
+def get_federation_client() -> FederationManagerClient:
+    """
+    Returns the shared Federation Manager client of this worker.
+    """
+    return registry.get("federation_manager")
+
+
+def get_async_pi_edge_client() -> AsyncPiEdgeAPIClient:
+    """
+    Returns the shared asyncio SRM client of this worker.
+    """
+    return registry.get("pi_edge_async")
+
+
+def get_async_federation_client() -> AsyncFederationManagerClient:
+    """
+    Returns the shared asyncio Federation Manager client of this worker.
+    """
+    return registry.get("federation_manager_async")
+
+
+def get_token_manager() -> OAuth2TokenManager:
+    """
+    Returns the shared OAuth2 client-credentials token manager of this worker.
+    """
+    return registry.get("token_manager")
+
+
+def get_jwt_verifier() -> JWTVerifier:
+    """
+    Returns the shared bearer token verifier of this worker.
+    """
+    return registry.get("jwt_verifier")
@@ -2,25 +2,52 @@ import requests
 from edge_cloud_management_api.managers.log_manager import logger
 from requests.exceptions import Timeout, ConnectionError
 from edge_cloud_management_api.configs.env_config import config
+from edge_cloud_management_api.managers.http_manager import get_http_session
+from edge_cloud_management_api.managers.trace_manager import with_trace_headers
+from edge_cloud_management_api.services.circuit_breaker import get_upstream
+from edge_cloud_management_api.services.manifest_cache import manifest_cache
+from edge_cloud_management_api.services.single_flight import SingleFlight
 
 
-proxies = {
-    "http": config.HTTP_PROXY,
-    "https": config.HTTP_PROXY,
-}
-
 class PiEdgeAPIClient:
-    def __init__(self, base_url, username, password):
+    # Read timeouts (seconds) for operations that are slower than the SRM_READ_TIMEOUT default.
+    READ_TIMEOUTS = {
+        "submit_app": 60,
+        "deploy_service_function": 120,
+        "delete_app_instance": 60,
+    }
+
+    def __init__(self, base_url, username, password, session=None, upstream=None):
         self.base_url = base_url
         self.username = username
         self.password = password
         self.token = None
-        
+        self.requests_session = session or get_http_session()
+        self.upstream = upstream or get_upstream("srm")
+        self.flights = SingleFlight()
 
-    def _get_proxy_session(self, session_proxies):
-        session = requests.Session()
-        session.proxies.update(session_proxies)
-        return session
+    def _timeout(self, operation: str):
+        """
+        Returns the (connect, read) timeout tuple for an SRM operation.
+        """
+        return (config.SRM_CONNECT_TIMEOUT, self.READ_TIMEOUTS.get(operation, config.SRM_READ_TIMEOUT))
+
+    def _request(self, method: str, url: str, operation: str, **kwargs):
+        """
+        Sends a request to SRM over the shared keep-alive session, through the SRM circuit breaker.
+        Raises CircuitOpenError (a ConnectionError) without contacting SRM while the circuit is open.
+        Concurrent identical GETs share one upstream call, except streamed ones. The traceparent / x-correlator of the current
+        trace are added at send time, so they name the SRM client span.
+        """
+        kwargs.setdefault("verify", False)
+        kwargs.setdefault("timeout", self._timeout(operation))
+
+        def send():
+            return self.upstream.call(lambda: self.requests_session.request(method, url, **with_trace_headers(kwargs)), method, operation=operation)
+
+        if method != "GET" or kwargs.get("stream"):
+            return send()
+        return self.flights.do((url, tuple(sorted((kwargs.get("headers") or {}).items()))), send)
 
     def _authenticate(self):
         """
@@ -31,11 +58,7 @@ class PiEdgeAPIClient:
         credentials = {"username": self.username, "password": self.password}
 
         try:
-            response = self.requests_session.post(
-                login_url,
-                json=credentials,
-                # proxies=proxies,
-            )
+            response = self._request("POST", login_url, "authenticate", json=credentials)
             response.raise_for_status()
 
             self.token = response.json().get("token")
@@ -46,6 +69,19 @@ class PiEdgeAPIClient:
         except Exception as err:
             logger.error(f"Error occurred: {err}")
 
+    def _stream(self, url: str, operation: str) -> requests.Response:
+        """
+        Sends a GET whose body is left unread, so that it can be relayed to the caller without being parsed
+        (see services.passthrough). Raises for non-2xx responses, like raise_for_status().
+        """
+        response = self._request("GET", url, operation, headers=self._get_headers(), stream=True)
+        try:
+            response.raise_for_status()
+        except requests.exceptions.HTTPError:
+            response.close()
+            raise
+        return response
+
     def _get_headers(self):
         """
         Helper function to return the authorization headers with token.
@@ -66,7 +102,7 @@ class PiEdgeAPIClient:
         url = f"{self.base_url}/serviceFunction"
         try:
             request_headers = self._get_headers()
-            response = requests.get(url, headers=request_headers, verify=False)
+            response = self._request("GET", url, "get_service_functions_catalogue", headers=request_headers)
             response.raise_for_status()
             service_functions = response.json()
             if isinstance(service_functions, list):
@@ -92,6 +128,25 @@ class PiEdgeAPIClient:
             return {"error": f"An unexpected error occurred: {err}"}
         
         
+    def stream_service_functions_catalogue(self):
+        """
+        Like get_service_functions_catalogue(), but returns the SRM response with its body unread.
+        Failures are returned as the same error dictionaries.
+        """
+        try:
+            return self._stream(f"{self.base_url}/serviceFunction", "get_service_functions_catalogue")
+        except Timeout:
+            return {"error": "The request to the external API timed out. Please try again later."}
+        except ConnectionError:
+            return {"error": "Failed to connect to the external API service. Service might be unavailable."}
+        except requests.exceptions.HTTPError as http_err:
+            return {
+                "error": f"HTTP error occurred: {http_err}.",
+                "status_code": http_err.response.status_code,
+            }
+        except Exception as err:
+            return {"error": f"An unexpected error occurred: {err}"}
+
     def submit_app(self, body):
         """
         Register app metadata to SRM
@@ -99,9 +154,12 @@ class PiEdgeAPIClient:
         url = f"{self.base_url}/serviceFunction"
         try:
             request_headers = self._get_headers()
-            response = requests.post(url, headers=request_headers, verify=False, json=body)
+            response = self._request("POST", url, "submit_app", headers=request_headers, json=body)
             response.raise_for_status()
-            return response.json()
+            result = response.json()
+            for app_id in {body.get("appId"), result.get("appId") if isinstance(result, dict) else None} - {None}:
+                manifest_cache.invalidate(app_id)
+            return result
         except Timeout:
             return {"error": "The request to the external API timed out. Please try again later."}
 
@@ -116,14 +174,22 @@ class PiEdgeAPIClient:
         
     def get_app(self, appId):
         """
-        Get app metadata from SRM
+        Get app metadata from SRM, served from the manifest cache while fresh or unchanged (304)
         """
+        cached, fresh = manifest_cache.lookup(appId)
+        if fresh:
+            return cached.app
         url = f"{self.base_url}/serviceFunction/"+appId
         try:
-            request_headers = self._get_headers()
-            response = requests.get(url, headers=request_headers, verify=False)
+            request_headers = {**self._get_headers(), **manifest_cache.conditional_headers(cached)}
+            response = self._request("GET", url, "get_app", headers=request_headers)
+            if response.status_code == 304 and cached is not None:
+                return manifest_cache.revalidated(appId, cached)
             response.raise_for_status()
-            return response.json()
+            app = response.json()
+            if isinstance(app, dict):
+                return manifest_cache.store(appId, app, response.headers.get("ETag"), response.headers.get("Last-Modified"))
+            return app
         except Timeout:
             return {"error": "The request to the external API timed out. Please try again later."}
 
@@ -141,8 +207,9 @@ class PiEdgeAPIClient:
         Remove app metadata from SRM
         """
         url = f"{self.base_url}/serviceFunction/"+appId
+        manifest_cache.invalidate(appId)
         try:
-            response = requests.delete(url,headers=self._get_headers(), verify=False)
+            response = self._request("DELETE", url, "delete_app", headers=self._get_headers())
             response.raise_for_status()
             return response.text
         except Timeout:
@@ -166,7 +233,7 @@ class PiEdgeAPIClient:
         """
         url = f"{self.base_url}/deployedServiceFunction"
         try:
-            response = requests.post(url, json=data, headers=self._get_headers(), verify=False)
+            response = self._request("POST", url, "deploy_service_function", json=data, headers=self._get_headers())
             response.raise_for_status()
             return response.json()
         except Timeout:
@@ -191,7 +258,7 @@ class PiEdgeAPIClient:
         """
         url = f"{self.base_url}/deployedServiceFunction"
         try:
-            response = requests.get(url, headers=self._get_headers(), verify=False)
+            response = self._request("GET", url, "get_app_instances", headers=self._get_headers())
             response.raise_for_status()
             return response.json()
         except Timeout:
@@ -213,7 +280,7 @@ class PiEdgeAPIClient:
         """
         url = f"{self.base_url}/deployedServiceFunction/"+app_instance_id
         try:
-            response = requests.delete(url, headers=self._get_headers(), verify=False)
+            response = self._request("DELETE", url, "delete_app_instance", headers=self._get_headers())
             response.raise_for_status()
             return response
         except Timeout:
@@ -233,14 +300,23 @@ class PiEdgeAPIClient:
         """
         Get list of edge zones from /node endpoint.
         """
+        nodes = self.list_nodes()
+        if not nodes:
+            raise ValueError("No edge nodes found")
+        return nodes
+
+    def list_nodes(self) -> list:
+        """
+        Returns the /node list as SRM reports it, possibly empty. Raises requests exceptions when the
+        request fails and ValueError when SRM does not answer with a list.
+        """
         url = f"{self.base_url}/node"
-        #try:
         request_headers = self._get_headers()
-        response = requests.get(url, headers=request_headers, verify=False)
+        response = self._request("GET", url, "edge_cloud_zones", headers=request_headers)
         response.raise_for_status()
         nodes = response.json()
-        if not nodes:
-            raise ValueError("No edge nodes found")
+        if not isinstance(nodes, list):
+            raise ValueError(f"Unexpected SRM node list: {nodes!r}")
         return nodes
 
 
@@ -251,7 +327,7 @@ class PiEdgeAPIClient:
         url = f"{self.base_url}/node/"+zone_id
         #try:
         request_headers = self._get_headers()
-        response = requests.get(url, headers=request_headers, verify=False)
+        response = self._request("GET", url, "edge_cloud_zone_details", headers=request_headers)
         response.raise_for_status()
         nodes = response.json()
         if not nodes:
@@ -262,7 +338,7 @@ class PiEdgeAPIClient:
 
         url = f"{self.base_url}/sessions"
         request_headers = self._get_headers()
-        response = requests.post(url, json=body, headers=request_headers,verify=False)
+        response = self._request("POST", url, "create_qod_session", json=body, headers=request_headers)
         response.raise_for_status()
         if response.status_code==200:
             return response.json()
@@ -275,19 +351,24 @@ class PiEdgeAPIClient:
 
         url = f"{self.base_url}/sessions/"+sessionId
         request_headers = self._get_headers()
-        response = requests.get(url, headers=request_headers,verify=False)
+        response = self._request("GET", url, "get_qod_session", headers=request_headers)
         response.raise_for_status()
         if response.status_code==200:
             return response.json()
         elif response.status_code==500:
             return response.content
-        
-        
+
+    def stream_qod_session(self, sessionId: str) -> requests.Response:
+        """
+        Like get_qod_session(), but returns the SRM response with its body unread.
+        """
+        return self._stream(f"{self.base_url}/sessions/{sessionId}", "get_qod_session")
+
     def delete_qod_session(self, sessionId: str):
 
         url = f"{self.base_url}/sessions/"+sessionId
         request_headers = self._get_headers()
-        response = requests.delete(url, headers=request_headers,verify=False)
+        response = self._request("DELETE", url, "delete_qod_session", headers=request_headers)
         response.raise_for_status()
         if response.status_code==200:
             return response.text
@@ -297,7 +378,7 @@ class PiEdgeAPIClient:
     def create_traffic_influence_resource(self, body_dict):
         url = f"{self.base_url}/traffic-influences"
         request_headers = self._get_headers()
-        response = requests.post(url, json=body_dict, headers=request_headers,verify=False)
+        response = self._request("POST", url, "create_traffic_influence_resource", json=body_dict, headers=request_headers)
         response.raise_for_status()
         if response.status_code==200:
             return response.json()
@@ -307,7 +388,7 @@ class PiEdgeAPIClient:
     def delete_traffic_influence_resource(self, id: str):
         url = f"{self.base_url}/traffic-influences/"+id
         request_headers = self._get_headers()
-        response = requests.delete(url, headers=request_headers,verify=False)
+        response = self._request("DELETE", url, "delete_traffic_influence_resource", headers=request_headers)
         response.raise_for_status()
         if response.status_code==200:
             return response.json()
@@ -317,7 +398,7 @@ class PiEdgeAPIClient:
     def get_traffic_influence_resource(self, id: str):
         url = f"{self.base_url}/traffic-influences/"+id
         request_headers = self._get_headers()
-        response = requests.get(url, headers=request_headers,verify=False)
+        response = self._request("GET", url, "get_traffic_influence_resource", headers=request_headers)
         response.raise_for_status()
         if response.status_code==200:
             return response.json()
@@ -327,13 +408,19 @@ class PiEdgeAPIClient:
     def get_all_traffic_influence_resources(self):
         url = f"{self.base_url}/traffic-influences/"
         request_headers = self._get_headers()
-        response = requests.get(url, headers=request_headers,verify=False)
+        response = self._request("GET", url, "get_all_traffic_influence_resources", headers=request_headers)
         response.raise_for_status()
         if response.status_code==200:
             return response.json()
         elif response.status_code==500:
             return response.content
 
+    def stream_traffic_influence_resources(self) -> requests.Response:
+        """
+        Like get_all_traffic_influence_resources(), but returns the SRM response with its body unread.
+        """
+        return self._stream(f"{self.base_url}/traffic-influences/", "get_all_traffic_influence_resources")
+
 class PiEdgeAPIClientFactory:
     """
     Factory class to create instances of PiEdgeAPIClient.
@@ -0,0 +1,44 @@
+import contextvars
+from concurrent.futures import ThreadPoolExecutor, as_completed, TimeoutError as FuturesTimeoutError
+from typing import NamedTuple
+from edge_cloud_management_api.managers.log_manager import logger
+
+
+class FanOutResult(NamedTuple):
+    status: str  # "ok", "error" or "timeout"
+    value: object = None
+    error: str | None = None
+
+
+def fan_out(calls: dict, max_workers: int, deadline: float | None = None) -> dict:
+    """
+    Runs every call of `calls` ({key: zero-argument callable}) concurrently on at most `max_workers`
+    threads and returns {key: FanOutResult}.
+
+    Calls still running when `deadline` seconds have passed are reported as "timeout" and left to
+    finish in the background; each call should therefore also carry its own request timeout.
+    Each call runs in a copy of the caller's context, so its upstream calls stay in the caller's trace.
+    """
+    results = {}
+    if not calls:
+        return results
+
+    executor = ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(calls))), thread_name_prefix="fan-out")
+    futures = {executor.submit(contextvars.copy_context().run, call): key for key, call in calls.items()}
+    try:
+        for future in as_completed(futures, timeout=deadline):
+            key = futures[future]
+            try:
+                results[key] = FanOutResult("ok", future.result())
+            except Exception as e:
+                logger.error(f"Fan-out call {key} failed: {e}")
+                results[key] = FanOutResult("error", error=str(e))
+    except FuturesTimeoutError:
+        for future, key in futures.items():
+            if key not in results:
+                future.cancel()
+                logger.error(f"Fan-out call {key} exceeded the {deadline}s deadline")
+                results[key] = FanOutResult("timeout", error=f"No response within {deadline}s")
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+    return results
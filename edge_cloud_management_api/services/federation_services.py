@@ -2,14 +2,27 @@ import os
 import requests
 from requests.exceptions import Timeout, ConnectionError
 from edge_cloud_management_api.configs.env_config import config
+from edge_cloud_management_api.managers.http_manager import get_http_session
 from edge_cloud_management_api.managers.log_manager import logger
-from edge_cloud_management_api.services.edge_cloud_services import PiEdgeAPIClientFactory
+from edge_cloud_management_api.managers.trace_manager import with_trace_headers
+from edge_cloud_management_api.services.circuit_breaker import get_upstream
+from edge_cloud_management_api.services.fanout import fan_out
 from edge_cloud_management_api.services.storage_service import delete_fed, delete_partner_zones
 
 class FederationManagerClient:
-    def __init__(self, base_url=None):
+    def __init__(self, base_url=None, session=None, upstream=None):
         self.base_url = base_url or config.FEDERATION_MANAGER_HOST
         self.partner_root = config.PARTNER_API_ROOT
+        self.session = session or get_http_session()
+        self.upstream = upstream or get_upstream("federation_manager")
+
+    def _request(self, method: str, url: str, operation: str, **kwargs):
+        """
+        Sends a request to the Federation Manager over the shared keep-alive session, through its circuit breaker.
+        Raises CircuitOpenError (a ConnectionError) without contacting the Federation Manager while the circuit is open.
+        The traceparent / x-correlator of the current trace are added at send time.
+        """
+        return self.upstream.call(lambda: self.session.request(method, url, **with_trace_headers(kwargs)), method, operation=operation)
 
     def _get_headers(self, token):
         headers = {}
@@ -22,6 +35,11 @@ class FederationManagerClient:
         headers['Accept'] = 'application/json'
         return headers
 
+    @staticmethod
+    def _body(payload):
+        # Pre-encoded JSON bodies (see gsma_translation) are sent as they are
+        return {'data': payload} if isinstance(payload, bytes) else {'json': payload}
+
     '''---FEDERATION ESTABLISHMENT---'''
 
     def post_partner(self, data: dict, token: str):
@@ -29,7 +47,7 @@ class FederationManagerClient:
         headers=self._get_headers(token)        
         
         try:
-            response = requests.post(url, json=data, headers=headers, timeout=20)
+            response = self._request("POST", url, "post_partner", json=data, headers=headers, timeout=20)
             response.raise_for_status()
             print(response.json())
             return response.json(), 200
@@ -49,7 +67,7 @@ class FederationManagerClient:
     def get_partner(self, federation_context_id: str, token: str):
         url = f"{self.base_url}/{federation_context_id}/partner"
         try:
-            response = requests.get(url, headers=self._get_headers(token), timeout=10)
+            response = self._request("GET", url, "get_partner", headers=self._get_headers(token), timeout=10)
             response.raise_for_status()
             return response.json(), 200
         except Timeout:
@@ -68,7 +86,7 @@ class FederationManagerClient:
     def delete_partner(self, federation_context_id: str, token: str):
         url = f"{self.base_url}/{federation_context_id}/partner"
         try:
-            response = requests.delete(url, headers=self._get_headers(token), timeout=10)
+            response = self._request("DELETE", url, "delete_partner", headers=self._get_headers(token), timeout=10)
             if response.content:
                 delete_fed(federation_context_id)
                 delete_partner_zones()
@@ -90,7 +108,7 @@ class FederationManagerClient:
     def get_federation_context_ids(self, token: str):
         url = f"{self.base_url}/fed-context-id"
         try:
-            response = requests.get(url, headers=self._get_headers(token), timeout=10)
+            response = self._request("GET", url, "get_federation_context_ids", headers=self._get_headers(token), timeout=10)
             response.raise_for_status()
             return response.json(), 200
         except Timeout:
@@ -108,10 +126,10 @@ class FederationManagerClient:
         
     '''---PARTNER APP ONBOARDING---'''    
 
-    def onboard_application(self, federation_context_id: str, body: dict, token: str):
+    def onboard_application(self, federation_context_id: str, body: dict | bytes, token: str, timeout: float = 10):
         url = f"{self.base_url}/{federation_context_id}/application/onboarding"
         try:
-           response = requests.post(url, headers=self._get_headers(token), json=body, timeout=10)
+           response = self._request("POST", url, "onboard_application", headers=self._get_headers(token), timeout=timeout, **self._body(body))
            response.raise_for_status()
            return response.json()
         except Timeout:
@@ -131,7 +149,7 @@ class FederationManagerClient:
     def get_onboarded_app(self, federation_context_id: str, app_id: str, token: str):
         url = f"{self.base_url}/{federation_context_id}/application/onboarding/app/{app_id}"
         try:
-            response = requests.get(url, headers=self._get_headers(token), timeout=10)
+            response = self._request("GET", url, "get_onboarded_app", headers=self._get_headers(token), timeout=10)
             response.raise_for_status()
             return response.json()
         except Timeout:
@@ -150,7 +168,7 @@ class FederationManagerClient:
     def delete_onboarded_app(self, federation_context_id: str, app_id: str, token: str):
         url = f"{self.base_url}/{federation_context_id}/application/onboarding/app/{app_id}"
         try:
-            response = requests.delete(url, headers=self._get_headers(token), timeout=10)
+            response = self._request("DELETE", url, "delete_onboarded_app", headers=self._get_headers(token), timeout=10)
             response.raise_for_status()
             return {"message": "Deleted successfully", "status_code": response.status_code}
         except Timeout:
@@ -168,10 +186,10 @@ class FederationManagerClient:
 
     '''---PARTNER APP DEPLOYMENT---'''
 
-    def deploy_app_partner(self, federation_context_id: str, body: dict, token: str):
+    def deploy_app_partner(self, federation_context_id: str, body: dict | bytes, token: str):
         url = f"{self.base_url}/{federation_context_id}/application/lcm"
         try:
-            response = requests.post(url, headers=self._get_headers(token), json=body, timeout=10)
+            response = self._request("POST", url, "deploy_app_partner", headers=self._get_headers(token), timeout=10, **self._body(body))
             return response
         except Exception as e:
             logger.error(f"DELETE onboarding app unexpected error: {e}")
@@ -183,7 +201,7 @@ class FederationManagerClient:
 
         url = f"{self.base_url}/{federation_context_id}/zones"
         try:
-            response = requests.post(url, headers=self._get_headers(token), json=body, timeout=10)
+            response = self._request("POST", url, "request_zone_sync", headers=self._get_headers(token), json=body, timeout=10)
             return response.json()
         except Timeout:
             logger.error("Zone synchronization timed out")
@@ -202,7 +220,7 @@ class FederationManagerClient:
 
         url = f"{self.base_url}/{federation_context_id}/zones/{zone_id}"
         try:
-            response = requests.get(url, headers=self._get_headers(token), timeout=10)
+            response = self._request("GET", url, "get_zone_resource_info", headers=self._get_headers(token), timeout=10)
             return response.json()
         except Timeout:
             logger.error("Zone resource info timed out")
@@ -221,7 +239,7 @@ class FederationManagerClient:
 
         url = f"{self.base_url}/{federation_context_id}/zones/{zone_id}"
         try:
-            response = requests.delete(url, headers=self._get_headers(token), timeout=10)
+            response = self._request("DELETE", url, "remove_zone_sync", headers=self._get_headers(token), timeout=10)
             return response.json()
         except Timeout:
             logger.error("Remove Zone sync timed out")
@@ -238,10 +256,10 @@ class FederationManagerClient:
 
     '''---ARTEFACT API---'''
 
-    def create_artefact(self, artefact: dict, federation_context_id, token: str):
+    def create_artefact(self, artefact: dict | bytes, federation_context_id, token: str):
         url = f"{self.base_url}/{federation_context_id}/artefact"
         try:
-            response = requests.post(url, headers=self._get_headers(token), json=artefact, timeout=10)
+            response = self._request("POST", url, "create_artefact", headers=self._get_headers(token), timeout=10, **self._body(artefact))
             return response
         except Exception as e:
             logger.error(f"Create artefact unexpected error: {e}")
@@ -255,49 +273,67 @@ class FederationManagerClientFactory:
         base_url = base_url or self.default_base_url
         return FederationManagerClient(base_url=base_url)
 
-    def onboard_application_to_partners(app_id, zones):
+    def onboard_application_to_partners(self, app_id, zones, token: str):
+        """
+        Onboards an application to every partner OP offering one of `zones`.
+
+        Zones are grouped per (federation context, partner OP) and the groups are onboarded concurrently,
+        at most FANOUT_MAX_WORKERS at a time. Each partner call has its own PARTNER_CALL_TIMEOUT and the
+        whole fan-out stops waiting after FANOUT_DEADLINE, so latency follows the slowest partner.
+        """
         SOURCE_OP = os.getenv("SOURCE_OP_ID")
-        federation_context_id = os.getenv("FEDERATION_CONTEXT_ID")
+        default_federation_context_id = os.getenv("FEDERATION_CONTEXT_ID")
         callback_url = os.getenv("STATUS_CALLBACK_URL", "http://your-callback/api/status")
 
         partner_zones = [zone for zone in zones if zone.get("edgeCloudProvider") != SOURCE_OP]
         if not partner_zones:
             return {"message": "No partner zones to onboard"}, 200
 
-        srm_client = PiEdgeAPIClientFactory().create_pi_edge_api_client()
+        # Imported here: the client registry itself imports this module
+        from edge_cloud_management_api.services.client_registry import get_pi_edge_client
+
+        srm_client = get_pi_edge_client()
         app_data = srm_client.get_app(app_id)
 
         if not app_data or "error" in app_data:
             return {"error": "Failed to retrieve application metadata from SRM"}, 500
 
         app_manifest = app_data.get("appManifest", {})
-        onboarding_payload = {
-            "appId": app_id,
-            "appManifest": app_manifest,
-            "zones": partner_zones,
-            "appStatusCallbackLink": callback_url
-        }
+        federation_client = self.create_federation_client()
 
-        factory = FederationManagerClientFactory()
-        federation_client = factory.create_federation_client()
+        partners = {}
+        for zone in partner_zones:
+            key = (zone.get("fedContextId") or default_federation_context_id, zone["edgeCloudProvider"])
+            partners.setdefault(key, []).append(zone)
+
+        def onboard(federation_context_id, group):
+            onboarding_payload = {
+                "appId": app_id,
+                "appManifest": app_manifest,
+                "zones": group,
+                "appStatusCallbackLink": callback_url
+            }
+            return federation_client.onboard_application(federation_context_id, onboarding_payload, token, timeout=config.PARTNER_CALL_TIMEOUT)
+
+        outcomes = fan_out(
+            {key: (lambda key=key, group=group: onboard(key[0], group)) for key, group in partners.items()},
+            max_workers=config.FANOUT_MAX_WORKERS,
+            deadline=config.FANOUT_DEADLINE,
+        )
 
         results = []
-        for zone in partner_zones:
-            partner_op = zone["edgeCloudProvider"]
-            try:
-                response = federation_client.onboard_application(federation_context_id, onboarding_payload)
-                results.append({
-                    "zoneId": zone.get("edgeCloudZoneId"),
-                    "provider": partner_op,
-                    "status": response.get("status", "success"),
-                    "detail": response
-                })
-            except Exception as e:
+        for key, group in partners.items():
+            outcome = outcomes[key]
+            if outcome.status == "ok" and "error" not in outcome.value:
+                status, detail = outcome.value.get("status", "success"), outcome.value
+            else:
+                status, detail = "error", outcome.value if outcome.status == "ok" else outcome.error
+            for zone in group:
                 results.append({
                     "zoneId": zone.get("edgeCloudZoneId"),
-                    "provider": partner_op,
-                    "status": "error",
-                    "detail": str(e)
+                    "provider": key[1],
+                    "status": status,
+                    "detail": detail
                 })
 
         return {"onboardingResults": results}, 202
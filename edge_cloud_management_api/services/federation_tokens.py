@@ -0,0 +1,31 @@
+import requests
+from edge_cloud_management_api.configs.env_config import config
+from edge_cloud_management_api.managers.log_manager import logger
+from edge_cloud_management_api.services.client_registry import get_token_manager
+from edge_cloud_management_api.services.storage_service import update_fed_token
+from edge_cloud_management_api.services.token_manager import TokenConfigurationError, TokenRequestError, needs_refresh
+
+# What obtaining a Federation Manager token can fail with: missing credentials or a failed grant
+TOKEN_ERRORS = (TokenConfigurationError, TokenRequestError, requests.exceptions.RequestException)
+
+
+def federation_token(fed: dict) -> str:
+    """
+    Returns the token stored with a federation, re-hydrating it from the token manager once it expires.
+    """
+    if fed.get('token') and not needs_refresh(fed.get('tokenExpiresAt'), config.TOKEN_REFRESH_MARGIN):
+        return fed['token']
+    token = get_token_manager().get()
+    update_fed_token(fed['_id'], token.access_token, token.expires_at)
+    return token.access_token
+
+
+def token_error(error: Exception) -> tuple[dict, int]:
+    """
+    Returns the API error for a failure to obtain a Federation Manager token (one of TOKEN_ERRORS).
+    """
+    if isinstance(error, TokenConfigurationError):
+        logger.error(f"Federation Manager token credentials are not configured: {error}")
+        return {"status": 500, "code": "INTERNAL", "message": f"Federation Manager credentials are not configured: {error}"}, 500
+    logger.error(f"Failed to obtain a Federation Manager token: {error}")
+    return {"status": 503, "code": "UNAVAILABLE", "message": f"Could not obtain a Federation Manager token: {error}"}, 503
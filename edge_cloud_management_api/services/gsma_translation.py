@@ -0,0 +1,162 @@
+"""
+Translation of SRM (CAMARA) application manifests to the GSMA OPG artefact, onboarding and deployment
+payloads sent to partner OPs through the Federation Manager.
+"""
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from typing import NamedTuple
+from edge_cloud_management_api.configs.env_config import config
+from edge_cloud_management_api.models.application_models import AppManifest
+
+PackageType = AppManifest.PackageType
+
+
+def encode(payload: dict) -> bytes:
+    return json.dumps(payload, separators=(",", ":")).encode("utf-8")
+
+
+def manifest_hash(app_manifest: dict) -> str:
+    """
+    Returns the content hash of a manifest; equal manifests hash equally regardless of key order.
+    """
+    return hashlib.sha256(json.dumps(app_manifest, sort_keys=True, separators=(",", ":")).encode("utf-8")).hexdigest()
+
+
+class GSMAPayloads(NamedTuple):
+    artefact: dict
+    artefact_body: bytes
+    onboarding: dict
+    onboarding_body: bytes
+
+
+def _artefact_mapper(virt_type: str, descriptor_type: str):
+    """
+    Builds the artefact mapper of one package type; the package-specific fields are fixed at build time.
+    """
+    def to_artefact(app_id: str, app_manifest: dict) -> dict:
+        repo_info = app_manifest.get('appRepo') or {}
+        component = (app_manifest.get('componentSpec') or [{}])[0]
+        exposed_interfaces = [
+            {'interfaceId': '', 'commProtocol': ni.get('protocol'), 'commPort': ni.get('port'), 'visibilityType': ni.get('visibilityType'), 'network': '', 'InterfaceName': ''}
+            for ni in component.get('networkInterfaces') or []
+        ]
+        return {
+            'artefactId': app_id,
+            'appProviderId': app_manifest.get('appProvider'),
+            'artefactName': app_manifest.get('name'),
+            'artefactVersionInfo': app_manifest.get('version'),
+            'artefactDescription': '',
+            'artefactVirtType': virt_type,
+            'artefactDescriptorType': descriptor_type,
+            'repoType': repo_info.get('type'),
+            'artefactRepoLocation': {'repoURL': repo_info.get('imagePath'), 'userName': repo_info.get('userName'), 'password': repo_info.get('credentials'), 'token': ''},
+            'componentSpec': [
+                {
+                    'componentName': app_manifest.get('name'),
+                    'numOfInstances': 0,
+                    'restartPolicy': 'RESTART_POLICY_ALWAYS',
+                    'exposedInterfaces': exposed_interfaces,
+                    'compEnvParams': [],
+                    'persistentVolumes': []
+                }
+            ],
+        }
+
+    return to_artefact
+
+
+ARTEFACT_MAPPERS = {
+    PackageType.CONTAINER: _artefact_mapper('CONTAINER_TYPE', 'COMPONENTSPEC'),
+    PackageType.HELM: _artefact_mapper('CONTAINER_TYPE', 'HELM'),
+    PackageType.QCOW2: _artefact_mapper('VM_TYPE', 'COMPONENTSPEC'),
+    PackageType.OVA: _artefact_mapper('VM_TYPE', 'COMPONENTSPEC'),
+}
+
+
+def artefact_mapper(package_type):
+    """
+    Returns the artefact mapper of a manifest's packageType; manifests without one are treated as containers.
+    """
+    try:
+        return ARTEFACT_MAPPERS[PackageType(package_type)]
+    except ValueError:
+        return ARTEFACT_MAPPERS[PackageType.CONTAINER]
+
+
+def to_onboarding(app_id: str, app_manifest: dict) -> dict:
+    return {
+        'appId': app_id,
+        'appProviderId': app_manifest.get('appProvider'),
+        'appDeploymentZones': [],
+        'appMetaData': {'appName': app_manifest.get('name'), 'version': app_manifest.get('version')},
+        'appComponentSpecs': [{'serviceNameNB': app_manifest.get('name'), 'serviceNameEW': app_manifest.get('name'), 'componentName': app_manifest.get('name'), 'artefactId': app_id}],
+    }
+
+
+def to_deployment(app_id: str, app_manifest: dict, zone_id: str) -> dict:
+    return {
+        'appId': app_id,
+        'appVersion': app_manifest.get('version'),
+        'appProviderId': app_manifest.get('appProvider'),
+        'zoneInfo': {'zoneId': zone_id},
+    }
+
+
+class GSMATranslator:
+    """
+    Memoizes the artefact and onboarding payloads of an app, keyed by appId and manifest content hash,
+    together with their encoded JSON bodies. Deploying one app to many partner zones therefore builds and
+    encodes those payloads once. The cache is a bounded LRU; results are shared and must not be mutated.
+
+    Example:
+        payloads = gsma_translator.translate(app_id, app_manifest)
+        client.create_artefact(payloads.artefact_body, fed_context_id, token)
+    """
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._entries: OrderedDict[tuple, GSMAPayloads] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def translate(self, app_id: str, app_manifest: dict, content_hash: str | None = None) -> GSMAPayloads:
+        """
+        Returns the payloads of an app; pass `content_hash` when the manifest hash is already known.
+        """
+        key = (app_id, content_hash or manifest_hash(app_manifest))
+        with self._lock:
+            payloads = self._entries.get(key)
+            if payloads is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return payloads
+
+        artefact = artefact_mapper(app_manifest.get('packageType'))(app_id, app_manifest)
+        onboarding = to_onboarding(app_id, app_manifest)
+        payloads = GSMAPayloads(artefact, encode(artefact), onboarding, encode(onboarding))
+
+        with self._lock:
+            self.misses += 1
+            self._entries[key] = payloads
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return payloads
+
+    def deployment_body(self, app_id: str, app_manifest: dict, zone_id: str) -> bytes:
+        """
+        Returns the encoded deployment payload of an app for one zone; it is small and zone specific.
+        """
+        return encode(to_deployment(app_id, app_manifest, zone_id))
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        return {"hits": self.hits, "misses": self.misses, "size": len(self._entries)}
+
+
+gsma_translator = GSMATranslator(max_entries=config.TRANSLATION_CACHE_SIZE)
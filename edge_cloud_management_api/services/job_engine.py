@@ -0,0 +1,216 @@
+import os
+import socket
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from edge_cloud_management_api.configs.env_config import config
+from edge_cloud_management_api.managers.log_manager import logger
+from edge_cloud_management_api.managers.trace_manager import parse_trace_headers, trace_headers, tracer
+from edge_cloud_management_api.services.storage_service import (
+    claim_job,
+    get_resumable_job_ids,
+    insert_job,
+    update_job,
+)
+
+
+class JobStepError(Exception):
+    """Raised by a job step to fail the job with a message for the status endpoint."""
+
+
+def _worker_id() -> str:
+    return f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+
+class JobEngine:
+    """
+    Runs multi-step jobs persisted in the Mongo `jobs` collection on a bounded worker pool.
+
+    A job kind is a named, ordered list of steps. Each step receives the job document and returns a dict
+    that is merged into the job's `state`; after every step the state and the step name are checkpointed.
+    State keys starting with "_" are internal and left out of the status view.
+    A running job holds a lease renewed at every step; a sweeper thread picks up jobs whose lease expired
+    (e.g. after a restart) and continues them with the first step that did not complete.
+    The trace context of the submitting request is stored with the job, so the job and each of its steps
+    are traced under that request, and the duration of every step is kept in `stepTimings`.
+
+    Example:
+        job_engine.register("partner_deployment", [("fetch_app", fetch_app), ("deploy", deploy)])
+        job = job_engine.submit("partner_deployment", {"appId": app_id})
+    """
+
+    def __init__(self, max_workers: int, lease_seconds: float):
+        self.max_workers = max_workers
+        self.lease_seconds = lease_seconds
+        self.worker_id = _worker_id()
+        self._kinds = {}
+        self._executor = None
+        self._active: set[str] = set()
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._sweeper: threading.Thread | None = None
+
+    def register(self, kind: str, steps: list):
+        """
+        Registers the ordered (name, callable) steps of a job kind.
+        """
+        self._kinds[kind] = list(steps)
+
+    def start(self, sweep: bool = False):
+        """
+        Starts the worker pool and, with `sweep`, the thread resuming jobs with expired leases.
+        Safe to call more than once.
+        """
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="job-worker")
+            if sweep and self._sweeper is None:
+                self._stop_event.clear()
+                self._sweeper = threading.Thread(target=self._sweep, name="job-sweeper", daemon=True)
+                self._sweeper.start()
+
+    def stop(self):
+        """
+        Stops accepting work. Running steps finish; unfinished jobs are resumed once their lease expires.
+        """
+        self._stop_event.set()
+        with self._lock:
+            executor, self._executor = self._executor, None
+            sweeper, self._sweeper = self._sweeper, None
+        if sweeper is not None:
+            sweeper.join(timeout=5)
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def reset_after_fork(self):
+        """
+        Gives a worker forked from a preloaded process its own worker id, so that job leases are per worker.
+        Must run before start().
+        """
+        self.worker_id = _worker_id()
+        self._lock = threading.Lock()
+        self._active.clear()
+
+    def _sweep(self):
+        while True:
+            self.resume()
+            if self._stop_event.wait(self.lease_seconds):
+                return
+
+    def _lease(self) -> datetime:
+        return datetime.now(timezone.utc) + timedelta(seconds=self.lease_seconds)
+
+    def _dispatch(self, job_id: str) -> bool:
+        self.start()
+        with self._lock:
+            if job_id in self._active:
+                return False
+            self._active.add(job_id)
+        self._executor.submit(self._run, job_id)
+        return True
+
+    def submit(self, kind: str, payload: dict) -> dict:
+        """
+        Persists a new job and queues it; returns the stored job document.
+        """
+        if kind not in self._kinds:
+            raise ValueError(f"Unknown job kind '{kind}'")
+        job = {
+            '_id': str(uuid.uuid4()),
+            'kind': kind,
+            'status': 'queued',
+            'payload': payload,
+            'steps': [name for name, _ in self._kinds[kind]],
+            'completedSteps': [],
+            'currentStep': None,
+            'state': {},
+            'error': None,
+            'stepTimings': {},
+            'traceContext': trace_headers(),
+            'owner': self.worker_id,
+            'leaseUntil': self._lease(),
+        }
+        job = insert_job(job)
+        self._dispatch(job['_id'])
+        return job
+
+    def resume(self) -> list:
+        """
+        Queues every unfinished job whose lease expired; run by the sweeper at startup and every lease period.
+        """
+        try:
+            job_ids = get_resumable_job_ids()
+        except Exception as e:
+            logger.error(f"Failed to look up unfinished jobs: {e}")
+            return []
+        resumed = [job_id for job_id in job_ids if self._dispatch(job_id)]
+        if resumed:
+            logger.info(f"Resuming {len(resumed)} unfinished job(s)")
+        return resumed
+
+    def _run(self, job_id: str):
+        try:
+            self._run_steps(job_id)
+        except Exception as e:
+            logger.error(f"Job {job_id} could not be run: {e}")
+        finally:
+            with self._lock:
+                self._active.discard(job_id)
+
+    def _run_steps(self, job_id: str):
+        job = claim_job(job_id, self.worker_id, self._lease())
+        if job is None:
+            return
+        state = dict(job.get('state') or {})
+        completed = set(job.get('completedSteps') or [])
+        parent = parse_trace_headers(job.get('traceContext') or {})
+        with tracer.span(f"job {job['kind']}", attributes={"jobId": job_id}, parent=parent) as job_span:
+            try:
+                for name, step in self._kinds[job['kind']]:
+                    if name in completed:
+                        continue
+                    update_job(job_id, {'currentStep': name, 'leaseUntil': self._lease()})
+                    started = time.perf_counter()
+                    with tracer.span(f"step {name}", attributes={"jobId": job_id}):
+                        state.update(step({**job, 'state': state}) or {})
+                    update_job(job_id, {
+                        'state': state,
+                        'leaseUntil': self._lease(),
+                        f'stepTimings.{name}': round(time.perf_counter() - started, 3),
+                    }, completed_step=name)
+                update_job(job_id, {'status': 'succeeded', 'currentStep': None, 'owner': None})
+            except Exception as e:
+                logger.error(f"Job {job_id} failed: {e}")
+                job_span.set_error(str(e))
+                update_job(job_id, {'status': 'failed', 'error': str(e), 'owner': None})
+
+
+job_engine = JobEngine(max_workers=config.JOB_WORKERS, lease_seconds=config.JOB_LEASE_SECONDS)
+
+
+def job_status(job: dict) -> dict:
+    """
+    Returns the public view of a job document for the status endpoint.
+    """
+    def timestamp(value):
+        return value.isoformat() if isinstance(value, datetime) else value
+
+    result = None
+    if job['status'] == 'succeeded':
+        result = {key: value for key, value in (job.get('state') or {}).items() if not key.startswith('_')}
+
+    return {
+        'jobId': job['_id'],
+        'kind': job['kind'],
+        'status': job['status'],
+        'steps': job.get('steps', []),
+        'completedSteps': job.get('completedSteps', []),
+        'currentStep': job.get('currentStep'),
+        'stepTimings': job.get('stepTimings') or {},
+        'result': result,
+        'error': job.get('error'),
+        'createdAt': timestamp(job.get('createdAt')),
+        'updatedAt': timestamp(job.get('updatedAt')),
+    }
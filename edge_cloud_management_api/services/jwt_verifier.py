@@ -0,0 +1,111 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from jose import JWTError, jwk, jwt
+from edge_cloud_management_api.managers.log_manager import logger
+
+
+class JWTVerifier:
+    """
+    Verifies bearer JWTs against keys parsed once at construction.
+
+    Keys come from a single PEM public key and/or a JWKS document; tokens carrying a `kid` header are verified
+    with the matching JWKS key. An unknown `kid` triggers one JWKS reload (key rotation), at most every
+    `jwks_min_reload_interval` seconds, and is rejected if the key set still lacks it; only without a JWKS is
+    such a token checked against the PEM key. Verified claims are kept in a bounded LRU keyed by the token's
+    SHA-256 until the token's `exp`, so a repeated token skips the signature check; callers get their own copy.
+
+    Example:
+        verifier = JWTVerifier(issuer="https://issuer", public_key=pem)
+        claims = verifier.verify(token)
+    """
+
+    def __init__(self, issuer: str | None = None, public_key: str | None = None, jwks_loader=None,
+                 algorithms=("RS256",), cache_size: int = 1024, jwks_min_reload_interval: float = 60):
+        self.issuer = issuer
+        self.algorithms = list(algorithms)
+        self.cache_size = cache_size
+        self.jwks_min_reload_interval = jwks_min_reload_interval
+        self._jwks_loader = jwks_loader
+        self._jwks_loaded_at = None
+        self._default_key = jwk.construct(public_key, self.algorithms[0]) if public_key else None
+        self._keys: dict[str, jwk.Key] = {}
+        self._claims: OrderedDict[bytes, tuple[dict, float]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._keys_lock = threading.Lock()
+        self.hits = 0
+        self.verifications = 0
+        if jwks_loader is not None:
+            self.reload_jwks()
+
+    def set_jwks(self, jwks: dict):
+        """
+        Replaces the JWKS keys with the given key set ({"keys": [...]}).
+        """
+        keys = {}
+        for key in jwks.get("keys", []):
+            if "kid" not in key:
+                continue
+            keys[key["kid"]] = jwk.construct(key, key.get("alg") or self.algorithms[0])
+        self._keys = keys
+
+    def reload_jwks(self) -> bool:
+        """
+        Fetches the key set again, unless it was fetched less than `jwks_min_reload_interval` seconds ago.
+        """
+        if self._jwks_loader is None:
+            return False
+        with self._keys_lock:
+            now = time.monotonic()
+            if self._jwks_loaded_at is not None and now - self._jwks_loaded_at < self.jwks_min_reload_interval:
+                return False
+            self._jwks_loaded_at = now
+            try:
+                self.set_jwks(self._jwks_loader())
+            except Exception as e:
+                logger.error(f"Failed to load JWKS: {e}")
+                return False
+        return True
+
+    def _key_for(self, token: str):
+        kid = jwt.get_unverified_header(token).get("kid")
+        if kid is None:
+            if self._default_key is None:
+                raise JWTError("Token has no kid and no default public key is configured")
+            return self._default_key
+        key = self._keys.get(kid)
+        if key is None and self.reload_jwks():
+            key = self._keys.get(kid)
+        if key is None:
+            if self._jwks_loader is not None or self._default_key is None:
+                raise JWTError(f"Unknown signing key: {kid}")
+            return self._default_key
+        return key
+
+    def verify(self, token: str) -> dict:
+        """
+        Returns the claims of a valid token, as a dict the caller may modify; raises JWTError otherwise.
+        """
+        digest = hashlib.sha256(token.encode()).digest()
+        with self._lock:
+            cached = self._claims.get(digest)
+            if cached is not None:
+                claims, expires_at = cached
+                if time.time() < expires_at:
+                    self._claims.move_to_end(digest)
+                    self.hits += 1
+                    return dict(claims)
+                del self._claims[digest]
+
+        claims = jwt.decode(token, key=self._key_for(token), algorithms=self.algorithms, issuer=self.issuer)
+        self.verifications += 1
+        expires_at = claims.get("exp")
+        # Tokens without exp are not cached: there is no point at which the cached verdict would lapse.
+        if isinstance(expires_at, (int, float)) and self.cache_size > 0:
+            with self._lock:
+                self._claims[digest] = (dict(claims), float(expires_at))
+                self._claims.move_to_end(digest)
+                while len(self._claims) > self.cache_size:
+                    self._claims.popitem(last=False)
+        return claims
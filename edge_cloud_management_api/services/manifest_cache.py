@@ -0,0 +1,106 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import NamedTuple
+from edge_cloud_management_api.configs.env_config import config
+
+
+class CachedManifest(NamedTuple):
+    app: dict
+    etag: str | None
+    last_modified: str | None
+    fetched_at: float
+
+
+class ManifestCache:
+    """
+    Bounded LRU of SRM application documents (GET /serviceFunction/{appId}) keyed by appId.
+
+    Entries younger than `ttl` are served without contacting SRM. Older entries are revalidated with
+    If-None-Match / If-Modified-Since when SRM sent an ETag / Last-Modified, and re-fetched otherwise.
+    The gateway invalidates an entry whenever it submits or deletes that app. Cached documents are
+    shared between callers and must be treated as read-only.
+
+    Example:
+        cached, fresh = manifest_cache.lookup(app_id)
+        if not fresh:
+            headers = manifest_cache.conditional_headers(cached)
+    """
+
+    def __init__(self, max_entries: int, ttl: float):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: OrderedDict[str, CachedManifest] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.revalidations = 0
+        self.misses = 0
+
+    def lookup(self, app_id: str) -> tuple[CachedManifest | None, bool]:
+        """
+        Returns the cached entry of an app (or None) and whether it can be served without asking SRM.
+        """
+        with self._lock:
+            cached = self._entries.get(app_id)
+            if cached is None:
+                return None, False
+            self._entries.move_to_end(app_id)
+            fresh = time.monotonic() - cached.fetched_at < self.ttl
+            if fresh:
+                self.hits += 1
+            return cached, fresh
+
+    @staticmethod
+    def conditional_headers(cached: CachedManifest | None) -> dict:
+        """
+        Returns the validator headers of a conditional GET for a cached entry (empty if it has none).
+        """
+        headers = {}
+        if cached is not None and cached.etag:
+            headers["If-None-Match"] = cached.etag
+        if cached is not None and cached.last_modified:
+            headers["If-Modified-Since"] = cached.last_modified
+        return headers
+
+    def _put(self, app_id: str, cached: CachedManifest) -> CachedManifest:
+        with self._lock:
+            self._entries[app_id] = cached
+            self._entries.move_to_end(app_id)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return cached
+
+    def store(self, app_id: str, app: dict, etag: str | None = None, last_modified: str | None = None) -> dict:
+        """
+        Caches an app document fetched from SRM with its validators and returns it.
+        """
+        self.misses += 1
+        return self._put(app_id, CachedManifest(app, etag, last_modified, time.monotonic())).app
+
+    def revalidated(self, app_id: str, cached: CachedManifest) -> dict:
+        """
+        Marks an entry SRM confirmed unchanged (304) as fresh again and returns its document.
+        """
+        self.revalidations += 1
+        return self._put(app_id, cached._replace(fetched_at=time.monotonic())).app
+
+    def invalidate(self, app_id: str | None = None):
+        """
+        Drops one app, or every app when `app_id` is None.
+        """
+        with self._lock:
+            if app_id is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(app_id, None)
+
+    def stats(self) -> dict:
+        return {
+            "hits": self.hits,
+            "revalidations": self.revalidations,
+            "misses": self.misses,
+            "size": len(self._entries),
+        }
+
+
+manifest_cache = ManifestCache(max_entries=config.MANIFEST_CACHE_SIZE, ttl=config.MANIFEST_CACHE_TTL)
@@ -0,0 +1,81 @@
+"""
+Cursor pagination and incremental JSON serialization for list endpoints.
+
+Cursors are opaque to clients: a URL-safe base64 encoding of the offset of the next page.
+The streaming helpers yield one encoded item at a time, so a large list is never serialized
+into a single string.
+
+SRM has no limit/offset parameters, so every page is sliced from the full upstream list, which the
+gateway still fetches and holds in memory for each request. Pagination and streaming only shrink the
+response bodies (and the string built for them), not the gateway's peak memory per request.
+"""
+import base64
+import binascii
+import json
+from edge_cloud_management_api.managers.json_manager import dumps
+
+NEXT_CURSOR_HEADER = "x-next-cursor"
+NDJSON_MIMETYPE = "application/x-ndjson"
+JSON_MIMETYPE = "application/json"
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a pagination cursor cannot be decoded."""
+
+
+def encode_cursor(offset: int) -> str:
+    return base64.urlsafe_b64encode(json.dumps({"offset": offset}).encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str | None) -> int:
+    if not cursor:
+        return 0
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        offset = json.loads(base64.urlsafe_b64decode(padded.encode()))["offset"]
+    except (binascii.Error, ValueError, KeyError, TypeError) as e:
+        raise InvalidCursorError(f"Invalid cursor: {cursor}") from e
+    if not isinstance(offset, int) or offset < 0:
+        raise InvalidCursorError(f"Invalid cursor: {cursor}")
+    return offset
+
+
+def paginate(items: list, limit: int | None = None, cursor: str | None = None) -> tuple[list, str | None]:
+    """
+    Returns the page of `items` selected by `cursor` and `limit`, and the cursor of the next page
+    (None on the last page). Without a limit, everything from the cursor onwards is returned.
+    """
+    start = decode_cursor(cursor)
+    if limit is None:
+        return items[start:], None
+    end = start + limit
+    next_cursor = encode_cursor(end) if end < len(items) else None
+    return items[start:end], next_cursor
+
+
+def iter_json_array(items, key: str | None = None):
+    """
+    Yields a JSON array of `items` chunk by chunk, optionally wrapped as {"<key>": [...]}.
+    """
+    yield (f"{{{dumps(key)}:[" if key is not None else "[").encode()
+    for index, item in enumerate(items):
+        yield (("," if index else "") + dumps(item)).encode()
+    yield (b"]}" if key is not None else b"]")
+
+
+def iter_ndjson(items):
+    """
+    Yields `items` as newline-delimited JSON, one line per item.
+    """
+    for item in items:
+        yield (dumps(item) + "\n").encode()
+
+
+def stream_body(items, stream: str, key: str | None = None):
+    """
+    Returns the (chunk iterator, mimetype) pair for the requested stream format ("json" or "ndjson").
+    NDJSON ignores `key` since every line is a single item.
+    """
+    if stream == "ndjson":
+        return iter_ndjson(items), NDJSON_MIMETYPE
+    return iter_json_array(items, key=key), JSON_MIMETYPE
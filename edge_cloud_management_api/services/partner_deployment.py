@@ -0,0 +1,107 @@
+"""
+Deployment of an application to a partner OP zone, run as a job: the SRM manifest is translated to
+GSMA artefact, onboarding and deployment payloads (see gsma_translation) and sent to the Federation
+Manager step by step.
+"""
+from edge_cloud_management_api.configs.env_config import config
+from edge_cloud_management_api.services.client_registry import get_federation_client, get_pi_edge_client
+from edge_cloud_management_api.services.fanout import fan_out
+from edge_cloud_management_api.services.federation_tokens import federation_token
+from edge_cloud_management_api.services.gsma_translation import gsma_translator, manifest_hash
+from edge_cloud_management_api.services.job_engine import JobStepError, job_engine
+from edge_cloud_management_api.services.storage_service import get_fed
+
+PARTNER_DEPLOYMENT = "partner_deployment"
+
+
+def _token(fed_context_id: str) -> str:
+    fed = get_fed(fed_context_id)
+    if not fed:
+        raise JobStepError(f"Federation {fed_context_id} not found")
+    return federation_token(fed)
+
+
+def _check_response(step: str, response, accepted=(200,)):
+    if isinstance(response, dict):
+        raise JobStepError(f"{step} failed: {response.get('error', response)}")
+    if response.status_code not in accepted:
+        raise JobStepError(f"{step} failed with HTTP {response.status_code}: {response.text}")
+
+
+def fetch_app(job: dict) -> dict:
+    app_id = job['payload']['appId']
+    app = get_pi_edge_client().get_app(appId=app_id)
+    if not isinstance(app, dict) or 'error' in app or not app.get('appManifest'):
+        raise JobStepError(f"Failed to retrieve application metadata from SRM: {app}")
+    return {'_appManifest': app['appManifest'], '_manifestHash': manifest_hash(app['appManifest'])}
+
+
+def _payloads(job: dict):
+    state = job['state']
+    return gsma_translator.translate(job['payload']['appId'], state['_appManifest'], state.get('_manifestHash'))
+
+
+def create_artefact(job: dict) -> dict:
+    fed_context_id = job['payload']['fedContextId']
+    payloads = _payloads(job)
+    response = get_federation_client().create_artefact(artefact=payloads.artefact_body, federation_context_id=fed_context_id, token=_token(fed_context_id))
+    _check_response("Artefact creation", response, accepted=(200, 409))
+    return {'artefactId': payloads.artefact['artefactId']}
+
+
+def onboard_application(job: dict) -> dict:
+    fed_context_id = job['payload']['fedContextId']
+    response = get_federation_client().onboard_application(federation_context_id=fed_context_id, body=_payloads(job).onboarding_body, token=_token(fed_context_id))
+    if 'error' in response:
+        raise JobStepError(f"Onboarding failed: {response['error']}")
+    return {'onboarding': response}
+
+
+def _deploy_to_zone(fed_context_id: str, body: bytes):
+    response = get_federation_client().deploy_app_partner(federation_context_id=fed_context_id, body=body, token=_token(fed_context_id))
+    _check_response("Deployment", response, accepted=(200, 201, 202))
+    return response.json() if response.content else {}
+
+
+def deploy_application(job: dict) -> dict:
+    """
+    Deploys to every zone of the job concurrently; fails the job only when no zone could be deployed.
+    """
+    payload, fed_context_id = job['payload'], job['payload']['fedContextId']
+    app_id, app_manifest = payload['appId'], job['state']['_appManifest']
+    zone_ids = payload.get('zoneIds') or [payload['zoneId']]
+    outcomes = fan_out(
+        {zone_id: (lambda zone_id=zone_id: _deploy_to_zone(fed_context_id, gsma_translator.deployment_body(app_id, app_manifest, zone_id)))
+         for zone_id in zone_ids},
+        max_workers=config.FANOUT_MAX_WORKERS,
+        deadline=config.FANOUT_DEADLINE,
+    )
+    deployments = {
+        zone_id: {'status': 'deployed', 'response': outcome.value} if outcome.status == 'ok' else {'status': 'failed', 'error': outcome.error}
+        for zone_id, outcome in outcomes.items()
+    }
+    if all(deployment['status'] == 'failed' for deployment in deployments.values()):
+        raise JobStepError("; ".join(f"{zone_id}: {deployment['error']}" for zone_id, deployment in deployments.items()))
+    if 'zoneId' in payload:
+        return {'deployment': deployments[payload['zoneId']]['response']}
+    return {'deployments': deployments}
+
+
+job_engine.register(PARTNER_DEPLOYMENT, [
+    ("fetch_app", fetch_app),
+    ("create_artefact", create_artefact),
+    ("onboard_application", onboard_application),
+    ("deploy_application", deploy_application),
+])
+
+
+def submit_partner_deployment(app_id: str, zones: list) -> dict:
+    """
+    Queues the deployment of `app_id` to partner zone documents sharing one federation context; the
+    manifest fetch, artefact creation and onboarding are done once for all of them. Returns the job document.
+    """
+    return job_engine.submit(PARTNER_DEPLOYMENT, {
+        'appId': app_id,
+        'zoneIds': [zone.get('edgeCloudZoneId') for zone in zones],
+        'fedContextId': zones[0].get('fedContextId'),
+    })
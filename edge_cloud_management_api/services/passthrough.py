@@ -0,0 +1,41 @@
+"""
+Zero-parse relaying of SRM responses for pure proxy endpoints.
+
+The body received from SRM is streamed to the client chunk by chunk as it arrives, instead of being
+parsed with response.json() and encoded again, which keeps large lists off the CPU and the heap.
+Only successful responses are relayed; failures keep going through the endpoints' error handling.
+"""
+import httpx
+import requests
+from flask import Response
+from starlette.background import BackgroundTask
+from starlette.responses import StreamingResponse
+
+RELAY_CHUNK_SIZE = 64 * 1024
+DEFAULT_CONTENT_TYPE = "application/json"
+
+
+def relay_response(upstream: requests.Response) -> Response:
+    """
+    Returns a Flask response streaming the unread body of `upstream`; the upstream connection goes
+    back to the pool once the body was sent.
+    """
+    response = Response(
+        upstream.iter_content(RELAY_CHUNK_SIZE),
+        status=upstream.status_code,
+        content_type=upstream.headers.get("Content-Type", DEFAULT_CONTENT_TYPE),
+    )
+    response.call_on_close(upstream.close)
+    return response
+
+
+def relay_async_response(upstream: httpx.Response) -> StreamingResponse:
+    """
+    Asyncio counterpart of relay_response() for the responses of AsyncPiEdgeAPIClient._stream().
+    """
+    return StreamingResponse(
+        upstream.aiter_bytes(RELAY_CHUNK_SIZE),
+        status_code=upstream.status_code,
+        media_type=upstream.headers.get("Content-Type", DEFAULT_CONTENT_TYPE),
+        background=BackgroundTask(upstream.aclose),
+    )
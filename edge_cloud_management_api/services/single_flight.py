@@ -0,0 +1,92 @@
+import asyncio
+import threading
+
+
+class _Flight:
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent identical calls: while a call for `key` is in flight, other callers with the same
+    key wait for it and receive its result (or its exception) instead of starting their own.
+
+    Only the in-flight call is shared; nothing is cached once it returns. Callers share the returned
+    object, so it must be treated as read-only (a requests.Response is fine: .json() parses a new object).
+
+    Example:
+        response = flights.do(("GET", url), lambda: session.get(url, timeout=5))
+    """
+
+    def __init__(self):
+        self._flights: dict = {}
+        self._lock = threading.Lock()
+        self.calls = 0
+        self.shared = 0
+
+    def do(self, key, fn):
+        with self._lock:
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[key] = _Flight()
+                self.calls += 1
+            else:
+                self.shared += 1
+
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.result
+
+        try:
+            flight.result = fn()
+            return flight.result
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._flights[key]
+            flight.done.set()
+
+
+class AsyncSingleFlight:
+    """
+    Asyncio counterpart of SingleFlight; `fn` returns an awaitable. Use one instance per event loop.
+    """
+
+    def __init__(self):
+        self._flights: dict[object, asyncio.Future] = {}
+        self.calls = 0
+        self.shared = 0
+
+    async def do(self, key, fn):
+        flight = self._flights.get(key)
+        if flight is not None:
+            self.shared += 1
+            # A waiter that is cancelled must not cancel the call the others are waiting for
+            return await asyncio.shield(flight)
+
+        flight = self._flights[key] = asyncio.get_running_loop().create_future()
+        self.calls += 1
+        try:
+            result = await fn()
+        except asyncio.CancelledError:
+            flight.cancel()
+            raise
+        except BaseException as e:
+            flight.set_exception(e)
+            flight.exception()  # mark retrieved when nobody was waiting
+            raise
+        else:
+            flight.set_result(result)
+            return result
+        finally:
+            del self._flights[key]
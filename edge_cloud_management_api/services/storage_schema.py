@@ -0,0 +1,43 @@
+"""Indexes the storage layer relies on, declared per collection and created at startup."""
+import threading
+from pymongo import ASCENDING, DESCENDING, IndexModel
+from edge_cloud_management_api.managers.log_manager import logger
+
+COLLECTION_INDEXES = {
+    "zones": [
+        IndexModel([("isLocal", ASCENDING)], name="isLocal"),
+        IndexModel([("fedContextId", ASCENDING)], name="fedContextId"),
+        IndexModel([("edgeCloudProvider", ASCENDING)], name="edgeCloudProvider"),
+        IndexModel([("edgeCloudRegion", ASCENDING)], name="edgeCloudRegion"),
+    ],
+    "federations": [
+        IndexModel([("createdAt", DESCENDING)], name="createdAt"),
+    ],
+    "jobs": [
+        IndexModel([("status", ASCENDING), ("leaseUntil", ASCENDING)], name="status_leaseUntil"),
+    ],
+}
+
+
+def ensure_indexes(db):
+    """
+    Creates the declared indexes on the given database. Existing indexes are left untouched.
+    """
+    for collection, indexes in COLLECTION_INDEXES.items():
+        db[collection].create_indexes(indexes)
+
+
+def ensure_indexes_in_background(get_db):
+    """
+    Creates the declared indexes from a background thread so that startup never waits on MongoDB.
+    """
+    def run():
+        try:
+            ensure_indexes(get_db())
+            logger.info("Storage indexes are in place")
+        except Exception as e:
+            logger.error(f"Failed to create storage indexes: {e}")
+
+    thread = threading.Thread(target=run, name="storage-indexes", daemon=True)
+    thread.start()
+    return thread
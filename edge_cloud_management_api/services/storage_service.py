@@ -1,58 +1,137 @@
-from edge_cloud_management_api.configs.env_config import config
-import pymongo
+from datetime import datetime, timezone
+from pymongo import ASCENDING, DESCENDING, DeleteMany, ReplaceOne, ReturnDocument
+from edge_cloud_management_api.managers.db_manager import get_mongo_client
+from edge_cloud_management_api.services.storage_schema import ensure_indexes_in_background
 
-storage_url = mongo_host = config.MONGO_URI
 mydb_mongo = 'oeg_storage'
 
+def _db():
+        return get_mongo_client()[mydb_mongo]
+
+def _collection(collection: str):
+        return _db()[collection]
+
+def create_indexes():
+        """Creates the storage indexes in the background; called once at startup."""
+        return ensure_indexes_in_background(_db)
+
 def insert_zones(zone_list: list):
-        collection = "zones"
-        myclient = pymongo.MongoClient(storage_url)
-        mydbmongo = myclient[mydb_mongo]
-        col = mydbmongo[collection]
+        col = _collection("zones")
         col.insert_many(zone_list)
 
+def upsert_zones(zone_list: list):
+        """Inserts or replaces the given zone documents (keyed by _id) in one bulk write."""
+        if not zone_list:
+                return
+        col = _collection("zones")
+        col.bulk_write([ReplaceOne({'_id': zone['_id']}, zone, upsert=True) for zone in zone_list], ordered=False)
+
+def delete_zones(zone_ids: list):
+        """Deletes the given zone ids in one round trip."""
+        if not zone_ids:
+                return
+        col = _collection("zones")
+        col.delete_many({'_id': {'$in': list(zone_ids)}})
+
 def get_zone(zone_id: str):
-        collection = "zones"
-        myclient = pymongo.MongoClient(storage_url)
-        mydbmongo = myclient[mydb_mongo]
-        col = mydbmongo[collection]
+        col = _collection("zones")
         zone = col.find_one({'_id': zone_id})
         return zone
 
+def get_zones(zone_ids: list) -> list:
+        """Returns the zone documents of the given ids (unknown ids are skipped) in one round trip."""
+        if not zone_ids:
+                return []
+        col = _collection("zones")
+        return list(col.find({'_id': {'$in': list(zone_ids)}}))
+
+def get_local_zone_docs():
+        col = _collection("zones")
+        return list(col.find({'isLocal': 'true'}))
+
+def get_partner_zone_docs(fed_context_id: str | None = None):
+        col = _collection("zones")
+        query = {'isLocal': 'false'}
+        if fed_context_id is not None:
+                query['fedContextId'] = fed_context_id
+        return list(col.find(query))
+
+def apply_local_zone_changes(upserts: list, deleted_ids: list):
+        """Replaces/inserts the given local zone documents and deletes the given local zone ids in one bulk write."""
+        col = _collection("zones")
+        operations = [ReplaceOne({'_id': zone['_id']}, zone, upsert=True) for zone in upserts]
+        if deleted_ids:
+                operations.append(DeleteMany({'_id': {'$in': deleted_ids}, 'isLocal': 'true'}))
+        if operations:
+                col.bulk_write(operations, ordered=False)
+
 def delete_partner_zones():
-        collection = "zones"
-        myclient = pymongo.MongoClient(storage_url)
-        mydbmongo = myclient[mydb_mongo]
-        col = mydbmongo[collection]
+        col = _collection("zones")
         col.delete_many({'isLocal': 'false'})
 
 def insert_federation(fed: dict):
-        collection = 'federations'
-        myclient = pymongo.MongoClient(storage_url)
-        mydbmongo = myclient[mydb_mongo]
-        col = mydbmongo[collection]
-        col.insert_one(fed)
+        col = _collection('federations')
+        col.insert_one({**fed, 'createdAt': fed.get('createdAt') or datetime.now(timezone.utc)})
 
 def get_fed(fed_context_id: str):
-        collection = 'federations'
-        myclient = pymongo.MongoClient(storage_url)
-        mydbmongo = myclient[mydb_mongo]
-        col = mydbmongo[collection]
+        col = _collection('federations')
         fed = col.find_one({'_id': fed_context_id})
         return fed
 
+def update_fed_token(fed_context_id: str, token: str, token_expires_at: float):
+        col = _collection('federations')
+        col.update_one({'_id': fed_context_id}, {'$set': {'token': token, 'tokenExpiresAt': token_expires_at}})
+
+def get_latest_fed():
+        """Returns the most recently created federation, using the createdAt index."""
+        col = _collection('federations')
+        return col.find_one(sort=[('createdAt', DESCENDING)])
+
 def get_all_feds():
-        collection = 'federations'
-        myclient = pymongo.MongoClient(storage_url)
-        mydbmongo = myclient[mydb_mongo]
-        col = mydbmongo[collection]
-        feds = col.find()
-        return feds.to_list()
+        col = _collection('federations')
+        return list(col.find().sort('createdAt', ASCENDING))
 
 def delete_fed(fed_context_id: str):
-        collection = 'federations'
-        myclient = pymongo.MongoClient(storage_url)
-        mydbmongo = myclient[mydb_mongo]
-        col = mydbmongo[collection]
+        col = _collection('federations')
         col.delete_one({'_id': fed_context_id})
 
+JOB_ACTIVE_STATUSES = ['queued', 'running']
+
+def insert_job(job: dict) -> dict:
+        """Stores a new job document with its creation time and returns the stored document."""
+        col = _collection('jobs')
+        now = datetime.now(timezone.utc)
+        stored = {**job, 'createdAt': now, 'updatedAt': now}
+        col.insert_one(stored)
+        return stored
+
+def get_job(job_id: str):
+        col = _collection('jobs')
+        return col.find_one({'_id': job_id})
+
+def claim_job(job_id: str, owner: str, lease_until: datetime):
+        """Marks an active job as running under `owner` if it is unowned, already owned by `owner`, or its lease expired.
+        Returns the claimed job, or None if another worker holds it or it already finished."""
+        col = _collection('jobs')
+        now = datetime.now(timezone.utc)
+        return col.find_one_and_update(
+                {'_id': job_id, 'status': {'$in': JOB_ACTIVE_STATUSES},
+                 '$or': [{'owner': owner}, {'owner': None}, {'leaseUntil': {'$lt': now}}]},
+                {'$set': {'owner': owner, 'leaseUntil': lease_until, 'status': 'running', 'updatedAt': now}},
+                return_document=ReturnDocument.AFTER,
+        )
+
+def update_job(job_id: str, fields: dict, completed_step: str | None = None):
+        """Sets the given job fields and, when a step finished, appends it to completedSteps (the checkpoint)."""
+        col = _collection('jobs')
+        update = {'$set': {**fields, 'updatedAt': datetime.now(timezone.utc)}}
+        if completed_step is not None:
+                update['$push'] = {'completedSteps': completed_step}
+        col.update_one({'_id': job_id}, update)
+
+def get_resumable_job_ids() -> list:
+        """Ids of queued/running jobs whose lease expired, e.g. because their worker stopped."""
+        col = _collection('jobs')
+        query = {'status': {'$in': JOB_ACTIVE_STATUSES},
+                 '$or': [{'owner': None}, {'leaseUntil': {'$lt': datetime.now(timezone.utc)}}]}
+        return [job['_id'] for job in col.find(query, {'_id': 1}).sort('createdAt', ASCENDING)]
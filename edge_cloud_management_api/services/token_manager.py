@@ -0,0 +1,142 @@
+import threading
+import time
+from typing import NamedTuple
+from edge_cloud_management_api.managers.log_manager import logger
+from edge_cloud_management_api.services.circuit_breaker import get_upstream
+
+
+class TokenRequestError(Exception):
+    """Raised when the token endpoint does not return an access token."""
+
+
+class TokenConfigurationError(ValueError):
+    """Raised when the client credentials needed to request tokens are not configured."""
+
+
+class CachedToken(NamedTuple):
+    access_token: str
+    expires_at: float  # epoch seconds
+
+
+def needs_refresh(expires_at: float | None, margin: float) -> bool:
+    """
+    Returns True when a token expiring at `expires_at` (epoch seconds, None if unknown) is within
+    `margin` seconds of expiry.
+    """
+    return expires_at is None or time.time() >= expires_at - margin
+
+
+class OAuth2TokenManager:
+    """
+    Caches OAuth2 client-credentials access tokens per scope.
+
+    Tokens are served from memory until `refresh_margin` seconds before they expire. Inside the margin the
+    cached token is still served while a single background thread fetches the next one; once expired, the
+    calling thread fetches it and concurrent callers for the same scope wait for that one request (single-flight).
+
+    Example:
+        manager = OAuth2TokenManager(token_endpoint, client_id, client_secret, session=get_http_session())
+        token = manager.get_token("fed-mgmt")
+    """
+
+    def __init__(self, token_endpoint: str, client_id: str, client_secret: str, session,
+                 default_scope: str | None = None, refresh_margin: float = 30, timeout: float = 10,
+                 default_expires_in: float = 300, upstream=None):
+        self.token_endpoint = token_endpoint
+        self.client_id = client_id
+        self._client_secret = client_secret
+        self._session = session
+        self.default_scope = default_scope
+        self.refresh_margin = refresh_margin
+        self.timeout = timeout
+        self.default_expires_in = default_expires_in
+        self._upstream = upstream or get_upstream("token_endpoint")
+        self._tokens: dict[str | None, CachedToken] = {}
+        self._scope_locks: dict[str | None, threading.Lock] = {}
+        self._state_lock = threading.Lock()
+        self._refreshing: set = set()
+        self.hits = 0
+        self.fetches = 0
+
+    def _lock_for(self, scope: str | None) -> threading.Lock:
+        with self._state_lock:
+            return self._scope_locks.setdefault(scope, threading.Lock())
+
+    def get(self, scope: str | None = None, block: bool = True) -> CachedToken | None:
+        """
+        Returns the cached token for `scope`, fetching it when missing or expired.
+
+        :param block: when False, returns None instead of fetching in the calling thread.
+        """
+        scope = scope or self.default_scope
+        cached = self._tokens.get(scope)
+        now = time.time()
+        if cached is not None and now < cached.expires_at - self.refresh_margin:
+            self.hits += 1
+            return cached
+        if cached is not None and now < cached.expires_at:
+            self.hits += 1
+            self._refresh_in_background(scope)
+            return cached
+        if not block:
+            return None
+        with self._lock_for(scope):
+            # Another caller may have fetched the token while this one was waiting.
+            cached = self._tokens.get(scope)
+            if cached is not None and not needs_refresh(cached.expires_at, self.refresh_margin):
+                return cached
+            return self._fetch(scope)
+
+    def get_token(self, scope: str | None = None) -> str:
+        """
+        Returns a valid access token for `scope`.
+        """
+        return self.get(scope).access_token
+
+    def invalidate(self, scope: str | None = None):
+        """
+        Drops the cached token of `scope`, e.g. after the partner rejected it.
+        """
+        self._tokens.pop(scope or self.default_scope, None)
+
+    def _fetch(self, scope: str | None) -> CachedToken:
+        data = {"grant_type": "client_credentials"}
+        if scope:
+            data["scope"] = scope
+        # A client-credentials grant has no side effect, so it may be retried like an idempotent call
+        response = self._upstream.call(lambda: self._session.post(
+            self.token_endpoint,
+            data=data,
+            auth=(self.client_id, self._client_secret),
+            headers={"Content-Type": "application/x-www-form-urlencoded"},
+            timeout=self.timeout,
+        ), "POST", retry=True, operation="client_credentials")
+        response.raise_for_status()
+        payload = response.json()
+        access_token = payload.get("access_token")
+        if not access_token:
+            raise TokenRequestError(f"Token endpoint returned no access token for scope {scope}")
+        expires_in = float(payload.get("expires_in") or self.default_expires_in)
+        token = CachedToken(access_token, time.time() + expires_in)
+        self._tokens[scope] = token
+        self.fetches += 1
+        return token
+
+    def _refresh_in_background(self, scope: str | None):
+        with self._state_lock:
+            if scope in self._refreshing:
+                return
+            self._refreshing.add(scope)
+        threading.Thread(target=self._background_refresh, args=(scope,), name="token-refresh", daemon=True).start()
+
+    def _background_refresh(self, scope: str | None):
+        try:
+            with self._lock_for(scope):
+                cached = self._tokens.get(scope)
+                if cached is None or needs_refresh(cached.expires_at, self.refresh_margin):
+                    self._fetch(scope)
+        except Exception as e:
+            logger.error(f"Token refresh for scope {scope} failed, serving the cached token: {e}")
+        finally:
+            with self._state_lock:
+                self._refreshing.discard(scope)
@@ -0,0 +1,137 @@
+import threading
+import time
+from edge_cloud_management_api.managers.log_manager import logger
+from edge_cloud_management_api.managers.metrics_manager import metrics
+
+
+class ZoneCatalog:
+    """
+    In-process cache of the validated edge cloud zone list.
+
+    Entries younger than `ttl` are served directly. Entries younger than `ttl + stale_ttl` are still
+    served, while a single background thread reloads them (stale-while-revalidate). Older or missing
+    entries are reloaded in the calling thread; concurrent callers wait for that one load instead of
+    issuing their own (single-flight).
+
+    Example:
+        catalog = ZoneCatalog(loader=load_zones, ttl=30, stale_ttl=300)
+        zones = catalog.get_zones()
+    """
+
+    def __init__(self, loader, ttl: float, stale_ttl: float):
+        self._loader = loader
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self._zones: list[dict] | None = None
+        self._loaded_at = 0.0
+        self._load_lock = threading.Lock()
+        self._state_lock = threading.Lock()
+        self._refreshing = False
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.loads = 0
+        self.load_errors = 0
+
+    def _age(self) -> float:
+        return time.monotonic() - self._loaded_at
+
+    def get_zones(self, block: bool = True) -> list[dict] | None:
+        """
+        Returns the cached zone list, reloading it when it has expired.
+
+        :param block: when False, returns None instead of loading in the calling thread.
+        """
+        zones, age = self._zones, self._age()
+        if zones is not None and age < self.ttl:
+            self.hits += 1
+            return zones
+        if zones is not None and age < self.ttl + self.stale_ttl:
+            self.stale_hits += 1
+            self._refresh_in_background()
+            return zones
+        if not block:
+            return None
+        self.misses += 1
+        return self._refill()
+
+    def _refill(self) -> list[dict]:
+        with self._load_lock:
+            # Another caller may have completed the load while this one was waiting.
+            if self._zones is not None and self._age() < self.ttl:
+                return self._zones
+            return self._load()
+
+    def _load(self) -> list[dict]:
+        try:
+            zones = self._loader()
+        except Exception:
+            self.load_errors += 1
+            raise
+        self._zones = zones
+        self._loaded_at = time.monotonic()
+        self.loads += 1
+        return zones
+
+    def _refresh_in_background(self):
+        with self._state_lock:
+            if self._refreshing:
+                return
+            self._refreshing = True
+        threading.Thread(target=self._background_refresh, name="zone-catalog-refresh", daemon=True).start()
+
+    def _background_refresh(self):
+        try:
+            with self._load_lock:
+                self._load()
+        except Exception as e:
+            logger.error(f"Zone catalog refresh failed, serving stale zones: {e}")
+        finally:
+            with self._state_lock:
+                self._refreshing = False
+
+    def invalidate(self):
+        """
+        Drops the cached zones so the next request reloads them.
+        """
+        with self._load_lock:
+            self._zones = None
+            self._loaded_at = 0.0
+
+    def stats(self) -> dict:
+        """
+        Returns the cache counters and the age of the cached zones in seconds.
+        """
+        return {
+            "hits": self.hits,
+            "stale_hits": self.stale_hits,
+            "misses": self.misses,
+            "loads": self.loads,
+            "load_errors": self.load_errors,
+            "size": len(self._zones) if self._zones is not None else 0,
+            "age_seconds": self._age() if self._zones is not None else None,
+        }
+
+
+ZONE_CACHE_REQUESTS = metrics.counter("oeg_zone_cache_requests_total", "Zone catalog lookups by result: hit, stale or miss", ("result",))
+ZONE_CACHE_LOADS = metrics.counter("oeg_zone_cache_loads_total", "Zone catalog loads by outcome: ok or error", ("outcome",))
+ZONE_CACHE_ZONES = metrics.gauge("oeg_zone_cache_zones", "Zones held by the zone catalog")
+ZONE_CACHE_AGE = metrics.gauge("oeg_zone_cache_age_seconds", "Seconds since the zones of the zone catalog were loaded")
+
+
+def export_metrics(catalog: ZoneCatalog):
+    """
+    Registers a collector copying the counters of `catalog` into the oeg_zone_cache_* metrics on every scrape.
+    """
+    def collect():
+        stats = catalog.stats()
+        ZONE_CACHE_REQUESTS.set(stats["hits"], result="hit")
+        ZONE_CACHE_REQUESTS.set(stats["stale_hits"], result="stale")
+        ZONE_CACHE_REQUESTS.set(stats["misses"], result="miss")
+        ZONE_CACHE_LOADS.set(stats["loads"], outcome="ok")
+        ZONE_CACHE_LOADS.set(stats["load_errors"], outcome="error")
+        ZONE_CACHE_ZONES.set(stats["size"])
+        if stats["age_seconds"] is not None:
+            ZONE_CACHE_AGE.set(stats["age_seconds"])
+
+    metrics.on_collect(collect)
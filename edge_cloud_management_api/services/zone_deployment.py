@@ -0,0 +1,71 @@
+"""
+Planning of a multi-zone POST /appinstances request: the requested appZones are split into local SRM
+zones, deployed with one batched SRM call, and partner zones grouped by federation context, each group
+deployed by one partner deployment job.
+"""
+from typing import NamedTuple
+
+
+class ZonePlan(NamedTuple):
+    local: list
+    partners: dict
+    unknown: list
+
+
+def requested_zone_ids(app_zones: list) -> list:
+    """
+    Returns the edgeCloudZoneIds of an appZones list, without duplicates and in request order.
+    """
+    zone_ids = []
+    for entry in app_zones:
+        zone_id = ((entry or {}).get('EdgeCloudZone') or {}).get('edgeCloudZoneId')
+        if zone_id not in zone_ids:
+            zone_ids.append(zone_id)
+    return zone_ids
+
+
+def plan_zones(app_zones: list, zone_docs: list) -> ZonePlan:
+    """
+    Splits the requested appZones using the catalog documents of those zones.
+
+    `local` keeps the appZones entries of local zones as sent by the caller (they form the SRM body),
+    `partners` maps each fedContextId to its partner zone documents and `unknown` lists zone ids that
+    are not in the catalog.
+    """
+    docs = {doc['_id']: doc for doc in zone_docs}
+    local, partners, unknown, seen = [], {}, [], set()
+    for entry in app_zones:
+        zone_id = ((entry or {}).get('EdgeCloudZone') or {}).get('edgeCloudZoneId')
+        if zone_id in seen:
+            continue
+        seen.add(zone_id)
+        doc = docs.get(zone_id)
+        if doc is None:
+            unknown.append(zone_id)
+        elif doc.get('isLocal') == 'false':
+            partners.setdefault(doc.get('fedContextId'), []).append(doc)
+        else:
+            local.append(entry)
+    return ZonePlan(local, partners, unknown)
+
+
+def zone_result(zone_id: str, target: str, status: str, **details) -> dict:
+    """
+    Returns the per-zone entry of a multi-zone deployment response.
+    """
+    return {'edgeCloudZoneId': zone_id, 'target': target, 'status': status, **details}
+
+
+def local_results(plan: ZonePlan, response) -> list:
+    """
+    Per-zone results of the batched SRM deployment: every local zone shares the outcome of that call.
+    """
+    failed = isinstance(response, dict) and 'error' in response
+    return [
+        zone_result(entry['EdgeCloudZone']['edgeCloudZoneId'], 'local', 'failed' if failed else 'accepted', details=response)
+        for entry in plan.local
+    ]
+
+
+def unknown_results(plan: ZonePlan) -> list:
+    return [zone_result(zone_id, 'unknown', 'notFound', details='Zone is not in the zone catalog') for zone_id in plan.unknown]
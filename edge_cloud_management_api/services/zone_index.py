@@ -0,0 +1,100 @@
+import threading
+
+
+class ZoneIndex:
+    """
+    In-memory secondary indexes over the edge cloud zone list.
+
+    Each indexed attribute (region, status, provider, local vs federated) maps a value to the set of
+    zone ids carrying it, so a filtered query only touches the zones it returns. `update` diffs the new
+    zone list against the indexed one and only re-indexes zones that were added, changed or removed.
+
+    Example:
+        index = ZoneIndex()
+        index.update(zones, local_zone_ids={"zone-1"})
+        active_in_region = index.query(region="Region1", status="active")
+    """
+
+    FIELDS = {
+        "region": "edgeCloudRegion",
+        "status": "edgeCloudZoneStatus",
+        "provider": "edgeCloudProvider",
+    }
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        # zone id -> (position in the zone list, zone, is_local)
+        self._entries: dict[str, tuple[int, dict, bool]] = {}
+        self._postings: dict[str, dict] = {name: {} for name in (*self.FIELDS, "local")}
+        self.version = 0
+
+    def _keys(self, zone: dict, is_local: bool):
+        for name, field in self.FIELDS.items():
+            yield name, zone.get(field)
+        yield "local", is_local
+
+    def _add(self, zone_id: str, zone: dict, is_local: bool):
+        for name, value in self._keys(zone, is_local):
+            self._postings[name].setdefault(value, set()).add(zone_id)
+
+    def _remove(self, zone_id: str, zone: dict, is_local: bool):
+        for name, value in self._keys(zone, is_local):
+            ids = self._postings[name].get(value)
+            if ids is None:
+                continue
+            ids.discard(zone_id)
+            if not ids:
+                del self._postings[name][value]
+
+    def update(self, zones: list[dict], local_zone_ids=None) -> dict:
+        """
+        Re-indexes the zones that differ from the currently indexed list.
+
+        :param zones: the full, validated zone list, in the order queries should return it.
+        :param local_zone_ids: ids of zones served by the local Operator Platform; None means all of them.
+        :return: counts of added, changed and removed zones.
+        """
+        incoming = {}
+        for position, zone in enumerate(zones):
+            zone_id = zone["edgeCloudZoneId"]
+            is_local = local_zone_ids is None or zone_id in local_zone_ids
+            incoming[zone_id] = (position, zone, is_local)
+
+        added = changed = removed = 0
+        with self._lock:
+            for zone_id, (_, zone, is_local) in self._entries.items():
+                if zone_id not in incoming:
+                    self._remove(zone_id, zone, is_local)
+                    removed += 1
+            for zone_id, (_, zone, is_local) in incoming.items():
+                current = self._entries.get(zone_id)
+                if current is None:
+                    self._add(zone_id, zone, is_local)
+                    added += 1
+                elif current[1] != zone or current[2] != is_local:
+                    self._remove(zone_id, current[1], current[2])
+                    self._add(zone_id, zone, is_local)
+                    changed += 1
+            self._entries = incoming
+            if added or changed or removed:
+                self.version += 1
+        return {"added": added, "changed": changed, "removed": removed}
+
+    def query(self, region=None, status=None, provider=None, local: bool | None = None) -> list[dict]:
+        """
+        Returns the zones matching every given filter, in zone list order. None filters are ignored.
+        """
+        filters = {"region": region, "status": status, "provider": provider, "local": local}
+        with self._lock:
+            candidates = [self._postings[name].get(value, set()) for name, value in filters.items() if value is not None]
+            if not candidates:
+                entries = list(self._entries.values())
+            else:
+                candidates.sort(key=len)
+                smallest, rest = candidates[0], candidates[1:]
+                entries = [self._entries[zone_id] for zone_id in smallest if all(zone_id in ids for ids in rest)]
+        entries.sort(key=lambda entry: entry[0])
+        return [zone for _, zone, _ in entries]
+
+    def __len__(self):
+        return len(self._entries)
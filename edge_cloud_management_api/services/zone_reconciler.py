@@ -0,0 +1,84 @@
+import threading
+from edge_cloud_management_api.configs.env_config import config
+from edge_cloud_management_api.managers.log_manager import logger
+from edge_cloud_management_api.services.client_registry import get_pi_edge_client
+from edge_cloud_management_api.services.storage_service import get_local_zone_docs, apply_local_zone_changes
+
+
+def to_local_zone_doc(node: dict) -> dict:
+    """
+    Maps an SRM node to its document in the zones collection.
+    """
+    return {**node, '_id': node.get('edgeCloudZoneId'), 'isLocal': 'true'}
+
+
+class ZoneReconciler:
+    """
+    Keeps the local zones of the Mongo zones collection in line with the SRM node list.
+
+    Every `interval` seconds a background thread diffs the SRM nodes against the stored local zones
+    and applies only the inserted, changed and removed zones in a single bulk write; an empty node list
+    removes every local zone, while a failed fetch leaves them untouched. `version` is incremented each
+    time the stored zone set changes.
+
+    Example:
+        reconciler = ZoneReconciler(fetch_nodes=api_client.list_nodes, interval=60)
+        reconciler.start()
+    """
+
+    def __init__(self, fetch_nodes, interval: float):
+        self._fetch_nodes = fetch_nodes
+        self.interval = interval
+        self.version = 0
+        self._stop_event = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def reconcile_once(self) -> dict:
+        """
+        Runs one diff-and-apply pass and returns the number of inserted, updated and deleted zones.
+        """
+        desired = {zone['_id']: zone for zone in map(to_local_zone_doc, self._fetch_nodes())}
+        stored = {zone['_id']: zone for zone in get_local_zone_docs()}
+
+        inserted = [zone for zone_id, zone in desired.items() if zone_id not in stored]
+        updated = [zone for zone_id, zone in desired.items() if zone_id in stored and stored[zone_id] != zone]
+        deleted_ids = [zone_id for zone_id in stored if zone_id not in desired]
+
+        if inserted or updated or deleted_ids:
+            apply_local_zone_changes(inserted + updated, deleted_ids)
+            self.version += 1
+        return {"inserted": len(inserted), "updated": len(updated), "deleted": len(deleted_ids)}
+
+    def _run(self):
+        while not self._stop_event.is_set():
+            try:
+                changes = self.reconcile_once()
+                if any(changes.values()):
+                    logger.info(f"Zone reconciliation applied {changes}, version {self.version}")
+            except Exception as e:
+                logger.error(f"Zone reconciliation failed: {e}")
+            self._stop_event.wait(self.interval)
+
+    def start(self):
+        """
+        Starts reconciling in a background thread; the first pass runs immediately without blocking startup.
+        """
+        if self.interval <= 0 or (self._thread is not None and self._thread.is_alive()):
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name="zone-reconciler", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 5):
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+
+def _fetch_srm_nodes() -> list[dict]:
+    # An empty list is a valid answer (every local zone was removed); only a failed fetch raises
+    return get_pi_edge_client().list_nodes()
+
+
+zone_reconciler = ZoneReconciler(fetch_nodes=_fetch_srm_nodes, interval=config.ZONE_RECONCILE_INTERVAL)
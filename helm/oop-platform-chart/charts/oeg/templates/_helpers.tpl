@@ -104,3 +104,10 @@ Return the proper namespace
 {{- define "oeg.namespace" -}}
 {{- default .Release.Namespace .Values.global.namespace }}
 {{- end }}
+
+{{/*
+Name of the Secret holding the OAuth2 client credentials (TOKEN_CLIENT_ID / TOKEN_CLIENT_SECRET)
+*/}}
+{{- define "oeg.tokenSecretName" -}}
+{{- default (printf "%s-token-credentials" .Values.oegcontroller.name) .Values.oegcontroller.tokenCredentials.existingSecret }}
+{{- end }}
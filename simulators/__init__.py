@@ -0,0 +1,8 @@
+"""
+Stand-in SRM and Federation Manager servers for running and load-testing the gateway offline.
+
+    python -m simulators.srm --port 8081
+    python -m simulators.federation_manager --port 8082
+
+See the "Local simulators" section of the README for the fault options.
+"""
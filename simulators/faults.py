@@ -0,0 +1,134 @@
+import argparse
+import math
+import random
+import threading
+
+LATENCY_DISTRIBUTIONS = ("none", "fixed", "uniform", "normal", "lognormal", "exponential")
+
+
+class LatencyDistribution:
+    """
+    Response delay in milliseconds drawn from a named distribution.
+
+    The specification is `name` or `name:param[,param]`, with every parameter in milliseconds except the
+    lognormal sigma:
+        none                      no delay
+        fixed:20                  always 20 ms
+        uniform:5,50              uniformly between 5 and 50 ms
+        normal:20,5               mean 20 ms, standard deviation 5 ms (never below 0)
+        lognormal:20,0.8          median 20 ms, sigma 0.8 (long right tail, like real services)
+        exponential:20            mean 20 ms
+    """
+
+    def __init__(self, spec: str = "none"):
+        name, _, params = spec.partition(":")
+        if name not in LATENCY_DISTRIBUTIONS:
+            raise ValueError(f"Unknown latency distribution '{name}', expected one of {', '.join(LATENCY_DISTRIBUTIONS)}")
+        self.name = name
+        self.params = tuple(float(param) for param in params.split(",")) if params else ()
+        expected = {"none": 0, "fixed": 1, "uniform": 2, "normal": 2, "lognormal": 2, "exponential": 1}[name]
+        if len(self.params) != expected:
+            raise ValueError(f"Latency distribution '{name}' takes {expected} parameter(s), got '{spec}'")
+        self.spec = spec
+
+    def sample(self, rng: random.Random) -> float:
+        """Returns one delay in seconds."""
+        if self.name == "none":
+            return 0.0
+        if self.name == "fixed":
+            ms = self.params[0]
+        elif self.name == "uniform":
+            ms = rng.uniform(*self.params)
+        elif self.name == "normal":
+            ms = rng.gauss(*self.params)
+        elif self.name == "lognormal":
+            ms = rng.lognormvariate(math.log(self.params[0]), self.params[1])
+        else:
+            ms = rng.expovariate(1 / self.params[0])
+        return max(ms, 0.0) / 1000
+
+
+class FaultProfile:
+    """
+    How a simulator misbehaves: delay before answering, share of failed calls, size of list payloads and
+    slow-drip delivery of response bodies.
+
+    All random draws come from one generator seeded with `seed`, so a run with the same seed and the same
+    request sequence sees the same delays and failures.
+
+    Example:
+        profile = FaultProfile(latency=LatencyDistribution("lognormal:20,0.8"), error_rate=0.01, seed=7)
+        delay, status = profile.draw()
+    """
+
+    def __init__(
+        self,
+        latency: LatencyDistribution | None = None,
+        error_rate: float = 0.0,
+        error_status: int = 503,
+        items: int = 10,
+        padding: int = 0,
+        drip_bytes: int = 0,
+        drip_interval: float = 0.0,
+        seed: int | None = None,
+    ):
+        if not 0.0 <= error_rate <= 1.0:
+            raise ValueError("error_rate must be between 0 and 1")
+        self.latency = latency or LatencyDistribution()
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.items = items
+        self.padding = padding
+        self.drip_bytes = drip_bytes
+        self.drip_interval = drip_interval
+        self.seed = seed
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def draw(self) -> tuple[float, int | None]:
+        """
+        Returns the delay in seconds for the next response, and the error status it must fail with (or None).
+        """
+        with self._lock:
+            delay = self.latency.sample(self._rng)
+            failed = self.error_rate > 0 and self._rng.random() < self.error_rate
+        return delay, self.error_status if failed else None
+
+    def pad(self, item: dict) -> dict:
+        """Returns `item` with a filler field of `padding` characters, to inflate payload sizes."""
+        return {**item, "padding": "x" * self.padding} if self.padding else item
+
+    def chunks(self, body: bytes):
+        """Splits a body into the pieces sent one by one when slow drip is enabled."""
+        if not self.drip_bytes:
+            yield body
+            return
+        for start in range(0, len(body), self.drip_bytes):
+            yield body[start:start + self.drip_bytes]
+
+
+def add_arguments(parser: argparse.ArgumentParser):
+    """Adds the command line options shared by the simulators."""
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, required=True)
+    parser.add_argument("--latency", default="none", help="latency distribution, e.g. fixed:20, uniform:5,50, lognormal:20,0.8")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="share of requests answered with --error-status (0-1)")
+    parser.add_argument("--error-status", type=int, default=503)
+    parser.add_argument("--items", type=int, default=10, help="number of items in the seeded list payloads")
+    parser.add_argument("--padding", type=int, default=0, help="filler characters added to every item")
+    parser.add_argument("--drip-bytes", type=int, default=0, help="send bodies in chunks of this many bytes (0 disables slow drip)")
+    parser.add_argument("--drip-interval-ms", type=float, default=0.0, help="pause between slow-drip chunks")
+    parser.add_argument("--seed", type=int, default=None, help="seed of the delay, failure and data generator")
+
+
+def profile_from_args(args: argparse.Namespace) -> FaultProfile:
+    return FaultProfile(
+        latency=LatencyDistribution(args.latency),
+        error_rate=args.error_rate,
+        error_status=args.error_status,
+        items=args.items,
+        padding=args.padding,
+        drip_bytes=args.drip_bytes,
+        drip_interval=args.drip_interval_ms / 1000,
+        seed=args.seed,
+    )
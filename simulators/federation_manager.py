@@ -0,0 +1,162 @@
+"""
+Federation Manager simulator: the endpoints FederationManagerClient and AsyncFederationManagerClient call,
+plus an OAuth2 client-credentials token endpoint, backed by in-memory state.
+
+Usage:
+    python -m simulators.federation_manager --port 8082 --latency uniform:10,80 --items 50
+    FEDERATION_MANAGER_HOST=http://127.0.0.1:8082 TOKEN_ENDPOINT=http://127.0.0.1:8082/token TOKEN_CLIENT_ID=sim TOKEN_CLIENT_SECRET=sim python -m edge_cloud_management_api
+"""
+import argparse
+import random
+import threading
+import uuid
+from simulators.faults import FaultProfile, add_arguments, profile_from_args
+from simulators.server import Routes, SimulatorServer, serve
+
+
+def _uuid(rng: random.Random) -> str:
+    return str(uuid.UUID(int=rng.getrandbits(128), version=4))
+
+
+class FederationState:
+    """
+    Federations, onboarded applications, deployments, synchronized zones and artefacts of the simulated
+    Federation Manager. Every new federation offers `items` availability zones (generated from `seed`).
+    """
+
+    def __init__(self, profile: FaultProfile):
+        self.profile = profile
+        self.lock = threading.Lock()
+        self._rng = random.Random(profile.seed)
+        self.federations = {}
+        self.apps = {}
+        self.deployments = {}
+        self.zones = {}
+        self.artefacts = {}
+
+    def new_id(self) -> str:
+        with self.lock:
+            return _uuid(self._rng)
+
+    def offered_zones(self) -> list[dict]:
+        return [
+            self.profile.pad({"zoneId": self.new_id(), "geographyDetails": f"sim-partner-zone-{i}", "geolocation": "48.8566,2.3522"})
+            for i in range(self.profile.items)
+        ]
+
+
+def build_routes(state: FederationState) -> Routes:
+    routes = Routes()
+
+    def not_found(name: str):
+        return 404, {"detail": f"{name} not found"}
+
+    def token(request):
+        return 200, {"access_token": f"simulated-{state.new_id()}", "token_type": "Bearer", "expires_in": 3600}
+
+    def post_partner(request):
+        body = request.json() or {}
+        created = {
+            "federationContextId": state.new_id(),
+            "partnerOPFederationId": "simulated-partner-op",
+            "partnerOPCountryCode": "FR",
+            "partnerOPMobileNetworkCodes": {"mcc": "208", "mncs": ["01"]},
+            "partnerOPFixedNetworkCodes": [],
+            "offeredAvailabilityZones": state.offered_zones(),
+            "platformCaps": ["homeRouting"],
+            "origOPFederationId": body.get("origOPFederationId"),
+        }
+        with state.lock:
+            state.federations[created["federationContextId"]] = created
+        return 200, created
+
+    def get_partner(request):
+        found = state.federations.get(request.params["federationContextId"])
+        return (200, found) if found is not None else not_found("Federation")
+
+    def delete_partner(request):
+        with state.lock:
+            found = state.federations.pop(request.params["federationContextId"], None)
+        return (200, {"federationContextId": request.params["federationContextId"]}) if found is not None else not_found("Federation")
+
+    def get_federation_context_ids(request):
+        ids = list(state.federations)
+        return (200, {"federationContextId": ids[-1]}) if ids else not_found("Federation")
+
+    def onboard(request):
+        body = request.json() or {}
+        app_id = body.get("appId") or state.new_id()
+        onboarded = {**body, "appId": app_id, "onboardStatusInfo": "ONBOARDED"}
+        with state.lock:
+            state.apps[(request.params["federationContextId"], app_id)] = onboarded
+        return 200, onboarded
+
+    def get_onboarded(request):
+        found = state.apps.get((request.params["federationContextId"], request.params["appId"]))
+        return (200, found) if found is not None else not_found("Application")
+
+    def delete_onboarded(request):
+        with state.lock:
+            found = state.apps.pop((request.params["federationContextId"], request.params["appId"]), None)
+        return (200, {"appId": request.params["appId"]}) if found is not None else not_found("Application")
+
+    def deploy(request):
+        body = request.json() or {}
+        instance = {"appInstIdentifier": state.new_id(), "zoneId": body.get("zoneInfo", {}).get("zoneId"), "appInstanceState": "PENDING"}
+        with state.lock:
+            state.deployments[instance["appInstIdentifier"]] = instance
+        return 202, instance
+
+    def zone_sync(request):
+        body = request.json() or {}
+        zones = [{"zoneId": zone_id, "reservedComputeResources": [], "computeResourceQuotaLimits": []} for zone_id in body.get("acceptedAvailabilityZones") or []]
+        with state.lock:
+            for zone in zones:
+                state.zones[(request.params["federationContextId"], zone["zoneId"])] = zone
+        return 200, {"acceptedZoneResourceInfo": zones}
+
+    def get_zone(request):
+        found = state.zones.get((request.params["federationContextId"], request.params["zoneId"]))
+        return (200, found) if found is not None else not_found("Zone")
+
+    def remove_zone(request):
+        with state.lock:
+            found = state.zones.pop((request.params["federationContextId"], request.params["zoneId"]), None)
+        return (200, {"zoneId": request.params["zoneId"]}) if found is not None else not_found("Zone")
+
+    def create_artefact(request):
+        body = request.json() or {}
+        artefact_id = body.get("artefactId") or state.new_id()
+        with state.lock:
+            state.artefacts[artefact_id] = body
+        return 200, {"artefactId": artefact_id}
+
+    routes.add("POST", "/token", token)
+    routes.add("POST", "/partner", post_partner)
+    routes.add("GET", "/fed-context-id", get_federation_context_ids)
+    routes.add("GET", "/{federationContextId}/partner", get_partner)
+    routes.add("DELETE", "/{federationContextId}/partner", delete_partner)
+    routes.add("POST", "/{federationContextId}/application/onboarding", onboard)
+    routes.add("GET", "/{federationContextId}/application/onboarding/app/{appId}", get_onboarded)
+    routes.add("DELETE", "/{federationContextId}/application/onboarding/app/{appId}", delete_onboarded)
+    routes.add("POST", "/{federationContextId}/application/lcm", deploy)
+    routes.add("POST", "/{federationContextId}/zones", zone_sync)
+    routes.add("GET", "/{federationContextId}/zones/{zoneId}", get_zone)
+    routes.add("DELETE", "/{federationContextId}/zones/{zoneId}", remove_zone)
+    routes.add("POST", "/{federationContextId}/artefact", create_artefact)
+    return routes
+
+
+def create_server(host: str, port: int, profile: FaultProfile) -> SimulatorServer:
+    return SimulatorServer((host, port), build_routes(FederationState(profile)), profile, name="federation-manager")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    add_arguments(parser)
+    args = parser.parse_args(argv)
+    serve(create_server(args.host, args.port, profile_from_args(args)))
+
+
+if __name__ == "__main__":
+    main()
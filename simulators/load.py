@@ -0,0 +1,86 @@
+"""
+Closed-loop load generator: `--concurrency` workers send `--requests` GETs in total to one URL, each
+on its own keep-alive connection, and the run reports throughput, status codes and latency percentiles.
+
+Usage:
+    python -m simulators.load --url http://127.0.0.1:8080/oeg/1.0.0/edge-cloud-zones --concurrency 32 --requests 5000
+"""
+import argparse
+import statistics
+import threading
+import time
+from collections import Counter
+import requests
+
+
+def percentile(sorted_samples: list[float], fraction: float) -> float:
+    if not sorted_samples:
+        return 0.0
+    return sorted_samples[min(len(sorted_samples) - 1, int(fraction * len(sorted_samples)))]
+
+
+def run(url: str, concurrency: int, total: int, timeout: float = 30) -> dict:
+    """
+    Sends `total` GETs to `url` from `concurrency` threads and returns the throughput, status counts and
+    latency percentiles in milliseconds. Transport errors are counted under the "error" status.
+    """
+    latencies: list[float] = []
+    statuses: Counter = Counter()
+    lock = threading.Lock()
+    remaining = iter(range(total))
+
+    def worker():
+        session = requests.Session()
+        while True:
+            with lock:
+                if next(remaining, None) is None:
+                    break
+            started = time.perf_counter()
+            try:
+                status = session.get(url, timeout=timeout).status_code
+            except requests.RequestException:
+                status = "error"
+            elapsed = time.perf_counter() - started
+            with lock:
+                latencies.append(elapsed)
+                statuses[status] += 1
+        session.close()
+
+    started = time.perf_counter()
+    threads = [threading.Thread(target=worker) for _ in range(concurrency)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    duration = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        "requests": len(latencies),
+        "seconds": duration,
+        "throughput": len(latencies) / duration if duration else 0.0,
+        "statuses": dict(statuses),
+        "mean_ms": statistics.fmean(latencies) * 1000 if latencies else 0.0,
+        **{f"p{int(q * 1000) / 10:g}_ms": percentile(latencies, q) * 1000 for q in (0.5, 0.9, 0.99, 0.999)},
+        "max_ms": latencies[-1] * 1000 if latencies else 0.0,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--url", required=True)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--requests", type=int, default=1000)
+    parser.add_argument("--timeout", type=float, default=30)
+    args = parser.parse_args(argv)
+
+    result = run(args.url, args.concurrency, args.requests, args.timeout)
+    print(f"{result['requests']} requests in {result['seconds']:.2f} s: {result['throughput']:.1f} req/s, statuses {result['statuses']}")
+    print(
+        f"latency ms: mean {result['mean_ms']:.1f}  p50 {result['p50_ms']:.1f}  p90 {result['p90_ms']:.1f}  "
+        f"p99 {result['p99_ms']:.1f}  p99.9 {result['p99.9_ms']:.1f}  max {result['max_ms']:.1f}"
+    )
+
+
+if __name__ == "__main__":
+    main()
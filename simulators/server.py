@@ -0,0 +1,183 @@
+import json
+import re
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit
+from simulators.faults import FaultProfile
+
+METHOD_NOT_ALLOWED = object()
+
+
+class SimulatedRequest:
+    """What a route handler sees of a request: path parameters, headers and the decoded JSON body."""
+
+    def __init__(self, method: str, path: str, params: dict, headers, body: bytes):
+        self.method = method
+        self.path = path
+        self.params = params
+        self.headers = headers
+        self.body = body
+
+    def json(self):
+        return json.loads(self.body) if self.body else None
+
+
+class Routes:
+    """
+    Route table of a simulator: (method, path pattern) -> handler.
+
+    Patterns use `{name}` placeholders for one path segment. A handler takes a SimulatedRequest and
+    returns `(status, payload)` or `(status, payload, headers)`; the payload is encoded as JSON unless
+    it is None (empty body).
+
+    Example:
+        routes = Routes()
+        routes.add("GET", "/node/{zoneId}", lambda request: (200, nodes[request.params["zoneId"]]))
+    """
+
+    def __init__(self):
+        self._routes: list[tuple[str, re.Pattern, object]] = []
+
+    def add(self, method: str, pattern: str, handler):
+        regex = re.sub(r"\{(\w+)\}", r"(?P<\1>[^/]+)", pattern.rstrip("/") or "/")
+        self._routes.append((method, re.compile(f"^{regex}/?$"), handler))
+
+    def match(self, method: str, path: str):
+        """Returns (handler, params); handler is None for an unknown path and METHOD_NOT_ALLOWED for a wrong method."""
+        allowed = False
+        for route_method, regex, handler in self._routes:
+            found = regex.match(path)
+            if found:
+                if route_method == method:
+                    return handler, found.groupdict()
+                allowed = True
+        return (METHOD_NOT_ALLOWED if allowed else None), {}
+
+
+class SimulatorServer(ThreadingHTTPServer):
+    """
+    Threaded HTTP/1.1 server answering `routes` with the delays, failures and slow-drip delivery of `profile`.
+
+    Connections are kept alive like a real upstream, so the gateway's connection pools are exercised.
+    `GET /_simulator/stats` returns the request counters and is never delayed or failed.
+    """
+
+    daemon_threads = True
+    request_queue_size = 1024
+
+    def __init__(self, address: tuple[str, int], routes: Routes, profile: FaultProfile, name: str):
+        self.routes = routes
+        self.profile = profile
+        self.name = name
+        self.requests = 0
+        self.failures = 0
+        self._counter_lock = threading.Lock()
+        super().__init__(address, SimulatorRequestHandler)
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def count(self, failed: bool):
+        with self._counter_lock:
+            self.requests += 1
+            self.failures += failed
+
+    def stats(self) -> dict:
+        return {
+            "simulator": self.name,
+            "requests": self.requests,
+            "failures": self.failures,
+            "latency": self.profile.latency.spec,
+            "errorRate": self.profile.error_rate,
+        }
+
+    def handle_error(self, request, client_address):
+        # Clients dropping keep-alive connections (e.g. a gateway shutting down) are expected under load
+        if not isinstance(sys.exc_info()[1], ConnectionError):
+            super().handle_error(request, client_address)
+
+    def start_in_background(self) -> threading.Thread:
+        """Serves from a daemon thread, e.g. inside tests; stop with shutdown()."""
+        thread = threading.Thread(target=self.serve_forever, name=f"{self.name}-simulator", daemon=True)
+        thread.start()
+        return thread
+
+
+class SimulatorRequestHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server: SimulatorServer
+
+    def log_message(self, format, *args):
+        pass
+
+    def _handle(self):
+        path = urlsplit(self.path).path
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length) if length else b""
+
+        if path == "/_simulator/stats":
+            self._send(200, self.server.stats())
+            return
+
+        delay, error_status = self.server.profile.draw()
+        if delay:
+            time.sleep(delay)
+        self.server.count(error_status is not None)
+        if error_status is not None:
+            self._send(error_status, {"detail": f"Simulated {self.server.name} failure"})
+            return
+
+        handler, params = self.server.routes.match(self.command, path)
+        if handler is None:
+            self._send(404, {"detail": f"No route for {path}"})
+            return
+        if handler is METHOD_NOT_ALLOWED:
+            self._send(405, {"detail": f"Method {self.command} not allowed for {path}"})
+            return
+        try:
+            result = handler(SimulatedRequest(self.command, path, params, self.headers, body))
+        except (ValueError, KeyError) as e:
+            self._send(400, {"detail": f"Bad request: {e}"})
+            return
+        self._send(*result)
+
+    def _send(self, status: int, payload, headers: dict | None = None):
+        body = b"" if payload is None else json.dumps(payload, separators=(",", ":")).encode()
+        self.send_response(status)
+        if body:
+            self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        if self.command == "HEAD" or status == 304:
+            return
+        profile = self.server.profile
+        for i, chunk in enumerate(profile.chunks(body)):
+            if i and profile.drip_interval:
+                time.sleep(profile.drip_interval)
+            self.wfile.write(chunk)
+            self.wfile.flush()
+
+    do_GET = do_POST = do_PUT = do_PATCH = do_DELETE = _handle
+
+
+def serve(server: SimulatorServer):
+    """Serves until interrupted."""
+    profile = server.profile
+    print(
+        f"{server.name} simulator on {server.url}: latency {profile.latency.spec}, error rate {profile.error_rate}, "
+        f"{profile.items} items, padding {profile.padding}, drip {profile.drip_bytes} B / {profile.drip_interval * 1000:g} ms, "
+        f"seed {profile.seed}",
+        flush=True,
+    )
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
@@ -0,0 +1,171 @@
+"""
+Service Resource Manager simulator: the SRM endpoints PiEdgeAPIClient and AsyncPiEdgeAPIClient call,
+backed by in-memory state.
+
+Usage:
+    python -m simulators.srm --port 8081 --latency lognormal:20,0.8 --error-rate 0.01 --items 500
+    SRM_HOST=http://127.0.0.1:8081 python -m edge_cloud_management_api
+"""
+import argparse
+import hashlib
+import json
+import random
+import threading
+import uuid
+from simulators.faults import FaultProfile, add_arguments, profile_from_args
+from simulators.server import Routes, SimulatorServer, serve
+
+STATUSES = ("active", "inactive", "unknown")
+
+
+def _uuid(rng: random.Random) -> str:
+    return str(uuid.UUID(int=rng.getrandbits(128), version=4))
+
+
+def _etag(item: dict) -> str:
+    return '"' + hashlib.sha1(json.dumps(item, sort_keys=True).encode()).hexdigest()[:16] + '"'
+
+
+def app_manifest(i: int) -> dict:
+    """A CAMARA application manifest, as registered through POST /apps and translated for partner OPs."""
+    return {
+        "name": f"sim_app_{i}",
+        "appProvider": "simulated_provider",
+        "version": "1.0.0",
+        "packageType": "CONTAINER",
+        "operatingSystem": {"architecture": "x86_64", "family": "UBUNTU", "version": "OS_VERSION_UBUNTU_2204_LTS", "license": "OS_LICENSE_TYPE_FREE"},
+        "appRepo": {
+            "type": "PUBLICREPO",
+            "imagePath": f"https://registry.example.com/sim-app-{i}:1.0.0",
+            "userName": None,
+            "credentials": None,
+            "authType": "NONE",
+            "checksum": None,
+        },
+        "requiredResources": {"applicationResources": {"cpuPool": {"numCPU": 1, "memory": 1024}}, "isStandalone": False},
+        "componentSpec": [
+            {
+                "componentName": f"sim_app_{i}",
+                "networkInterfaces": [{"interfaceId": f"sim_app_{i}_http", "protocol": "TCP", "port": 8080, "visibilityType": "VISIBILITY_EXTERNAL"}],
+            }
+        ],
+    }
+
+
+class SRMState:
+    """
+    Nodes, service functions, deployed instances, QoD sessions and traffic influence resources of the
+    simulated SRM. Nodes and service functions are generated from the profile (`items`, `padding`, `seed`);
+    a service function is `{"appId": ..., "appManifest": {...}}`, like the ones the gateway reads.
+    """
+
+    def __init__(self, profile: FaultProfile):
+        rng = random.Random(profile.seed)
+        self.profile = profile
+        self.lock = threading.Lock()
+        self.nodes = {}
+        for i in range(profile.items):
+            node = profile.pad({
+                "edgeCloudZoneId": _uuid(rng),
+                "edgeCloudZoneName": f"sim-zone-{i}",
+                "edgeCloudZoneStatus": STATUSES[i % len(STATUSES)],
+                "edgeCloudProvider": "simulated-srm",
+                "edgeCloudRegion": f"region-{i % 5}",
+            })
+            self.nodes[node["edgeCloudZoneId"]] = node
+        self.service_functions = {}
+        for i in range(profile.items):
+            app = profile.pad({"appId": _uuid(rng), "appManifest": app_manifest(i)})
+            self.service_functions[app["appId"]] = app
+        self.deployed = {}
+        self.sessions = {}
+        self.traffic_influences = {}
+        self._rng = rng
+
+    def new_id(self) -> str:
+        with self.lock:
+            return _uuid(self._rng)
+
+
+def build_routes(state: SRMState) -> Routes:
+    routes = Routes()
+
+    def collection(store: dict):
+        return lambda request: (200, list(store.values()))
+
+    def item(store: dict, key: str):
+        def get(request):
+            found = store.get(request.params[key])
+            return (200, found) if found is not None else (404, {"detail": f"{request.params[key]} not found"})
+        return get
+
+    def delete(store: dict, key: str):
+        def remove(request):
+            with state.lock:
+                found = store.pop(request.params[key], None)
+            return (200, {"deleted": request.params[key]}) if found is not None else (404, {"detail": f"{request.params[key]} not found"})
+        return remove
+
+    def create(store: dict, id_field: str, **defaults):
+        def post(request):
+            body = request.json() or {}
+            created = {**defaults, **body}
+            created.setdefault(id_field, state.new_id())
+            with state.lock:
+                store[created[id_field]] = created
+            return 200, created
+        return post
+
+    def submit_service_function(request):
+        app = {"appId": state.new_id(), "appManifest": request.json() or {}}
+        with state.lock:
+            state.service_functions[app["appId"]] = app
+        return 200, app
+
+    def get_service_function(request):
+        app = state.service_functions.get(request.params["appId"])
+        if app is None:
+            return 404, {"detail": f"{request.params['appId']} not found"}
+        etag = _etag(app)
+        if request.headers.get("If-None-Match") == etag:
+            return 304, None, {"ETag": etag}
+        return 200, app, {"ETag": etag}
+
+    routes.add("POST", "/authentication", lambda request: (200, {"token": "simulated-srm-token"}))
+
+    routes.add("GET", "/serviceFunction", collection(state.service_functions))
+    routes.add("POST", "/serviceFunction", submit_service_function)
+    routes.add("GET", "/serviceFunction/{appId}", get_service_function)
+    routes.add("DELETE", "/serviceFunction/{appId}", delete(state.service_functions, "appId"))
+
+    routes.add("GET", "/deployedServiceFunction", collection(state.deployed))
+    routes.add("POST", "/deployedServiceFunction", create(state.deployed, "appInstanceId", status="instantiating"))
+    routes.add("DELETE", "/deployedServiceFunction/{appInstanceId}", delete(state.deployed, "appInstanceId"))
+
+    routes.add("GET", "/node", collection(state.nodes))
+    routes.add("GET", "/node/{zoneId}", item(state.nodes, "zoneId"))
+
+    routes.add("POST", "/sessions", create(state.sessions, "sessionId", qosStatus="AVAILABLE"))
+    routes.add("GET", "/sessions/{sessionId}", item(state.sessions, "sessionId"))
+    routes.add("DELETE", "/sessions/{sessionId}", delete(state.sessions, "sessionId"))
+
+    routes.add("POST", "/traffic-influences", create(state.traffic_influences, "trafficInfluenceID", state="ordered"))
+    routes.add("GET", "/traffic-influences", collection(state.traffic_influences))
+    routes.add("GET", "/traffic-influences/{trafficInfluenceID}", item(state.traffic_influences, "trafficInfluenceID"))
+    routes.add("DELETE", "/traffic-influences/{trafficInfluenceID}", delete(state.traffic_influences, "trafficInfluenceID"))
+    return routes
+
+
+def create_server(host: str, port: int, profile: FaultProfile) -> SimulatorServer:
+    return SimulatorServer((host, port), build_routes(SRMState(profile)), profile, name="srm")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    add_arguments(parser)
+    args = parser.parse_args(argv)
+    serve(create_server(args.host, args.port, profile_from_args(args)))
+
+
+if __name__ == "__main__":
+    main()
@@ -13,8 +13,8 @@ def test_app():
 
 
 @pytest.mark.component
-@patch("edge_cloud_management_api.controllers.app_controllers.PiEdgeAPIClientFactory")
-def test_delete_app(mock_factory_class, test_app: Flask):
+@patch("edge_cloud_management_api.controllers.app_controllers.get_pi_edge_client")
+def test_delete_app(mock_get_client, test_app: Flask):
     """Test delete_app returns dict"""
     app_id = "mock-app-id"
     mock_client = MagicMock()
@@ -23,7 +23,7 @@ def test_delete_app(mock_factory_class, test_app: Flask):
     mock_response.status_code = 200
     mock_client.delete_app.return_value = mock_response
 
-    mock_factory_class.return_value.create_pi_edge_api_client.return_value = mock_client
+    mock_get_client.return_value = mock_client
 
     with test_app.test_request_context():
         result = app_controllers.delete_app(app_id)
@@ -33,8 +33,8 @@ def test_delete_app(mock_factory_class, test_app: Flask):
 
 
 @pytest.mark.component
-@patch("edge_cloud_management_api.controllers.app_controllers.PiEdgeAPIClientFactory")
-def test_create_app_instance(mock_factory_class, test_app: Flask):
+@patch("edge_cloud_management_api.controllers.app_controllers.get_pi_edge_client")
+def test_create_app_instance(mock_get_client, test_app: Flask):
     """Test create_app_instance returns accepted response"""
     body = {
         "appId": "mock-app-id",
@@ -44,7 +44,7 @@ def test_create_app_instance(mock_factory_class, test_app: Flask):
 
     mock_client = MagicMock()
     mock_client.deploy_service_function.return_value = {"deploymentId": "xyz-123"}
-    mock_factory_class.return_value.create_pi_edge_api_client.return_value = mock_client
+    mock_get_client.return_value = mock_client
 
     with test_app.test_request_context(json=body):
         response, status_code = app_controllers.create_app_instance()
@@ -55,12 +55,12 @@ def test_create_app_instance(mock_factory_class, test_app: Flask):
 
 
 @pytest.mark.component
-@patch("edge_cloud_management_api.controllers.app_controllers.PiEdgeAPIClientFactory")
-def test_get_app_instance(mock_factory_class, test_app: Flask):
+@patch("edge_cloud_management_api.controllers.app_controllers.get_pi_edge_client")
+def test_get_app_instance(mock_get_client, test_app: Flask):
     """Test get_app_instance returns app instances"""
     mock_client = MagicMock()
     mock_client.get_app_instances.return_value = [{"appInstanceId": "abc123"}]
-    mock_factory_class.return_value.create_pi_edge_api_client.return_value = mock_client
+    mock_get_client.return_value = mock_client
 
     with test_app.test_request_context():
         response, status_code = app_controllers.get_app_instance()
@@ -73,8 +73,8 @@ def test_get_app_instance(mock_factory_class, test_app: Flask):
 
 
 @pytest.mark.component
-@patch("edge_cloud_management_api.controllers.app_controllers.PiEdgeAPIClientFactory")
-def test_delete_app_instance(mock_factory_class, test_app: Flask):
+@patch("edge_cloud_management_api.controllers.app_controllers.get_pi_edge_client")
+def test_delete_app_instance(mock_get_client, test_app: Flask):
     """Test delete_app_instance returns dict"""
     app_instance_id = "instance-123"
 
@@ -84,7 +84,7 @@ def test_delete_app_instance(mock_factory_class, test_app: Flask):
     mock_response.status_code = 200
     mock_client.delete_app_instance.return_value = mock_response
 
-    mock_factory_class.return_value.create_pi_edge_api_client.return_value = mock_client
+    mock_get_client.return_value = mock_client
 
     with test_app.test_request_context():
         result = app_controllers.delete_app_instance(app_instance_id)
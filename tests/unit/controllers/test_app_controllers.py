@@ -0,0 +1,28 @@
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+from edge_cloud_management_api.app import get_app_instance as create_app
+from edge_cloud_management_api.controllers import app_controllers
+from edge_cloud_management_api.controllers.aio import app_controllers as aio_app_controllers
+
+SRM_ERROR = {"error": "Failed to connect to the external API service. Service might be unavailable."}
+
+
+@pytest.mark.unit
+def test_get_app_instance_returns_srm_error():
+    """
+    An SRM failure is returned as reported by the client instead of being paginated.
+    """
+    client = MagicMock()
+    client.get_app_instances.return_value = SRM_ERROR
+    with create_app().app.test_request_context(), \
+         patch("edge_cloud_management_api.controllers.app_controllers.get_pi_edge_client", return_value=client):
+        assert app_controllers.get_app_instance(limit=10) == SRM_ERROR
+
+
+@pytest.mark.unit
+def test_async_get_app_instance_returns_srm_error():
+    client = MagicMock()
+    client.get_app_instances = AsyncMock(return_value=SRM_ERROR)
+    with patch("edge_cloud_management_api.controllers.aio.app_controllers.get_async_pi_edge_client", return_value=client):
+        assert asyncio.run(aio_app_controllers.get_app_instance(limit=10)) == SRM_ERROR
@@ -1,10 +1,14 @@
 import json
 import pathlib
+import time
 import pytest
+import requests
 from unittest.mock import MagicMock, patch
 from flask import Flask
 from edge_cloud_management_api.controllers.edge_cloud_controller import (
     get_edge_cloud_zones,
+    zone_catalog,
+    zone_snapshot,
 )
 from edge_cloud_management_api.app import get_app_instance
 
@@ -25,11 +29,13 @@ def mock_zones():
 
 @pytest.fixture
 def mock_get_all_cloud_zones(mock_zones):
+    zone_catalog.invalidate()
     with patch(
         "edge_cloud_management_api.controllers.edge_cloud_controller.get_all_cloud_zones",
         return_value=mock_zones,
     ) as mock_function:
         yield mock_function
+    zone_catalog.invalidate()
 
 
 @pytest.mark.unit
@@ -37,11 +43,11 @@ def mock_get_all_cloud_zones(mock_zones):
     "x_correlator, region, status, expected_response_status, expected_count",
     [
         (None, None, None, 200, 3),    # No filters applied (returns all)
-        (None, "Region2", None, 200, 3),  # Function does not filter, still returns all
-        (None, None, "inactive", 200, 3),
-        (None, None, "active", 200, 3),
-        (None, "Region1", "active", 200, 3),
-        (None, "Region3", None, 200, 3),
+        (None, "Region2", None, 200, 1),
+        (None, None, "inactive", 200, 2),
+        (None, None, "active", 200, 1),
+        (None, "Region1", "active", 200, 1),
+        (None, "Region3", None, 200, 0),  # Unknown region matches no zone
         (None, None, "invalid", 400, 0),  # This is the only test expecting validation error
     ],
 )
@@ -64,10 +70,94 @@ def test_get_edge_cloud_zones(
         if expected_response_status == 400:
             assert response.json["code"] == "VALIDATION_ERROR"
         elif expected_response_status == 200:
-            # Since the function does not filter, always expect all mock zones
             assert isinstance(response.json, list)
             assert len(response.json) == expected_count
             mock_get_all_cloud_zones.assert_called_once()
         else:
             # Defensive: should not get here
             assert False, "Unexpected response status"
+
+
+@pytest.mark.unit
+def test_get_edge_cloud_zones_served_from_catalog(mock_get_all_cloud_zones: MagicMock, test_app: Flask):
+    """
+    Repeated requests are served from the zone catalog without reloading the zones.
+    """
+    with test_app.test_request_context():
+        for _ in range(3):
+            response, response_status = get_edge_cloud_zones()
+            assert response_status == 200
+            assert len(response.json) == 3
+
+    mock_get_all_cloud_zones.assert_called_once()
+    assert zone_catalog.stats()["hits"] >= 2
+
+
+@pytest.mark.unit
+def test_unchanged_zones_are_not_validated_again(mock_get_all_cloud_zones: MagicMock, test_app: Flask):
+    """
+    Reloading an unchanged zone list reuses the validated snapshot and its JSON encoding.
+    """
+    zone_snapshot.clear()
+    with test_app.test_request_context():
+        first, _ = get_edge_cloud_zones()
+        zone_catalog.invalidate()
+        second, _ = get_edge_cloud_zones()
+
+    assert mock_get_all_cloud_zones.call_count == 2
+    assert zone_snapshot.reuses >= 1
+    assert second.get_data() == first.get_data() == zone_snapshot.current.json
+    assert second.mimetype == "application/json"
+
+
+@pytest.mark.unit
+def test_malformed_partner_zone_is_skipped(mock_zones, test_app: Flask):
+    """
+    A partner zone document that fails validation is left out instead of failing the whole listing.
+    """
+    partner_docs = [
+        {"_id": "partner-zone-1", "edgeCloudProvider": "Partner", "edgeCloudRegion": "Region9"},
+        {"_id": "partner-zone-2", "edgeCloudProvider": None},
+    ]
+    zone_catalog.invalidate()
+    zone_snapshot.clear()
+    with patch("edge_cloud_management_api.controllers.edge_cloud_controller.fetch_local_zones", return_value=mock_zones), \
+         patch("edge_cloud_management_api.controllers.edge_cloud_controller.get_partner_zone_docs", return_value=partner_docs):
+        with test_app.test_request_context():
+            response, response_status = get_edge_cloud_zones()
+
+    zone_catalog.invalidate()
+    assert response_status == 200
+    zone_ids = [zone["edgeCloudZoneId"] for zone in response.json]
+    assert len(zone_ids) == len(mock_zones) + 1
+    assert "partner-zone-1" in zone_ids and "partner-zone-2" not in zone_ids
+
+
+@pytest.mark.unit
+def test_srm_outage_keeps_serving_the_last_loaded_zones(mock_zones, test_app: Flask):
+    """
+    A failed reload does not replace the cached zones with an empty list: the last good zones are still served.
+    """
+    api_client = MagicMock()
+    api_client.list_nodes.side_effect = [mock_zones, requests.exceptions.ConnectionError("SRM unreachable")]
+    zone_catalog.invalidate()
+    zone_snapshot.clear()
+    with patch("edge_cloud_management_api.controllers.edge_cloud_controller.get_pi_edge_client", return_value=api_client), \
+         patch("edge_cloud_management_api.controllers.edge_cloud_controller.get_partner_zone_docs", return_value=[]):
+        with test_app.test_request_context():
+            first, _ = get_edge_cloud_zones()
+            load_errors = zone_catalog.load_errors
+            # Past the TTL but inside the stale window: served while a background reload runs (and fails)
+            zone_catalog._loaded_at = time.monotonic() - zone_catalog.ttl - 1
+            stale, stale_status = get_edge_cloud_zones()
+            deadline = time.monotonic() + 2
+            while zone_catalog.load_errors == load_errors and time.monotonic() < deadline:
+                time.sleep(0.01)
+            after, after_status = get_edge_cloud_zones()
+
+    zone_catalog.invalidate()
+    assert api_client.list_nodes.call_count == 2
+    assert zone_catalog.load_errors == load_errors + 1
+    assert stale_status == after_status == 200
+    assert len(after.json) == len(first.json) == len(mock_zones)
+    assert after.json == stale.json == first.json
@@ -1,7 +1,14 @@
+import asyncio
+import time
+import mongomock
 import pytest
+import requests
 from unittest.mock import patch, MagicMock
 from flask import Flask
 from edge_cloud_management_api.controllers import federation_manager_controller
+from edge_cloud_management_api.controllers.aio import federation_manager_controller as async_federation_manager_controller
+from edge_cloud_management_api.services import storage_service
+from edge_cloud_management_api.services.token_manager import CachedToken, TokenConfigurationError
 
 
 @pytest.fixture
@@ -12,9 +19,32 @@ def test_app():
         yield app
 
 
-@pytest.mark.component
-@patch("edge_cloud_management_api.controllers.federation_manager_controller.FederationManagerClientFactory")
-def test_create_federation(mock_factory_class, test_app: Flask):
+@pytest.fixture(autouse=True)
+def token_manager():
+    """Tokens come from a stub token manager instead of the token endpoint."""
+    manager = MagicMock()
+    manager.get.return_value = CachedToken("test-token", time.time() + 3600)
+    with patch("edge_cloud_management_api.controllers.federation_manager_controller.get_token_manager", return_value=manager), \
+            patch("edge_cloud_management_api.services.federation_tokens.get_token_manager", return_value=manager), \
+            patch("edge_cloud_management_api.controllers.aio.federation_manager_controller.get_token_manager", return_value=manager):
+        yield manager
+
+
+@pytest.fixture(autouse=True)
+def mongo_client():
+    client = mongomock.MongoClient()
+    with patch("edge_cloud_management_api.services.storage_service.get_mongo_client", return_value=client):
+        yield client
+
+
+@pytest.fixture
+def federation():
+    storage_service.insert_federation({"_id": "abc", "token": "stored-token", "tokenExpiresAt": time.time() + 3600})
+
+
+@pytest.mark.unit
+@patch("edge_cloud_management_api.controllers.federation_manager_controller.get_federation_client")
+def test_create_federation(mock_get_client, test_app: Flask):
     """Test create_federation returns federation data"""
     body = {
         "origOPFederationId": "orig-123",
@@ -23,59 +53,94 @@ def test_create_federation(mock_factory_class, test_app: Flask):
     }
 
     mock_client = MagicMock()
-    mock_client.post_partner.return_value = {"federationContextId": "abc", "partnerOPFederationId": "partner-xyz"}
-    mock_factory_class.return_value.create_federation_client.return_value = mock_client
+    mock_client.post_partner.return_value = (
+        {"federationContextId": "abc", "partnerOPFederationId": "partner-xyz", "offeredAvailabilityZones": [{"zoneId": "zone-1", "geographyDetails": "zone one"}]},
+        200,
+    )
+    mock_get_client.return_value = mock_client
 
     with test_app.test_request_context(json=body):
         response, status = federation_manager_controller.create_federation()
 
     assert status == 200
-    data = response.get_json()
-    assert "federationContextId" in data
-    assert data["federationContextId"] == "abc"
+    assert response["federationContextId"] == "abc"
+    mock_client.post_partner.assert_called_once_with(body, "test-token")
+    assert storage_service.get_fed("abc")["token"] == "test-token"
+    assert storage_service.get_zone("zone-1")["edgeCloudProvider"] == "partner-xyz"
 
 
-@pytest.mark.component
-@patch("edge_cloud_management_api.controllers.federation_manager_controller.FederationManagerClientFactory")
-def test_get_federation(mock_factory_class, test_app: Flask):
+@pytest.mark.unit
+@patch("edge_cloud_management_api.controllers.federation_manager_controller.get_federation_client")
+def test_get_federation(mock_get_client, test_app: Flask, federation):
     federation_context_id = "abc"
 
     mock_client = MagicMock()
-    mock_client.get_partner.return_value = {"some": "data"}
-    mock_factory_class.return_value.create_federation_client.return_value = mock_client
+    mock_client.get_partner.return_value = ({"some": "data"}, 200)
+    mock_get_client.return_value = mock_client
 
     with test_app.test_request_context():
         response, status = federation_manager_controller.get_federation(federation_context_id)
 
     assert status == 200
-    assert response.get_json() == {"some": "data"}
+    assert response == {"some": "data"}
+    mock_client.get_partner.assert_called_once_with(federation_context_id, "stored-token")
 
 
-@pytest.mark.component
-@patch("edge_cloud_management_api.controllers.federation_manager_controller.FederationManagerClientFactory")
-def test_delete_federation(mock_factory_class, test_app: Flask):
+@pytest.mark.unit
+@patch("edge_cloud_management_api.controllers.federation_manager_controller.get_federation_client")
+def test_delete_federation(mock_get_client, test_app: Flask, federation):
     federation_context_id = "abc"
 
     mock_client = MagicMock()
-    mock_client.delete_partner.return_value = {"result": "Deleted"}
-    mock_factory_class.return_value.create_federation_client.return_value = mock_client
+    mock_client.delete_partner.return_value = ({"result": "Deleted"}, 200)
+    mock_get_client.return_value = mock_client
 
     with test_app.test_request_context():
         response, status = federation_manager_controller.delete_federation(federation_context_id)
 
     assert status == 200
-    assert response.get_json() == {"result": "Deleted"}
+    assert response == {"result": "Deleted"}
 
 
-@pytest.mark.component
-@patch("edge_cloud_management_api.controllers.federation_manager_controller.FederationManagerClientFactory")
-def test_get_federation_context_ids(mock_factory_class, test_app: Flask):
+@pytest.mark.unit
+@patch("edge_cloud_management_api.controllers.federation_manager_controller.get_federation_client")
+def test_get_federation_context_ids(mock_get_client, test_app: Flask, federation):
     mock_client = MagicMock()
-    mock_client.get_federation_context_ids.return_value = {"FederationContextId": "ctx-123"}
-    mock_factory_class.return_value.create_federation_client.return_value = mock_client
+    mock_client.get_federation_context_ids.return_value = ({"FederationContextId": "ctx-123"}, 200)
+    mock_get_client.return_value = mock_client
 
     with test_app.test_request_context():
         response, status = federation_manager_controller.get_federation_context_ids()
 
     assert status == 200
-    assert response.get_json() == {"FederationContextId": "ctx-123"}
+    assert response == {"FederationContextId": "ctx-123"}
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("error, status", [
+    (TokenConfigurationError("TOKEN_CLIENT_SECRET must be set to request Federation Manager tokens"), 500),
+    (requests.exceptions.ConnectionError("token endpoint unreachable"), 503),
+])
+@patch("edge_cloud_management_api.controllers.federation_manager_controller.get_federation_client")
+def test_create_federation_reports_token_failures(mock_get_client, error, status, token_manager, test_app: Flask):
+    token_manager.get.side_effect = error
+
+    with test_app.test_request_context(json={"origOPFederationId": "orig-123"}):
+        response, code = federation_manager_controller.create_federation()
+
+    assert code == status
+    assert response["status"] == status
+    assert str(error) in response["message"]
+    mock_get_client.return_value.post_partner.assert_not_called()
+
+
+@pytest.mark.unit
+@patch("edge_cloud_management_api.controllers.aio.federation_manager_controller.get_async_federation_client")
+def test_async_create_federation_reports_token_failures(mock_get_client, token_manager):
+    token_manager.get.side_effect = TokenConfigurationError("TOKEN_CLIENT_ID must be set to request Federation Manager tokens")
+
+    response, code = asyncio.run(async_federation_manager_controller.create_federation({"origOPFederationId": "orig-123"}))
+
+    assert code == 500
+    assert response["code"] == "INTERNAL"
+    mock_get_client.return_value.post_partner.assert_not_called()
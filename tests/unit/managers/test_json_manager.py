@@ -0,0 +1,28 @@
+import datetime
+import uuid
+import pytest
+from decimal import Decimal
+from edge_cloud_management_api.managers.json_manager import GatewayJsonifier, dumps, loads
+
+
+@pytest.mark.unit
+def test_dumps_is_compact_and_encodes_connexion_types():
+    value = {
+        "b": [1, 2],
+        "a": datetime.datetime(2024, 5, 1, 12, 0, tzinfo=datetime.timezone.utc),
+        "id": uuid.UUID(int=1),
+        "price": Decimal("1.5"),
+    }
+
+    assert dumps(value) == (
+        '{"b":[1,2],"a":"2024-05-01T12:00:00+00:00","id":"00000000-0000-0000-0000-000000000001","price":1.5}'
+    )
+    assert loads(b'{"a": [1]}') == {"a": [1]}
+
+
+@pytest.mark.unit
+def test_jsonifier_returns_undecodable_bodies_as_text():
+    jsonifier = GatewayJsonifier()
+
+    assert jsonifier.dumps({"a": 1}) == '{"a":1}\n'
+    assert jsonifier.loads(b"not json") == "not json"
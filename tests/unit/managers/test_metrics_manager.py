@@ -0,0 +1,28 @@
+import pytest
+from edge_cloud_management_api.managers.metrics_manager import MetricsRegistry
+
+
+@pytest.mark.unit
+def test_histogram_renders_cumulative_buckets():
+    registry = MetricsRegistry()
+    latency = registry.histogram("latency_seconds", "Latency", ("operation",), buckets=(0.1, 1.0))
+    latency.observe(0.05, operation="get_app")
+    latency.observe(0.5, operation="get_app")
+    latency.observe(5, operation="get_app")
+
+    lines = registry.render().splitlines()
+
+    assert 'latency_seconds_bucket{operation="get_app",le="0.1"} 1' in lines
+    assert 'latency_seconds_bucket{operation="get_app",le="1"} 2' in lines
+    assert 'latency_seconds_bucket{operation="get_app",le="+Inf"} 3' in lines
+    assert 'latency_seconds_count{operation="get_app"} 3' in lines
+
+
+@pytest.mark.unit
+def test_collectors_refresh_gauges_on_render():
+    registry = MetricsRegistry()
+    state = registry.gauge("breaker_state", "State", ("upstream",))
+    registry.on_collect(lambda: state.set(2, upstream="srm"))
+    registry.on_collect(lambda: 1 / 0)
+
+    assert 'breaker_state{upstream="srm"} 2' in registry.render().splitlines()
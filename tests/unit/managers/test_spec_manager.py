@@ -0,0 +1,34 @@
+import pytest
+from edge_cloud_management_api.managers import spec_manager
+from edge_cloud_management_api.managers.spec_manager import load_specification
+
+
+@pytest.fixture
+def spec_file(tmp_path, monkeypatch):
+    monkeypatch.setattr(spec_manager.config, "SPEC_CACHE_DIR", str(tmp_path / "cache"))
+    path = tmp_path / "openapi.yaml"
+    path.write_text("openapi: 3.0.3\ninfo:\n  title: Gateway\n")
+    return path
+
+
+@pytest.mark.unit
+def test_specification_is_served_from_the_cache_until_it_changes(spec_file, monkeypatch):
+    assert load_specification(spec_file)["info"]["title"] == "Gateway"
+    assert len(list((spec_file.parent / "cache").iterdir())) == 1
+
+    parse = spec_manager.yaml.load
+    monkeypatch.setattr(spec_manager.yaml, "load", lambda *args, **kwargs: pytest.fail("cached specification was parsed again"))
+    assert load_specification(spec_file)["info"]["title"] == "Gateway"
+
+    monkeypatch.setattr(spec_manager.yaml, "load", parse)
+    spec_file.write_text("openapi: 3.0.3\ninfo:\n  title: Edited\n")
+    assert load_specification(spec_file)["info"]["title"] == "Edited"
+
+
+@pytest.mark.unit
+def test_corrupt_cache_falls_back_to_parsing(spec_file):
+    load_specification(spec_file)
+    (cache_file,) = (spec_file.parent / "cache").iterdir()
+    cache_file.write_bytes(b"not a pickle")
+
+    assert load_specification(spec_file)["info"]["title"] == "Gateway"
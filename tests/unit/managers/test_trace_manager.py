@@ -0,0 +1,76 @@
+import asyncio
+import pytest
+from unittest.mock import MagicMock
+from edge_cloud_management_api.managers import trace_manager
+from edge_cloud_management_api.managers.trace_manager import (
+    InMemoryExporter,
+    RequestTracingMiddleware,
+    Tracer,
+    parse_trace_headers,
+    with_trace_headers,
+)
+from edge_cloud_management_api.services.circuit_breaker import CircuitBreaker, RetryBudget, Upstream
+
+TRACE_ID = "4bf92f3577b34da6a3ce929d0e0e4736"
+PARENT_ID = "00f067aa0ba902b7"
+
+
+@pytest.fixture
+def exporter(monkeypatch):
+    exporter = InMemoryExporter()
+    monkeypatch.setattr(trace_manager, "tracer", Tracer(exporter))
+    monkeypatch.setattr("edge_cloud_management_api.services.circuit_breaker.tracer", trace_manager.tracer)
+    return exporter
+
+
+@pytest.mark.unit
+def test_parse_trace_headers():
+    context = parse_trace_headers({"traceparent": f"00-{TRACE_ID}-{PARENT_ID}-01", "x-correlator": "abc"})
+    assert (context.trace_id, context.span_id, context.correlator) == (TRACE_ID, PARENT_ID, "abc")
+
+    assert parse_trace_headers({"traceparent": "garbage"}) is None
+    assert parse_trace_headers({"x-correlator": "abc"}).correlator == "abc"
+
+
+@pytest.mark.unit
+def test_upstream_call_propagates_its_client_span(exporter):
+    upstream = Upstream("srm", CircuitBreaker("srm", 0.5, 10, 30, 15), RetryBudget(0.1, 3, 30), max_attempts=2)
+    sent = {}
+
+    def send():
+        sent.update(with_trace_headers({"timeout": 5})["headers"])
+        return MagicMock(status_code=200)
+
+    parent = parse_trace_headers({"traceparent": f"00-{TRACE_ID}-{PARENT_ID}-01", "x-correlator": "abc"})
+    with trace_manager.tracer.span("get_app", kind="server", parent=parent):
+        upstream.call(send, "GET", operation="get_app")
+
+    client, server = exporter.spans
+    assert client.name == "srm get_app"
+    assert client.parent_span_id == server.context.span_id
+    assert client.attributes["http.status_code"] == 200
+    assert server.parent_span_id == PARENT_ID
+    assert sent == {"traceparent": f"00-{TRACE_ID}-{client.context.span_id}-01", "x-correlator": "abc"}
+
+
+@pytest.mark.unit
+def test_middleware_continues_the_trace_and_echoes_the_correlator(exporter):
+    async def app(scope, receive, send):
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        await send({"type": "http.response.body", "body": b"{}"})
+
+    sent = []
+
+    async def send(message):
+        sent.append(message)
+
+    scope = {
+        "type": "http", "method": "GET", "path": "/apps",
+        "headers": [(b"traceparent", f"00-{TRACE_ID}-{PARENT_ID}-01".encode()), (b"x-correlator", b"abc")],
+    }
+    asyncio.run(RequestTracingMiddleware(app)(scope, None, send))
+
+    (span,) = exporter.spans
+    assert span.context.trace_id == TRACE_ID
+    assert span.to_dict()["kind"] == "SPAN_KIND_SERVER"
+    assert (b"x-correlator", b"abc") in sent[0]["headers"]
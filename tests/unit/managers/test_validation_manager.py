@@ -0,0 +1,63 @@
+import json
+import pytest
+from pydantic import BaseModel, ValidationError
+from edge_cloud_management_api.managers.validation_manager import ValidatedSnapshot, type_adapter
+
+
+class Item(BaseModel):
+    id: str
+    size: int
+
+
+@pytest.mark.unit
+def test_type_adapters_are_built_once_per_type():
+    assert type_adapter(list[Item]) is type_adapter(list[Item])
+
+
+@pytest.mark.unit
+def test_snapshot_validates_whole_list_and_encodes_json():
+    snapshot = ValidatedSnapshot(list[Item])
+
+    assert snapshot.update([{"id": "a", "size": "1", "extra": True}]) is True
+
+    assert snapshot.current.python == [{"id": "a", "size": 1}]
+    assert json.loads(snapshot.current.json) == [{"id": "a", "size": 1}]
+    assert snapshot.json_for(snapshot.current.python) == snapshot.current.json
+    assert snapshot.json_for([{"id": "a", "size": 1}]) is None
+
+
+@pytest.mark.unit
+def test_unchanged_list_is_not_validated_again():
+    snapshot = ValidatedSnapshot(list[Item])
+    raw = [{"id": "a", "size": 1}]
+    snapshot.update(raw)
+    first = snapshot.current
+
+    assert snapshot.update([{"id": "a", "size": 1}]) is False
+    assert snapshot.current is first
+
+    raw[0]["size"] = 2  # mutating the validated input is seen as a change
+    assert snapshot.update(raw) is True
+    assert snapshot.current.python == [{"id": "a", "size": 2}]
+    assert (snapshot.validations, snapshot.reuses) == (2, 1)
+
+
+@pytest.mark.unit
+def test_invalid_list_keeps_previous_snapshot():
+    snapshot = ValidatedSnapshot(list[Item])
+    snapshot.update([{"id": "a", "size": 1}])
+
+    with pytest.raises(ValidationError):
+        snapshot.update([{"id": "a", "size": "large"}])
+
+    assert snapshot.current.python == [{"id": "a", "size": 1}]
+
+
+@pytest.mark.unit
+def test_invalid_items_can_be_skipped():
+    snapshot = ValidatedSnapshot(list[Item], skip_invalid=True)
+
+    snapshot.update([{"id": "a", "size": 1}, {"id": "b", "size": None}, {"id": "c", "size": 3}])
+
+    assert snapshot.current.python == [{"id": "a", "size": 1}, {"id": "c", "size": 3}]
+    assert snapshot.skipped == 1
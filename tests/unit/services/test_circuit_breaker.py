@@ -0,0 +1,159 @@
+import asyncio
+import httpx
+import pytest
+import requests
+from unittest.mock import AsyncMock, MagicMock, patch
+from edge_cloud_management_api.services.circuit_breaker import (
+    CLOSED, HALF_OPEN, OPEN, CircuitBreaker, CircuitOpenError, RetryBudget, Upstream,
+)
+from edge_cloud_management_api.services.edge_cloud_services import PiEdgeAPIClient
+
+
+def make_upstream(open_seconds=60, min_retries=1, max_attempts=2, minimum_calls=4):
+    breaker = CircuitBreaker("srm", failure_rate_threshold=0.5, minimum_calls=minimum_calls, window=60, open_seconds=open_seconds)
+    return Upstream("srm", breaker, RetryBudget(ratio=0.0, min_retries=min_retries, window=60), max_attempts=max_attempts)
+
+
+def refuse():
+    raise requests.exceptions.ConnectionError("connection refused")
+
+
+@pytest.mark.unit
+def test_breaker_opens_on_failure_rate_and_fails_fast():
+    upstream = make_upstream(min_retries=0)
+    for _ in range(4):
+        with pytest.raises(requests.exceptions.ConnectionError):
+            upstream.call(refuse)
+
+    send = MagicMock()
+    with pytest.raises(CircuitOpenError):
+        upstream.call(send)
+
+    send.assert_not_called()
+    assert upstream.stats()["state"] == OPEN
+
+
+@pytest.mark.unit
+def test_half_open_probe_closes_the_circuit():
+    upstream = make_upstream(open_seconds=0, min_retries=0)
+    for _ in range(4):
+        with pytest.raises(requests.exceptions.ConnectionError):
+            upstream.call(refuse)
+
+    assert upstream.breaker.allow() is True
+    assert upstream.breaker.state == HALF_OPEN
+    assert upstream.breaker.allow() is False
+    upstream.breaker.record(True)
+    assert upstream.breaker.state == CLOSED
+
+
+@pytest.mark.unit
+def test_failed_half_open_probe_raises_the_upstream_error():
+    upstream = make_upstream(open_seconds=0, min_retries=5)
+    upstream.breaker._set_state(OPEN)
+    send = MagicMock(side_effect=refuse)
+
+    with pytest.raises(requests.exceptions.ConnectionError) as raised:
+        upstream.call(send)
+
+    assert not isinstance(raised.value, CircuitOpenError)
+    assert send.call_count == 1
+    assert upstream.breaker.state == OPEN
+
+
+@pytest.mark.unit
+def test_failed_async_half_open_probe_raises_the_upstream_error():
+    upstream = make_upstream(open_seconds=0, min_retries=5)
+    upstream.breaker._set_state(OPEN)
+    send = AsyncMock(side_effect=httpx.ConnectError("connection refused"))
+
+    with pytest.raises(httpx.ConnectError):
+        asyncio.run(upstream.acall(send))
+
+    assert send.await_count == 1
+
+
+@pytest.mark.unit
+def test_retry_rejected_by_the_circuit_raises_the_original_error():
+    upstream = make_upstream(min_retries=5)
+
+    withdraw = upstream.budget.withdraw
+
+    def withdraw_while_another_call_opens_the_circuit():
+        upstream.breaker._set_state(OPEN)
+        return withdraw()
+
+    upstream.budget.withdraw = withdraw_while_another_call_opens_the_circuit
+    with pytest.raises(requests.exceptions.ConnectionError) as raised:
+        upstream.call(refuse)
+
+    assert not isinstance(raised.value, CircuitOpenError)
+    assert upstream.breaker.rejected == 1
+
+
+@pytest.mark.unit
+def test_retries_are_limited_by_budget_and_idempotency():
+    upstream = make_upstream(min_retries=1, minimum_calls=10)
+    send = MagicMock(side_effect=[MagicMock(status_code=503), MagicMock(status_code=200)])
+    assert upstream.call(send, "GET").status_code == 200
+
+    post = MagicMock(return_value=MagicMock(status_code=503))
+    assert upstream.call(post, "POST").status_code == 503
+    assert post.call_count == 1
+
+    get = MagicMock(return_value=MagicMock(status_code=503))
+    upstream.call(get, "GET")
+    assert get.call_count == 1
+    assert upstream.stats()["retry_budget_exhausted"] == 1
+
+
+@pytest.mark.unit
+def test_srm_client_maps_an_open_circuit_to_a_connection_error():
+    upstream = make_upstream()
+    upstream.breaker._set_state(OPEN)
+    session = MagicMock()
+    client = PiEdgeAPIClient("http://srm", "user", "password", session=session, upstream=upstream)
+
+    result = client.get_app_instances()
+
+    assert "error" in result
+    session.request.assert_not_called()
+
+
+@pytest.mark.unit
+def test_retries_wait_a_capped_jittered_backoff():
+    upstream = make_upstream(min_retries=5, max_attempts=4, minimum_calls=10)
+    upstream.backoff_base, upstream.backoff_max = 0.1, 0.15
+    send = MagicMock(side_effect=[MagicMock(status_code=503), MagicMock(status_code=503), MagicMock(status_code=503), MagicMock(status_code=200)])
+
+    with patch("edge_cloud_management_api.services.circuit_breaker.time.sleep") as sleep:
+        assert upstream.call(send).status_code == 200
+
+    delays = [call.args[0] for call in sleep.call_args_list]
+    assert len(delays) == 3
+    assert 0 <= delays[0] <= 0.1
+    assert all(0 <= delay <= 0.15 for delay in delays[1:])
+
+
+@pytest.mark.unit
+def test_async_retries_wait_before_the_next_attempt():
+    upstream = make_upstream(min_retries=5, minimum_calls=10)
+    upstream.backoff_base, upstream.backoff_max = 0.05, 1
+    send = AsyncMock(side_effect=[httpx.ConnectError("connection refused"), MagicMock(status_code=200)])
+
+    with patch("edge_cloud_management_api.services.circuit_breaker.asyncio.sleep", new_callable=AsyncMock) as sleep:
+        assert asyncio.run(upstream.acall(send)).status_code == 200
+
+    sleep.assert_awaited_once()
+    assert 0 <= sleep.await_args.args[0] <= 0.05
+
+
+@pytest.mark.unit
+def test_calls_that_are_not_retried_do_not_wait():
+    upstream = make_upstream(min_retries=5)
+    upstream.backoff_base, upstream.backoff_max = 1, 1
+
+    with patch("edge_cloud_management_api.services.circuit_breaker.time.sleep") as sleep:
+        assert upstream.call(MagicMock(return_value=MagicMock(status_code=503)), "POST").status_code == 503
+
+    sleep.assert_not_called()
@@ -0,0 +1,53 @@
+import pytest
+from unittest.mock import MagicMock, patch
+from edge_cloud_management_api.services.client_registry import ClientRegistry, _build_token_manager
+
+
+@pytest.fixture
+def registry():
+    return ClientRegistry()
+
+
+@pytest.mark.unit
+def test_get_builds_client_once(registry: ClientRegistry):
+    builder = MagicMock(side_effect=lambda: object())
+    registry.register("srm", builder)
+
+    first = registry.get("srm")
+    second = registry.get("srm")
+
+    assert first is second
+    builder.assert_called_once()
+
+
+@pytest.mark.unit
+def test_warm_up_builds_all_clients(registry: ClientRegistry):
+    srm_builder = MagicMock(return_value="srm-client")
+    fm_builder = MagicMock(return_value="fm-client")
+    registry.register("srm", srm_builder)
+    registry.register("federation_manager", fm_builder)
+
+    registry.warm_up()
+
+    srm_builder.assert_called_once()
+    fm_builder.assert_called_once()
+
+
+@pytest.mark.unit
+def test_close_releases_clients_and_rebuilds_on_next_use(registry: ClientRegistry):
+    closer = MagicMock()
+    registry.register("srm", MagicMock(side_effect=lambda: object()), closer)
+    first = registry.get("srm")
+
+    registry.close()
+
+    closer.assert_called_once_with(first)
+    assert registry.get("srm") is not first
+
+
+@pytest.mark.unit
+def test_token_manager_requires_client_credentials():
+    with patch("edge_cloud_management_api.services.client_registry.config.TOKEN_CLIENT_ID", "originating-op"), \
+            patch("edge_cloud_management_api.services.client_registry.config.TOKEN_CLIENT_SECRET", ""):
+        with pytest.raises(ValueError, match="TOKEN_CLIENT_SECRET must be set"):
+            _build_token_manager()
@@ -0,0 +1,61 @@
+import time
+import pytest
+from unittest.mock import MagicMock, patch
+from edge_cloud_management_api.services.fanout import fan_out
+from edge_cloud_management_api.services.federation_services import FederationManagerClientFactory
+
+
+def slow(value, delay):
+    def call():
+        time.sleep(delay)
+        return value
+    return call
+
+
+def failing():
+    raise RuntimeError("boom")
+
+
+@pytest.mark.unit
+def test_fan_out_runs_calls_concurrently():
+    started = time.monotonic()
+    results = fan_out({key: slow(key, 0.2) for key in "abcd"}, max_workers=4)
+
+    assert time.monotonic() - started < 0.6
+    assert {key: result.value for key, result in results.items()} == {key: key for key in "abcd"}
+
+
+@pytest.mark.unit
+def test_fan_out_reports_errors_and_deadline_timeouts():
+    results = fan_out({"ok": slow("ok", 0), "error": failing, "slow": slow("late", 1)}, max_workers=3, deadline=0.3)
+
+    assert results["ok"].status == "ok"
+    assert results["error"].status == "error"
+    assert results["error"].error == "boom"
+    assert results["slow"].status == "timeout"
+
+
+@pytest.mark.unit
+def test_partner_onboarding_is_fanned_out_per_partner():
+    zones = [
+        {"edgeCloudZoneId": "z1", "edgeCloudProvider": "partner-a", "fedContextId": "fed-a"},
+        {"edgeCloudZoneId": "z2", "edgeCloudProvider": "partner-a", "fedContextId": "fed-a"},
+        {"edgeCloudZoneId": "z3", "edgeCloudProvider": "partner-b", "fedContextId": "fed-b"},
+    ]
+    federation_client = MagicMock()
+    federation_client.onboard_application.side_effect = lambda fed_id, body, token, timeout: (
+        {"error": "rejected"} if fed_id == "fed-b" else {"status": "accepted"}
+    )
+    srm_client = MagicMock()
+    srm_client.get_app.return_value = {"appManifest": {"name": "app"}}
+    factory = FederationManagerClientFactory()
+
+    with patch.object(factory, "create_federation_client", return_value=federation_client), patch(
+        "edge_cloud_management_api.services.client_registry.get_pi_edge_client", return_value=srm_client
+    ):
+        response, code = factory.onboard_application_to_partners("app-1", zones, token="token")
+
+    assert code == 202
+    assert federation_client.onboard_application.call_count == 2
+    statuses = {result["zoneId"]: result["status"] for result in response["onboardingResults"]}
+    assert statuses == {"z1": "accepted", "z2": "accepted", "z3": "error"}
@@ -0,0 +1,56 @@
+import json
+import pytest
+from unittest.mock import MagicMock
+from edge_cloud_management_api.services.gsma_translation import GSMATranslator, manifest_hash
+
+MANIFEST = {
+    "name": "nginx",
+    "appProvider": "provider-1",
+    "version": "1.0",
+    "packageType": "HELM",
+    "appRepo": {"type": "PUBLICREPO", "imagePath": "docker.io/nginx"},
+    "componentSpec": [{"componentName": "nginx", "networkInterfaces": [{"protocol": "TCP", "port": 80, "visibilityType": "VISIBILITY_EXTERNAL"}]}],
+}
+
+
+@pytest.mark.unit
+def test_payloads_are_memoized_by_manifest_content():
+    translator = GSMATranslator(max_entries=4)
+
+    first = translator.translate("app-1", MANIFEST)
+    second = translator.translate("app-1", json.loads(json.dumps(MANIFEST)))
+    changed = translator.translate("app-1", {**MANIFEST, "version": "2.0"})
+
+    assert second is first
+    assert changed is not first
+    assert translator.stats() == {"hits": 1, "misses": 2, "size": 2}
+    assert json.loads(first.artefact_body) == first.artefact
+    assert first.artefact["artefactDescriptorType"] == "HELM"
+    assert first.artefact["componentSpec"][0]["exposedInterfaces"][0]["commPort"] == 80
+    assert json.loads(first.onboarding_body)["appComponentSpecs"][0]["artefactId"] == "app-1"
+
+
+@pytest.mark.unit
+def test_manifest_hash_ignores_key_order():
+    assert manifest_hash({"a": 1, "b": {"c": 2}}) == manifest_hash({"b": {"c": 2}, "a": 1})
+
+
+@pytest.mark.unit
+def test_partner_steps_reuse_the_encoded_artefact(monkeypatch):
+    from edge_cloud_management_api.services import partner_deployment
+
+    translator = GSMATranslator(max_entries=4)
+    client = MagicMock()
+    client.create_artefact.return_value = MagicMock(status_code=200)
+    monkeypatch.setattr(partner_deployment, "gsma_translator", translator)
+    monkeypatch.setattr(partner_deployment, "get_federation_client", lambda: client)
+    monkeypatch.setattr(partner_deployment, "_token", lambda fed_context_id: "token")
+
+    for zone_id in ("zone-1", "zone-2"):
+        job = {"payload": {"appId": "app-1", "fedContextId": "fed-1", "zoneId": zone_id},
+               "state": {"_appManifest": MANIFEST, "_manifestHash": manifest_hash(MANIFEST)}}
+        partner_deployment.create_artefact(job)
+
+    bodies = [call.kwargs["artefact"] for call in client.create_artefact.call_args_list]
+    assert bodies[0] is bodies[1]
+    assert translator.stats()["misses"] == 1
@@ -0,0 +1,99 @@
+import time
+import mongomock
+import pytest
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+from edge_cloud_management_api.managers.trace_manager import InMemoryExporter, Tracer
+from edge_cloud_management_api.services import storage_service
+from edge_cloud_management_api.services.job_engine import JobEngine, JobStepError, job_status
+
+
+@pytest.fixture
+def mongo_client():
+    client = mongomock.MongoClient()
+    with patch("edge_cloud_management_api.services.storage_service.get_mongo_client", return_value=client):
+        yield client
+
+
+@pytest.fixture
+def engine():
+    engine = JobEngine(max_workers=2, lease_seconds=60)
+    yield engine
+    engine.stop()
+
+
+def wait_for_status(job_id, statuses=("succeeded", "failed"), timeout=2):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        job = storage_service.get_job(job_id)
+        if job["status"] in statuses:
+            return job
+        time.sleep(0.01)
+    raise AssertionError(f"job {job_id} did not finish")
+
+
+@pytest.mark.unit
+def test_job_runs_its_steps_and_checkpoints_state(mongo_client, engine):
+    engine.register("demo", [
+        ("first", lambda job: {"a": job["payload"]["value"]}),
+        ("second", lambda job: {"b": job["state"]["a"] + 1}),
+    ])
+
+    job = engine.submit("demo", {"value": 1})
+    done = wait_for_status(job["_id"])
+
+    assert done["status"] == "succeeded"
+    assert done["completedSteps"] == ["first", "second"]
+    assert job_status(done)["result"] == {"a": 1, "b": 2}
+
+
+@pytest.mark.unit
+def test_failed_step_fails_the_job(mongo_client, engine):
+    def reject(job):
+        raise JobStepError("partner rejected the artefact")
+
+    engine.register("demo", [("first", lambda job: {}), ("second", reject)])
+
+    done = wait_for_status(engine.submit("demo", {})["_id"])
+
+    assert done["status"] == "failed"
+    assert done["error"] == "partner rejected the artefact"
+    assert done["completedSteps"] == ["first"]
+
+
+@pytest.mark.unit
+def test_expired_job_resumes_after_its_last_checkpoint(mongo_client, engine):
+    calls = []
+    engine.register("demo", [
+        ("first", lambda job: calls.append("first") or {"a": 1}),
+        ("second", lambda job: calls.append("second") or {"b": job["state"]["a"]}),
+    ])
+    storage_service.insert_job({
+        "_id": "job-1", "kind": "demo", "status": "running", "payload": {},
+        "steps": ["first", "second"], "completedSteps": ["first"], "state": {"a": 1},
+        "owner": "crashed-worker", "leaseUntil": datetime.now(timezone.utc) - timedelta(seconds=1),
+    })
+
+    assert engine.resume() == ["job-1"]
+    done = wait_for_status("job-1")
+
+    assert calls == ["second"]
+    assert done["status"] == "succeeded"
+    assert done["state"] == {"a": 1, "b": 1}
+
+
+@pytest.mark.unit
+def test_job_records_step_timings_and_continues_the_submitting_trace(mongo_client, engine, monkeypatch):
+    exporter = InMemoryExporter()
+    monkeypatch.setattr("edge_cloud_management_api.services.job_engine.tracer", Tracer(exporter))
+    engine.register("demo", [("first", lambda job: {"a": 1})])
+
+    with Tracer().span("create_app_instance", kind="server") as request_span:
+        job = engine.submit("demo", {})
+    done = wait_for_status(job["_id"])
+
+    assert set(job_status(done)["stepTimings"]) == {"first"}
+    step, job_span = exporter.spans
+    assert job_span.context.trace_id == request_span.context.trace_id
+    assert job_span.parent_span_id == request_span.context.span_id
+    assert step.name == "step first"
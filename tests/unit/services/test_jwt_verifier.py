@@ -0,0 +1,106 @@
+import time
+import pytest
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+from jose import JWTError, jwk, jwt
+from edge_cloud_management_api.services.jwt_verifier import JWTVerifier
+
+ISSUER = "https://issuer.example"
+
+
+def rsa_key_pair():
+    private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    private_pem = private_key.private_bytes(
+        serialization.Encoding.PEM, serialization.PrivateFormat.PKCS8, serialization.NoEncryption()
+    ).decode()
+    public_pem = private_key.public_key().public_bytes(
+        serialization.Encoding.PEM, serialization.PublicFormat.SubjectPublicKeyInfo
+    ).decode()
+    return private_pem, public_pem
+
+
+@pytest.fixture(scope="module")
+def keys():
+    return rsa_key_pair(), rsa_key_pair()
+
+
+def make_token(private_pem, kid=None, exp_in=300):
+    claims = {"sub": "client", "iss": ISSUER, "exp": int(time.time()) + exp_in}
+    headers = {"kid": kid} if kid else None
+    return jwt.encode(claims, private_pem, algorithm="RS256", headers=headers)
+
+
+@pytest.mark.unit
+def test_verified_tokens_are_served_from_cache(keys):
+    (private_pem, public_pem), _ = keys
+    verifier = JWTVerifier(issuer=ISSUER, public_key=public_pem)
+    token = make_token(private_pem)
+
+    assert verifier.verify(token)["sub"] == "client"
+    assert verifier.verify(token)["sub"] == "client"
+    assert verifier.verifications == 1
+    assert verifier.hits == 1
+
+
+@pytest.mark.unit
+def test_invalid_tokens_are_rejected(keys):
+    (_, public_pem), (other_private_pem, _) = keys
+    verifier = JWTVerifier(issuer=ISSUER, public_key=public_pem)
+
+    with pytest.raises(JWTError):
+        verifier.verify(make_token(other_private_pem))
+    with pytest.raises(JWTError):
+        verifier.verify("not-a-token")
+
+
+@pytest.mark.unit
+def test_unknown_kid_reloads_the_key_set(keys):
+    (first_private, first_public), (second_private, second_public) = keys
+    key_sets = [
+        {"keys": [{**jwk.construct(first_public, "RS256").to_dict(), "kid": "k1"}]},
+        {"keys": [{**jwk.construct(second_public, "RS256").to_dict(), "kid": "k2"}]},
+    ]
+    verifier = JWTVerifier(issuer=ISSUER, jwks_loader=lambda: key_sets.pop(0), jwks_min_reload_interval=0)
+
+    assert verifier.verify(make_token(first_private, kid="k1"))["sub"] == "client"
+    assert verifier.verify(make_token(second_private, kid="k2"))["sub"] == "client"
+    with pytest.raises(JWTError):
+        verifier.verify(make_token(first_private, kid="k1", exp_in=600))
+
+
+@pytest.mark.unit
+def test_cache_is_bounded(keys):
+    (private_pem, public_pem), _ = keys
+    verifier = JWTVerifier(issuer=ISSUER, public_key=public_pem, cache_size=2)
+    tokens = [make_token(private_pem, exp_in=300 + i) for i in range(3)]
+    for token in tokens:
+        verifier.verify(token)
+
+    verifier.verify(tokens[0])
+    assert verifier.verifications == 4
+
+
+@pytest.mark.unit
+def test_cached_claims_cannot_be_modified_by_callers(keys):
+    (private_pem, public_pem), _ = keys
+    verifier = JWTVerifier(issuer=ISSUER, public_key=public_pem)
+    token = make_token(private_pem)
+
+    verifier.verify(token)["sub"] = "someone-else"
+    verifier.verify(token)["sub"] = "someone-else"
+
+    assert verifier.verify(token)["sub"] == "client"
+    assert verifier.hits == 2
+
+
+@pytest.mark.unit
+def test_unknown_kid_is_rejected_instead_of_falling_back_to_the_public_key(keys):
+    (private_pem, public_pem), (_, other_public) = keys
+    jwks = {"keys": [{**jwk.construct(other_public, "RS256").to_dict(), "kid": "k1"}]}
+    loads = []
+    verifier = JWTVerifier(issuer=ISSUER, public_key=public_pem, jwks_loader=lambda: loads.append(1) or jwks, jwks_min_reload_interval=0)
+
+    with pytest.raises(JWTError, match="Unknown signing key"):
+        verifier.verify(make_token(private_pem, kid="unknown"))
+    assert len(loads) == 2
+    assert verifier.verify(make_token(private_pem))["sub"] == "client"
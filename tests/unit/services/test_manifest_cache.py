@@ -0,0 +1,62 @@
+import pytest
+from unittest.mock import MagicMock
+from edge_cloud_management_api.services.edge_cloud_services import PiEdgeAPIClient
+from edge_cloud_management_api.services.manifest_cache import ManifestCache
+
+
+def srm_response(status_code=200, body=None, headers=None):
+    response = MagicMock(status_code=status_code, headers=headers or {})
+    response.json.return_value = body
+    return response
+
+
+@pytest.fixture
+def cache(monkeypatch):
+    cache = ManifestCache(max_entries=2, ttl=0)
+    monkeypatch.setattr("edge_cloud_management_api.services.edge_cloud_services.manifest_cache", cache)
+    return cache
+
+
+@pytest.mark.unit
+def test_get_app_revalidates_with_etag(cache):
+    session = MagicMock()
+    session.request.side_effect = [
+        srm_response(body={"appId": "app-1", "appManifest": {"name": "nginx"}}, headers={"ETag": '"v1"'}),
+        srm_response(status_code=304),
+    ]
+    client = PiEdgeAPIClient("http://srm", "user", "password", session=session)
+
+    first = client.get_app("app-1")
+    second = client.get_app("app-1")
+
+    assert second is first
+    assert session.request.call_args_list[1].kwargs["headers"]["If-None-Match"] == '"v1"'
+    assert cache.stats()["revalidations"] == 1
+
+
+@pytest.mark.unit
+def test_fresh_manifest_skips_srm_and_writes_invalidate(cache):
+    cache.ttl = 60
+    session = MagicMock()
+    session.request.return_value = srm_response(body={"appId": "app-1", "appManifest": {"name": "nginx"}})
+    client = PiEdgeAPIClient("http://srm", "user", "password", session=session)
+
+    client.get_app("app-1")
+    client.get_app("app-1")
+    assert session.request.call_count == 1
+
+    client.delete_app("app-1")
+    client.get_app("app-1")
+    assert session.request.call_count == 3
+
+
+@pytest.mark.unit
+def test_cache_is_bounded_lru():
+    cache = ManifestCache(max_entries=2, ttl=60)
+    cache.store("a", {"appId": "a"})
+    cache.store("b", {"appId": "b"})
+    cache.lookup("a")
+    cache.store("c", {"appId": "c"})
+
+    assert cache.lookup("b") == (None, False)
+    assert cache.lookup("a")[1] is True
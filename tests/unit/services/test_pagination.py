@@ -0,0 +1,40 @@
+import json
+import pytest
+from edge_cloud_management_api.services.pagination import (
+    InvalidCursorError,
+    decode_cursor,
+    iter_json_array,
+    iter_ndjson,
+    paginate,
+)
+
+
+@pytest.mark.unit
+def test_paginate_walks_all_pages_with_cursors():
+    items = list(range(7))
+    pages, cursor = [], None
+    while True:
+        page, cursor = paginate(items, limit=3, cursor=cursor)
+        pages.append(page)
+        if cursor is None:
+            break
+
+    assert pages == [[0, 1, 2], [3, 4, 5], [6]]
+    assert paginate(items) == (items, None)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("cursor", ["not-a-cursor", "e30", "eyJvZmZzZXQiOiAtMX0"])
+def test_invalid_cursor_is_rejected(cursor):
+    with pytest.raises(InvalidCursorError):
+        decode_cursor(cursor)
+
+
+@pytest.mark.unit
+def test_streamed_bodies_decode_to_the_items():
+    items = [{"appInstanceId": "a"}, {"appInstanceId": "b"}]
+
+    assert json.loads(b"".join(iter_json_array(items))) == items
+    assert json.loads(b"".join(iter_json_array(items, key="appInstanceInfo"))) == {"appInstanceInfo": items}
+    assert json.loads(b"".join(iter_json_array([]))) == []
+    assert [json.loads(line) for line in b"".join(iter_ndjson(items)).splitlines()] == items
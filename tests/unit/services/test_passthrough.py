@@ -0,0 +1,45 @@
+import asyncio
+import io
+import httpx
+import pytest
+import requests
+from flask import Flask
+from edge_cloud_management_api.services.passthrough import relay_async_response, relay_response
+
+BODY = b'[{"appId": "a1"}, {"appId": "a2"}]'
+
+
+@pytest.mark.unit
+def test_relay_response_streams_the_unread_upstream_body():
+    upstream = requests.Response()
+    upstream.status_code = 200
+    upstream.headers["Content-Type"] = "application/json"
+    upstream.raw = io.BytesIO(BODY)
+    closed = []
+    upstream.close = lambda: closed.append(True)
+
+    with Flask(__name__).test_request_context():
+        response = relay_response(upstream)
+        assert response.is_streamed
+        assert response.get_data() == BODY
+        response.close()
+
+    assert response.mimetype == "application/json"
+    assert closed == [True]
+
+
+@pytest.mark.unit
+def test_relay_async_response_closes_the_upstream_after_sending():
+    upstream = httpx.Response(200, headers={"Content-Type": "application/json"}, stream=httpx.ByteStream(BODY))
+    messages = []
+
+    async def send(message):
+        messages.append(message)
+
+    async def receive():
+        return {"type": "http.disconnect"}
+
+    asyncio.run(relay_async_response(upstream)({"type": "http", "asgi": {"spec_version": "2.4"}}, receive, send))
+
+    assert b"".join(m.get("body", b"") for m in messages if m["type"] == "http.response.body") == BODY
+    assert upstream.is_closed
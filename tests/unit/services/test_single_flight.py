@@ -0,0 +1,77 @@
+import asyncio
+import threading
+import time
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock
+from edge_cloud_management_api.services.edge_cloud_services import PiEdgeAPIClient
+from edge_cloud_management_api.services.single_flight import AsyncSingleFlight, SingleFlight
+
+
+@pytest.mark.unit
+def test_concurrent_identical_calls_share_one_call():
+    flights = SingleFlight()
+    started = threading.Event()
+    calls = []
+
+    def slow():
+        calls.append(1)
+        started.set()
+        time.sleep(0.1)
+        return "nodes"
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        leader = pool.submit(flights.do, "/node", slow)
+        started.wait()
+        followers = [pool.submit(flights.do, "/node", slow) for _ in range(7)]
+        results = [leader.result()] + [f.result() for f in followers]
+
+    assert results == ["nodes"] * 8
+    assert len(calls) == 1
+    assert flights.shared == 7
+    assert flights.do("/node", lambda: "again") == "again"
+
+
+@pytest.mark.unit
+def test_async_flight_shares_result_and_errors():
+    flights = AsyncSingleFlight()
+    calls = []
+
+    async def slow():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return {"appId": "app-1"}
+
+    async def failing():
+        await asyncio.sleep(0.05)
+        raise ConnectionError("SRM down")
+
+    async def main():
+        results = await asyncio.gather(*(flights.do("/serviceFunction", slow) for _ in range(5)))
+        errors = await asyncio.gather(*(flights.do("/node", failing) for _ in range(3)), return_exceptions=True)
+        return results, errors
+
+    results, errors = asyncio.run(main())
+
+    assert len(calls) == 1 and all(result is results[0] for result in results)
+    assert all(isinstance(error, ConnectionError) for error in errors)
+
+
+@pytest.mark.unit
+def test_srm_client_coalesces_identical_gets():
+    session = MagicMock()
+
+    def request(method, url, **kwargs):
+        time.sleep(0.1)
+        response = MagicMock(status_code=200)
+        response.json.return_value = [{"name": "app"}]
+        return response
+
+    session.request.side_effect = request
+    client = PiEdgeAPIClient("http://srm", "user", "password", session=session)
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        results = list(pool.map(lambda _: client.get_service_functions_catalogue(), range(4)))
+
+    assert results == [[{"name": "app"}]] * 4
+    assert session.request.call_count == 1
@@ -0,0 +1,60 @@
+import mongomock
+from datetime import datetime, timedelta, timezone
+import pytest
+from unittest.mock import patch
+from edge_cloud_management_api.services import storage_service
+
+
+@pytest.fixture
+def mongo_client():
+    client = mongomock.MongoClient()
+    with patch("edge_cloud_management_api.services.storage_service.get_mongo_client", return_value=client):
+        yield client
+
+
+@pytest.mark.unit
+def test_storage_functions_share_one_client(mongo_client):
+    storage_service.insert_zones([{"_id": "zone-1", "isLocal": "true"}, {"_id": "zone-2", "isLocal": "false"}])
+    storage_service.insert_federation({"_id": "fed-1", "token": "abc"})
+
+    assert storage_service.get_zone("zone-1")["isLocal"] == "true"
+    assert storage_service.get_fed("fed-1")["token"] == "abc"
+
+    storage_service.delete_partner_zones()
+    storage_service.delete_fed("fed-1")
+
+    assert storage_service.get_zone("zone-2") is None
+    assert storage_service.get_all_feds() == []
+    assert mongo_client["oeg_storage"]["zones"].count_documents({}) == 1
+
+
+@pytest.mark.unit
+def test_upsert_and_delete_zones_in_bulk(mongo_client):
+    storage_service.upsert_zones([{"_id": f"zone-{i}", "isLocal": "false", "fedContextId": "fed-1"} for i in range(200)])
+    storage_service.upsert_zones([{"_id": "zone-0", "isLocal": "false", "fedContextId": "fed-2"}])
+
+    assert len(storage_service.get_partner_zone_docs("fed-1")) == 199
+    assert storage_service.get_zone("zone-0")["fedContextId"] == "fed-2"
+
+    storage_service.delete_zones(["zone-0", "zone-1"])
+
+    assert mongo_client["oeg_storage"]["zones"].count_documents({}) == 198
+
+
+@pytest.mark.unit
+def test_get_latest_fed_returns_newest_federation(mongo_client):
+    created_at = datetime.now(timezone.utc)
+    storage_service.insert_federation({"_id": "fed-2", "token": "b", "createdAt": created_at})
+    storage_service.insert_federation({"_id": "fed-1", "token": "a", "createdAt": created_at - timedelta(minutes=1)})
+
+    assert storage_service.get_latest_fed()["_id"] == "fed-2"
+    assert [fed["_id"] for fed in storage_service.get_all_feds()] == ["fed-1", "fed-2"]
+
+
+@pytest.mark.unit
+def test_create_indexes_declares_schema(mongo_client):
+    storage_service.create_indexes().join(5)
+
+    zone_indexes = mongo_client["oeg_storage"]["zones"].index_information()
+    assert {"isLocal", "fedContextId", "edgeCloudProvider", "edgeCloudRegion"} <= set(zone_indexes)
+    assert "createdAt" in mongo_client["oeg_storage"]["federations"].index_information()
@@ -0,0 +1,77 @@
+import threading
+import time
+import pytest
+from unittest.mock import MagicMock
+from edge_cloud_management_api.services.token_manager import OAuth2TokenManager, TokenRequestError
+
+
+def token_session(*payloads, delay=0.0):
+    session = MagicMock()
+    responses = []
+    for payload in payloads:
+        response = MagicMock(status_code=200)
+        response.json.return_value = payload
+        responses.append(response)
+
+    def post(*args, **kwargs):
+        time.sleep(delay)
+        return responses.pop(0)
+
+    session.post.side_effect = post
+    return session
+
+
+def manager_for(session, refresh_margin=30):
+    return OAuth2TokenManager("http://token", "client", "secret", session=session, default_scope="fed-mgmt", refresh_margin=refresh_margin)
+
+
+@pytest.mark.unit
+def test_token_is_cached_per_scope():
+    session = token_session({"access_token": "a", "expires_in": 3600}, {"access_token": "b", "expires_in": 3600})
+    manager = manager_for(session)
+
+    assert manager.get_token() == "a"
+    assert manager.get_token("fed-mgmt") == "a"
+    assert manager.get_token("other") == "b"
+
+    assert session.post.call_count == 2
+    assert session.post.call_args_list[0].kwargs["data"] == {"grant_type": "client_credentials", "scope": "fed-mgmt"}
+    assert session.post.call_args_list[0].kwargs["auth"] == ("client", "secret")
+
+
+@pytest.mark.unit
+def test_token_inside_refresh_margin_is_served_while_refreshing():
+    session = token_session({"access_token": "old", "expires_in": 20}, {"access_token": "new", "expires_in": 3600})
+    manager = manager_for(session, refresh_margin=30)
+    manager.get_token()
+
+    assert manager.get_token() == "old"
+
+    deadline = time.monotonic() + 2
+    while manager.fetches < 2 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert manager.get_token() == "new"
+
+
+@pytest.mark.unit
+def test_concurrent_callers_share_one_token_request():
+    session = token_session({"access_token": "a", "expires_in": 3600}, delay=0.1)
+    manager = manager_for(session)
+    tokens = []
+    threads = [threading.Thread(target=lambda: tokens.append(manager.get_token())) for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert tokens == ["a"] * 5
+    session.post.assert_called_once()
+
+
+@pytest.mark.unit
+def test_missing_access_token_raises():
+    manager = manager_for(token_session({"error": "invalid_client"}))
+
+    with pytest.raises(TokenRequestError):
+        manager.get_token()
+    assert manager.get(block=False) is None
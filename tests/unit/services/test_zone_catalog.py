@@ -0,0 +1,57 @@
+import threading
+import time
+import pytest
+from unittest.mock import MagicMock
+from edge_cloud_management_api.services.zone_catalog import ZoneCatalog
+
+
+@pytest.mark.unit
+def test_fresh_zones_are_served_from_memory():
+    loader = MagicMock(return_value=[{"edgeCloudZoneId": "zone-1"}])
+    catalog = ZoneCatalog(loader=loader, ttl=60, stale_ttl=60)
+
+    assert catalog.get_zones() == [{"edgeCloudZoneId": "zone-1"}]
+    assert catalog.get_zones() == [{"edgeCloudZoneId": "zone-1"}]
+
+    loader.assert_called_once()
+    assert catalog.stats()["hits"] == 1
+    assert catalog.stats()["misses"] == 1
+
+
+@pytest.mark.unit
+def test_stale_zones_are_served_while_refreshing_in_background():
+    loader = MagicMock(side_effect=[["old"], ["new"]])
+    catalog = ZoneCatalog(loader=loader, ttl=0, stale_ttl=60)
+    catalog.get_zones()
+
+    assert catalog.get_zones() == ["old"]
+
+    deadline = time.monotonic() + 2
+    while loader.call_count < 2 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert loader.call_count == 2
+    assert catalog.stats()["stale_hits"] >= 1
+
+
+@pytest.mark.unit
+def test_concurrent_misses_share_one_load():
+    def slow_loader():
+        time.sleep(0.1)
+        return ["zone"]
+
+    loader = MagicMock(side_effect=slow_loader)
+    catalog = ZoneCatalog(loader=loader, ttl=60, stale_ttl=0)
+    threads = [threading.Thread(target=catalog.get_zones) for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    loader.assert_called_once()
+
+
+@pytest.mark.unit
+def test_non_blocking_get_returns_none_when_empty():
+    catalog = ZoneCatalog(loader=MagicMock(return_value=[]), ttl=60, stale_ttl=60)
+
+    assert catalog.get_zones(block=False) is None
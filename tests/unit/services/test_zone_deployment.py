@@ -0,0 +1,63 @@
+import pytest
+from unittest.mock import MagicMock
+from edge_cloud_management_api.services import partner_deployment
+from edge_cloud_management_api.services.job_engine import JobStepError
+from edge_cloud_management_api.services.zone_deployment import local_results, plan_zones, requested_zone_ids
+
+
+def app_zone(zone_id):
+    return {"EdgeCloudZone": {"edgeCloudZoneId": zone_id}}
+
+
+@pytest.mark.unit
+def test_plan_splits_local_and_groups_partners_by_federation():
+    app_zones = [app_zone(z) for z in ("local-1", "fed-a-1", "local-2", "fed-b-1", "fed-a-2", "missing", "local-1")]
+    docs = [
+        {"_id": "local-1", "edgeCloudZoneId": "local-1", "isLocal": "true"},
+        {"_id": "local-2", "edgeCloudZoneId": "local-2", "isLocal": "true"},
+        {"_id": "fed-a-1", "edgeCloudZoneId": "fed-a-1", "isLocal": "false", "fedContextId": "a"},
+        {"_id": "fed-a-2", "edgeCloudZoneId": "fed-a-2", "isLocal": "false", "fedContextId": "a"},
+        {"_id": "fed-b-1", "edgeCloudZoneId": "fed-b-1", "isLocal": "false", "fedContextId": "b"},
+    ]
+
+    plan = plan_zones(app_zones, docs)
+
+    assert requested_zone_ids(app_zones) == ["local-1", "fed-a-1", "local-2", "fed-b-1", "fed-a-2", "missing"]
+    assert plan.local == [app_zone("local-1"), app_zone("local-2")]
+    assert {fed: [z["_id"] for z in zones] for fed, zones in plan.partners.items()} == {"a": ["fed-a-1", "fed-a-2"], "b": ["fed-b-1"]}
+    assert plan.unknown == ["missing"]
+    assert [r["status"] for r in local_results(plan, {"error": "SRM unreachable"})] == ["failed", "failed"]
+
+
+@pytest.fixture
+def federation_client(monkeypatch):
+    client = MagicMock()
+    monkeypatch.setattr(partner_deployment, "get_federation_client", lambda: client)
+    monkeypatch.setattr(partner_deployment, "_token", lambda fed_context_id: "token")
+    return client
+
+
+def deployment_job(zone_ids):
+    manifest = {"name": "nginx", "version": "1.0", "appProvider": "provider-1"}
+    return {"payload": {"appId": "app-1", "fedContextId": "a", "zoneIds": zone_ids}, "state": {"_appManifest": manifest}}
+
+
+@pytest.mark.unit
+def test_group_job_reports_each_zone(federation_client):
+    def deploy(federation_context_id, body, token):
+        return MagicMock(status_code=500 if b"zone-2" in body else 202, content=b"", text="boom")
+
+    federation_client.deploy_app_partner.side_effect = deploy
+
+    result = partner_deployment.deploy_application(deployment_job(["zone-1", "zone-2"]))
+
+    assert result["deployments"]["zone-1"]["status"] == "deployed"
+    assert result["deployments"]["zone-2"]["status"] == "failed"
+
+
+@pytest.mark.unit
+def test_group_job_fails_when_no_zone_deploys(federation_client):
+    federation_client.deploy_app_partner.return_value = {"error": "Connection error", "status_code": 500}
+
+    with pytest.raises(JobStepError):
+        partner_deployment.deploy_application(deployment_job(["zone-1", "zone-2"]))
@@ -0,0 +1,45 @@
+import pytest
+from edge_cloud_management_api.services.zone_index import ZoneIndex
+
+
+def zone(zone_id, region="Region1", status="active", provider="Provider1"):
+    return {
+        "edgeCloudZoneId": zone_id,
+        "edgeCloudZoneName": zone_id,
+        "edgeCloudZoneStatus": status,
+        "edgeCloudProvider": provider,
+        "edgeCloudRegion": region,
+    }
+
+
+@pytest.mark.unit
+def test_query_intersects_filters_in_zone_list_order():
+    index = ZoneIndex()
+    index.update(
+        [zone("z1"), zone("z2", status="inactive"), zone("z3", region="Region2"), zone("z4")],
+        local_zone_ids={"z1", "z2", "z3"},
+    )
+
+    assert [z["edgeCloudZoneId"] for z in index.query(region="Region1")] == ["z1", "z2", "z4"]
+    assert [z["edgeCloudZoneId"] for z in index.query(region="Region1", status="active")] == ["z1", "z4"]
+    assert [z["edgeCloudZoneId"] for z in index.query(local=False)] == ["z4"]
+    assert index.query(region="Region3") == []
+    assert len(index.query()) == 4
+
+
+@pytest.mark.unit
+def test_update_only_reindexes_changed_zones():
+    index = ZoneIndex()
+    index.update([zone("z1"), zone("z2")])
+
+    changes = index.update([zone("z1"), zone("z2", status="inactive"), zone("z3")])
+    assert changes == {"added": 1, "changed": 1, "removed": 0}
+    assert [z["edgeCloudZoneId"] for z in index.query(status="inactive")] == ["z2"]
+
+    version = index.version
+    assert index.update([zone("z1"), zone("z2", status="inactive"), zone("z3")]) == {"added": 0, "changed": 0, "removed": 0}
+    assert index.version == version
+
+    assert index.update([zone("z3")]) == {"added": 0, "changed": 0, "removed": 2}
+    assert index.query(region="Region1", status="active") == [zone("z3")]
+    assert index.query(status="inactive") == []
@@ -0,0 +1,93 @@
+import mongomock
+import pytest
+import requests
+from unittest.mock import MagicMock, patch
+from edge_cloud_management_api.services.circuit_breaker import CircuitBreaker, RetryBudget, Upstream
+from edge_cloud_management_api.services.edge_cloud_services import PiEdgeAPIClient
+from edge_cloud_management_api.services.zone_reconciler import ZoneReconciler, _fetch_srm_nodes
+
+
+def node(zone_id: str, status: str = "active") -> dict:
+    return {
+        "edgeCloudZoneId": zone_id,
+        "edgeCloudZoneName": zone_id,
+        "edgeCloudZoneStatus": status,
+        "edgeCloudProvider": "Provider1",
+        "edgeCloudRegion": "Region1",
+    }
+
+
+@pytest.fixture
+def zones_collection():
+    client = mongomock.MongoClient()
+    with patch("edge_cloud_management_api.services.storage_service.get_mongo_client", return_value=client):
+        yield client["oeg_storage"]["zones"]
+
+
+@pytest.mark.unit
+def test_reconcile_applies_only_changes(zones_collection):
+    zones_collection.insert_many([
+        {**node("zone-1"), "_id": "zone-1", "isLocal": "true"},
+        {**node("zone-2"), "_id": "zone-2", "isLocal": "true"},
+        {"_id": "partner-zone", "isLocal": "false"},
+    ])
+    fetch_nodes = MagicMock(return_value=[node("zone-1"), node("zone-2", status="inactive"), node("zone-3")])
+    reconciler = ZoneReconciler(fetch_nodes=fetch_nodes, interval=60)
+
+    assert reconciler.reconcile_once() == {"inserted": 1, "updated": 1, "deleted": 0}
+    assert reconciler.version == 1
+    assert zones_collection.find_one({"_id": "zone-2"})["edgeCloudZoneStatus"] == "inactive"
+    assert zones_collection.find_one({"_id": "zone-3"})["isLocal"] == "true"
+
+    assert reconciler.reconcile_once() == {"inserted": 0, "updated": 0, "deleted": 0}
+    assert reconciler.version == 1
+
+
+@pytest.mark.unit
+def test_reconcile_removes_zones_gone_from_srm_but_keeps_partner_zones(zones_collection):
+    zones_collection.insert_many([
+        {**node("zone-1"), "_id": "zone-1", "isLocal": "true"},
+        {"_id": "partner-zone", "isLocal": "false"},
+    ])
+    reconciler = ZoneReconciler(fetch_nodes=MagicMock(return_value=[node("zone-2")]), interval=60)
+
+    assert reconciler.reconcile_once() == {"inserted": 1, "updated": 0, "deleted": 1}
+    assert zones_collection.find_one({"_id": "zone-1"}) is None
+    assert zones_collection.find_one({"_id": "partner-zone"}) is not None
+
+
+def srm_client(session) -> PiEdgeAPIClient:
+    breaker = CircuitBreaker("srm", failure_rate_threshold=0.5, minimum_calls=10, window=60, open_seconds=60)
+    return PiEdgeAPIClient("http://srm", "user", "password", session=session, upstream=Upstream("srm", breaker, RetryBudget(0.0, 0, 60), max_attempts=1))
+
+
+@pytest.mark.unit
+def test_empty_srm_node_list_removes_all_local_zones(zones_collection):
+    zones_collection.insert_many([
+        {**node("zone-1"), "_id": "zone-1", "isLocal": "true"},
+        {"_id": "partner-zone", "isLocal": "false"},
+    ])
+    session = MagicMock()
+    session.request.return_value = MagicMock(status_code=200, json=MagicMock(return_value=[]))
+    reconciler = ZoneReconciler(fetch_nodes=_fetch_srm_nodes, interval=60)
+
+    with patch("edge_cloud_management_api.services.zone_reconciler.get_pi_edge_client", return_value=srm_client(session)):
+        assert reconciler.reconcile_once() == {"inserted": 0, "updated": 0, "deleted": 1}
+
+    assert zones_collection.find_one({"_id": "zone-1"}) is None
+    assert zones_collection.find_one({"_id": "partner-zone"}) is not None
+
+
+@pytest.mark.unit
+def test_failed_srm_fetch_keeps_local_zones(zones_collection):
+    zones_collection.insert_one({**node("zone-1"), "_id": "zone-1", "isLocal": "true"})
+    session = MagicMock()
+    session.request.side_effect = requests.exceptions.ConnectionError("connection refused")
+    reconciler = ZoneReconciler(fetch_nodes=_fetch_srm_nodes, interval=60)
+
+    with patch("edge_cloud_management_api.services.zone_reconciler.get_pi_edge_client", return_value=srm_client(session)):
+        with pytest.raises(requests.exceptions.ConnectionError):
+            reconciler.reconcile_once()
+
+    assert zones_collection.find_one({"_id": "zone-1"}) is not None
+    assert reconciler.version == 0
@@ -0,0 +1,78 @@
+import inspect
+import pytest
+from unittest.mock import patch
+from a2wsgi import WSGIMiddleware
+from connexion import AsyncApp, FlaskApp
+from edge_cloud_management_api.app import AsyncControllerResolver, get_app_instance
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("mode, app_class", [("sync", FlaskApp), ("async", AsyncApp)])
+def test_get_app_instance_mode(mode, app_class):
+    assert isinstance(get_app_instance(mode), app_class)
+
+
+@pytest.mark.unit
+def test_get_app_instance_rejects_unknown_mode():
+    with pytest.raises(ValueError):
+        get_app_instance("threaded")
+
+
+@pytest.mark.unit
+def test_async_resolver_maps_to_coroutine_handlers():
+    resolver = AsyncControllerResolver()
+    handler = resolver.resolve_function_from_operation_id("edge_cloud_management_api.controllers.app_controllers.get_apps")
+
+    assert handler.__module__ == "edge_cloud_management_api.controllers.aio.app_controllers"
+    assert inspect.iscoroutinefunction(handler)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("mode", ["sync", "async"])
+def test_metrics_endpoint_reports_requests_per_operation(mode):
+    client = get_app_instance(mode).test_client()
+    with patch("edge_cloud_management_api.configs.env_config.config.PROXY_PASSTHROUGH", False), \
+            patch("edge_cloud_management_api.services.edge_cloud_services.PiEdgeAPIClient.get_service_functions_catalogue", return_value=[]), \
+            patch("edge_cloud_management_api.services.async_edge_cloud_services.AsyncPiEdgeAPIClient.get_service_functions_catalogue", return_value=[]):
+        client.get("/oeg/1.0.0/apps")
+
+    response = client.get("/metrics")
+
+    assert response.status_code == 200
+    assert 'oeg_http_requests_total{operation="app_controllers.get_apps",code="200"}' in response.text
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("mode", ["sync", "async"])
+def test_app_starts_without_network_calls(mode):
+    with patch("socket.socket.connect", side_effect=AssertionError("network call during startup")):
+        client = get_app_instance(mode).test_client()
+        response = client.get("/metrics")
+
+    assert response.status_code == 200
+
+
+@pytest.mark.unit
+def test_sync_handlers_run_on_a_thread_pool_of_server_threads():
+    # Guards the override of Connexion's private FlaskApp._middleware_app in size_wsgi_thread_pool
+    with patch("edge_cloud_management_api.app.config.SERVER_THREADS", 3):
+        app = get_app_instance("sync")
+
+    middleware = app._middleware_app.asgi_app
+    assert isinstance(middleware, WSGIMiddleware)
+    assert middleware.executor._max_workers == 3
+    assert middleware.app == app.app.wsgi_app
+
+
+@pytest.mark.unit
+def test_metrics_endpoint_reports_the_zone_cache():
+    client = get_app_instance("sync").test_client()
+    with patch("edge_cloud_management_api.controllers.edge_cloud_controller.get_all_cloud_zones", return_value=[]):
+        client.get("/oeg/1.0.0/edge-cloud-zones")
+
+    response = client.get("/metrics")
+
+    assert 'oeg_zone_cache_requests_total{result="miss"}' in response.text
+    assert 'oeg_zone_cache_loads_total{outcome="ok"}' in response.text
+    assert "oeg_zone_cache_zones " in response.text
+    assert "oeg_zone_cache_age_seconds " in response.text
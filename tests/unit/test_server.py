@@ -0,0 +1,35 @@
+import pytest
+from edge_cloud_management_api.managers import db_manager, http_manager
+from edge_cloud_management_api.server import gunicorn_options, reset_after_fork, uvicorn_options
+from edge_cloud_management_api.services.client_registry import registry
+from edge_cloud_management_api.services.job_engine import job_engine
+
+
+@pytest.mark.unit
+def test_reset_after_fork_drops_inherited_pools_and_worker_id():
+    session = http_manager.get_http_session()
+    client = db_manager.get_mongo_client()
+    registry.get("http_session")
+    worker_id = job_engine.worker_id
+
+    reset_after_fork()
+
+    assert http_manager.get_http_session() is not session
+    assert db_manager.get_mongo_client() is not client
+    assert "http_session" not in registry._instances
+    assert job_engine.worker_id != worker_id
+    client.close()
+    session.close()
+
+
+@pytest.mark.unit
+def test_server_options_follow_the_configuration(monkeypatch):
+    monkeypatch.setattr("edge_cloud_management_api.server.config.SERVER_WORKERS", 4)
+    monkeypatch.setattr("edge_cloud_management_api.server.config.SERVER_MAX_REQUESTS", 1000)
+
+    options = gunicorn_options()
+    assert options["workers"] == 4
+    assert options["preload_app"] is True
+    assert options["max_requests_jitter"] == 100
+    assert uvicorn_options()["workers"] == 4
+    assert uvicorn_options()["factory"] is True
@@ -0,0 +1,129 @@
+import random
+import time
+import mongomock
+import pytest
+import requests
+from unittest.mock import patch
+from edge_cloud_management_api.models.application_models import AppManifest
+from edge_cloud_management_api.services import storage_service
+from edge_cloud_management_api.services.edge_cloud_services import PiEdgeAPIClient
+from edge_cloud_management_api.services.federation_services import FederationManagerClient
+from edge_cloud_management_api.services.job_engine import job_engine, job_status
+from edge_cloud_management_api.services.partner_deployment import submit_partner_deployment
+from simulators import federation_manager, srm
+from simulators.faults import FaultProfile, LatencyDistribution
+from simulators.load import run
+
+
+@pytest.fixture
+def start():
+    servers = []
+
+    def start_server(module, **profile):
+        server = module.create_server("127.0.0.1", 0, FaultProfile(**profile))
+        server.start_in_background()
+        servers.append(server)
+        return server
+
+    yield start_server
+    for server in servers:
+        server.shutdown()
+        server.server_close()
+
+
+@pytest.mark.unit
+def test_latency_distributions_are_reproducible():
+    first = [LatencyDistribution("lognormal:20,0.8").sample(random.Random(1)) for _ in range(3)]
+    second = [LatencyDistribution("lognormal:20,0.8").sample(random.Random(1)) for _ in range(3)]
+
+    assert first == second
+    assert LatencyDistribution("fixed:20").sample(random.Random()) == 0.02
+    with pytest.raises(ValueError):
+        LatencyDistribution("uniform:5")
+
+
+@pytest.mark.unit
+def test_srm_simulator_serves_the_client_endpoints(start):
+    server = start(srm, items=3, padding=8, seed=1)
+
+    nodes = requests.get(f"{server.url}/node").json()
+    assert len(nodes) == 3 and nodes[0]["padding"] == "x" * 8
+    assert requests.get(f"{server.url}/node/{nodes[0]['edgeCloudZoneId']}").json() == nodes[0]
+
+    app = requests.get(f"{server.url}/serviceFunction").json()[0]
+    AppManifest.model_validate(app["appManifest"])
+    app_id = app["appId"]
+    response = requests.get(f"{server.url}/serviceFunction/{app_id}")
+    assert requests.get(f"{server.url}/serviceFunction/{app_id}", headers={"If-None-Match": response.headers["ETag"]}).status_code == 304
+
+    session = requests.post(f"{server.url}/sessions", json={"duration": 60}).json()
+    assert requests.get(f"{server.url}/sessions/{session['sessionId']}").json()["duration"] == 60
+    assert requests.delete(f"{server.url}/sessions/{session['sessionId']}").status_code == 200
+    assert requests.get(f"{server.url}/sessions/{session['sessionId']}").status_code == 404
+    assert requests.get(f"{server.url}/traffic-influences/").json() == []
+
+
+@pytest.mark.unit
+def test_federation_manager_simulator_creates_federations(start):
+    server = start(federation_manager, items=2, seed=1)
+
+    assert "access_token" in requests.post(f"{server.url}/token", data={"grant_type": "client_credentials"}).json()
+    federation = requests.post(f"{server.url}/partner", json={"origOPFederationId": "op"}).json()
+    assert len(federation["offeredAvailabilityZones"]) == 2
+    assert requests.get(f"{server.url}/fed-context-id").json() == {"federationContextId": federation["federationContextId"]}
+    assert requests.delete(f"{server.url}/{federation['federationContextId']}/partner").status_code == 200
+
+
+@pytest.mark.unit
+def test_faults_are_injected(start):
+    failing = start(srm, error_rate=1.0, error_status=502)
+    dripping = start(srm, items=20, padding=100, drip_bytes=256, drip_interval=0.01)
+
+    assert requests.get(f"{failing.url}/node").status_code == 502
+    assert requests.get(f"{failing.url}/_simulator/stats").json()["failures"] == 1
+
+    started = time.perf_counter()
+    assert len(requests.get(f"{dripping.url}/node").json()) == 20
+    assert time.perf_counter() - started >= 0.05
+
+
+@pytest.mark.unit
+def test_load_generator_reports_latency_percentiles(start):
+    server = start(srm, latency=LatencyDistribution("fixed:5"))
+
+    result = run(f"{server.url}/node", concurrency=4, total=20)
+
+    assert result["requests"] == 20
+    assert result["statuses"] == {200: 20}
+    assert 5 <= result["p50_ms"] <= result["p99_ms"] <= result["max_ms"]
+
+
+@pytest.mark.unit
+def test_partner_deployment_job_runs_against_the_simulators(start):
+    """
+    The partner deployment chain (manifest fetch, GSMA artefact, onboarding, deployment) completes
+    against the SRM and Federation Manager simulators.
+    """
+    srm_server = start(srm, items=2, seed=1)
+    fm_server = start(federation_manager, items=2, seed=1)
+    app_id = requests.get(f"{srm_server.url}/serviceFunction").json()[0]["appId"]
+    federation = requests.post(f"{fm_server.url}/partner", json={"origOPFederationId": "op"}).json()
+    fed_context_id = federation["federationContextId"]
+    zones = [{"edgeCloudZoneId": zone["zoneId"], "fedContextId": fed_context_id} for zone in federation["offeredAvailabilityZones"]]
+
+    with patch("edge_cloud_management_api.services.storage_service.get_mongo_client", return_value=mongomock.MongoClient()), \
+         patch("edge_cloud_management_api.services.partner_deployment.get_pi_edge_client", return_value=PiEdgeAPIClient(srm_server.url, "user", "password")), \
+         patch("edge_cloud_management_api.services.partner_deployment.get_federation_client", return_value=FederationManagerClient(fm_server.url)):
+        storage_service.insert_federation({"_id": fed_context_id, "token": "simulated", "tokenExpiresAt": time.time() + 3600})
+        job = submit_partner_deployment(app_id, zones)
+        deadline = time.monotonic() + 10
+        while time.monotonic() < deadline:
+            done = storage_service.get_job(job["_id"])
+            if done["status"] in ("succeeded", "failed"):
+                break
+            time.sleep(0.02)
+        job_engine.stop()
+
+    assert done["status"] == "succeeded", done["error"]
+    deployments = job_status(done)["result"]["deployments"]
+    assert {zone_id: deployment["status"] for zone_id, deployment in deployments.items()} == {zone["edgeCloudZoneId"]: "deployed" for zone in zones}